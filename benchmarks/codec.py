@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the cost of parsing list responses of 1 to 10 MB:
+
+- "previous": the body parsed with `response.json()` for the error check, twice
+  more for the error message when any, and again for the data (measured here on
+  a successful response, so 2 parses)
+- one decode per response with each available codec
+
+Run with: python -m benchmarks.codec
+"""
+
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+from typing import Callable, List
+
+from requests import Response
+
+from directus.utils.apiclient import BaseApiClient
+from directus.utils.codec import JsonCodec, OrjsonCodec, orjson
+
+
+def make_response(size_mb: float) -> Response:
+    item = {
+        "id": 1,
+        "status": "published",
+        "name": "Lorem ipsum dolor sit amet",
+        "description": "Consectetur adipiscing elit, sed do eiusmod tempor " * 3,
+        "score": 12.5,
+        "tags": ["one", "two", "three"],
+        "owner": {"id": 3, "first_name": "Admin", "last_name": "User"},
+    }
+    item_size = len(JsonCodec().dumps(item))
+    count = int(size_mb * 1024 * 1024 / item_size)
+    items = [{**item, "id": id} for id in range(count)]
+
+    response = Response()
+    response.status_code = 200
+    response._content = JsonCodec().dumps({"data": items, "meta": {}})
+    response.encoding = "utf-8"
+
+    return response
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+
+    return median(timings)
+
+
+def previous_parsing(response: Response) -> None:
+    if response.json().get("error"):
+        raise ValueError()
+    response.json()["data"]
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = {"json": JsonCodec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+
+    print(f"{'size':>8} {'strategy':>20} {'median':>10} {'speedup':>8}")
+    for size in args.sizes:
+        response = make_response(size)
+        baseline = measure(lambda: previous_parsing(response), args.repeat)
+        print(f"{size:>6}MB {'previous':>20} {baseline * 1000:>8.1f}ms {1:>7.1f}x")
+
+        for name, codec in codecs.items():
+            client = BaseApiClient(url="http://bench.local", project="_", codec=codec)
+
+            def parse() -> None:
+                result = client._decode(response)
+                client._raise_for_error(result)
+                client._parse_result(result)
+
+            timing = measure(parse, args.repeat)
+            print(
+                f"{size:>6}MB {'decode once ' + name:>20} {timing * 1000:>8.1f}ms "
+                f"{baseline / timing:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+"""
+A local stand-in for the Directus v8 API, serving generated data from memory:
+
+- auth: authenticate and refresh, issuing JWTs expiring after `token_ttl` seconds
+- items: list (limit, offset, page, single, sort on one field, filter, meta
+  counts), retrieve, create, update and delete, one or several at a time
+- collections: list and retrieve
+- files: list, retrieve and upload (multipart or base64), the content being
+  served under /uploads with range support
+
+Every response is delayed by `latency` seconds, and the seeded items carry a
+`description` of `item_size` characters.
+
+Run with: python -m benchmarks.server --port 8055
+"""
+
+from argparse import ArgumentParser
+from base64 import b64decode
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from math import ceil
+from multiprocessing import Process, Queue, Value
+from threading import Lock, Thread
+from time import sleep, time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from jwt import encode
+
+SECRET = "benchmark"
+
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# Filter operators of the list endpoints
+OPERATORS = {
+    "eq": lambda value, other: value == other,
+    "neq": lambda value, other: value != other,
+    "lt": lambda value, other: value < other,
+    "lte": lambda value, other: value <= other,
+    "gt": lambda value, other: value > other,
+    "gte": lambda value, other: value >= other,
+    "in": lambda value, other: value in other,
+    "nin": lambda value, other: value not in other,
+}
+
+
+class NotFound(Exception):
+    pass
+
+
+def make_item(id: int, item_size: int) -> dict:
+    return {
+        "id": id,
+        "status": "published",
+        "name": f"Item {id}",
+        "description": ("Lorem ipsum dolor sit amet " * (item_size // 27 + 1))[
+            :item_size
+        ],
+        "score": id % 100 / 10,
+    }
+
+
+def coerce(value: str, like: Any) -> Any:
+    """
+    A query string value converted to the type of the field it is compared to
+    """
+    if isinstance(like, bool):
+        return value in ("1", "true")
+    if isinstance(like, (int, float)):
+        try:
+            return type(like)(value)
+        except ValueError:
+            return value
+
+    return value
+
+
+class MockDirectus(object):
+    """
+    The data and the HTTP server of the stand-in API, served from a background
+    thread of this process
+
+    Attributes
+    ----------
+    project: str
+        The project name, first segment of the API paths
+
+    latency: float
+        Seconds waited before each response
+
+    items: int
+        The number of items seeded in each collection
+
+    item_size: int
+        The length of the description of the seeded items
+
+    file_size: int
+        The size in bytes of the seeded file
+
+    token_ttl: float
+        The lifetime in seconds of the issued tokens
+
+    collections: list
+        The names of the seeded collections
+
+    requests: Value
+        A counter of the requests received, which can be shared with another process
+    """
+
+    def __init__(
+        self,
+        project: str = "_",
+        latency: float = 0.0,
+        items: int = 1000,
+        item_size: int = 200,
+        file_size: int = 1024 * 1024,
+        token_ttl: float = 3600,
+        collections: List[str] = ["articles"],
+        requests: Any = None,
+    ):
+        self.project = project
+        self.latency = latency
+        self.item_size = item_size
+        self.token_ttl = token_ttl
+        self.requests = requests if requests is not None else Value("l", 0)
+        self._lock = Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        self.items: Dict[str, Dict[int, dict]] = {
+            collection: {id: make_item(id, item_size) for id in range(1, items + 1)}
+            for collection in collections
+        }
+        self.next_ids = {collection: items + 1 for collection in collections}
+        self.files: Dict[int, dict] = {}
+        self.contents: Dict[str, bytes] = {}
+        if file_size:
+            self.add_file("seed.bin", bytes(range(256)) * (file_size // 256 + 1))
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("The server is not started")
+
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> "MockDirectus":
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        Thread(
+            target=self._server.serve_forever, name="mock-directus", daemon=True
+        ).start()
+
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockDirectus":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def add_file(self, filename: str, content: bytes, **fields) -> dict:
+        with self._lock:
+            id = len(self.files) + 1
+            filename_disk = f"{id}-{filename}"
+            self.contents[filename_disk] = content
+            self.files[id] = {
+                "id": id,
+                "filename_disk": filename_disk,
+                "filename_download": filename,
+                "filesize": len(content),
+                **fields,
+                "data": {"url": f"/uploads/{filename_disk}"},
+            }
+
+        return self.files[id]
+
+    def token(self) -> str:
+        token = encode({"id": 1, "exp": int(time() + self.token_ttl)}, SECRET)
+
+        return token.decode() if isinstance(token, bytes) else token
+
+    """
+
+    Routing
+
+    """
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, str], body: bytes, headers: Any
+    ) -> Tuple[int, Any]:
+        """
+        Returns
+        -------
+            (status, JSON document or None)
+        """
+        parts = path.strip("/").split("/")
+        if len(parts) < 2 or parts[0] != self.project:
+            raise NotFound(path)
+
+        resource, rest = parts[1], parts[2:]
+        if resource == "auth" and method == "POST":
+            return 200, {"data": {"token": self.token()}}
+
+        if resource == "items" and rest:
+            return self.handle_items(method, rest[0], rest[1:], query, body)
+
+        if resource == "collections" and method == "GET":
+            if rest:
+                return 200, {"data": self.collection(rest[0])}
+            return 200, self.list_rows(
+                [self.collection(name) for name in self.items], query
+            )
+
+        if resource == "files":
+            return self.handle_files(method, rest, query, body, headers)
+
+        raise NotFound(path)
+
+    def handle_items(
+        self,
+        method: str,
+        collection: str,
+        ids: List[str],
+        query: Dict[str, str],
+        body: bytes,
+    ) -> Tuple[int, Any]:
+        if collection not in self.items:
+            raise NotFound(collection)
+
+        items = self.items[collection]
+        if method == "GET" and not ids:
+            return 200, self.list_rows(list(items.values()), query)
+
+        if method == "GET":
+            item = items.get(int(ids[0]))
+            if item is None:
+                raise NotFound(ids[0])
+            return 200, {"data": self.select(item, query)}
+
+        if method == "POST":
+            data = loads(body)
+            with self._lock:
+                created = []
+                for item in data if isinstance(data, list) else [data]:
+                    id = self.next_ids[collection]
+                    self.next_ids[collection] += 1
+                    items[id] = {**item, "id": id}
+                    created.append(items[id])
+            return 200, {"data": created if isinstance(data, list) else created[0]}
+
+        if method == "PATCH":
+            data = loads(body)
+            if ids:
+                data = {**data, "id": int(ids[0])}
+            with self._lock:
+                updated = []
+                for item in data if isinstance(data, list) else [data]:
+                    if int(item["id"]) not in items:
+                        raise NotFound(item["id"])
+                    items[int(item["id"])].update(item)
+                    updated.append(items[int(item["id"])])
+            return 200, {"data": updated if isinstance(data, list) else updated[0]}
+
+        if method == "DELETE" and ids:
+            with self._lock:
+                for id in ids[0].split(","):
+                    items.pop(int(id), None)
+            return 204, None
+
+        raise NotFound(collection)
+
+    def handle_files(
+        self,
+        method: str,
+        ids: List[str],
+        query: Dict[str, str],
+        body: bytes,
+        headers: Any,
+    ) -> Tuple[int, Any]:
+        host = f"http://{headers.get('host')}"
+        if method == "GET" and not ids:
+            files = [self.file_urls(file, host) for file in self.files.values()]
+            return 200, self.list_rows(files, query)
+
+        if method == "GET":
+            file = self.files.get(int(ids[0]))
+            if file is None:
+                raise NotFound(ids[0])
+            return 200, {"data": self.select(self.file_urls(file, host), query)}
+
+        if method == "POST":
+            content_type = headers.get("content-type", "")
+            if content_type.startswith("multipart/form-data"):
+                fields, filename, content = self.parse_multipart(body, content_type)
+            else:
+                fields = loads(body)
+                content = b64decode(fields.pop("data"))
+                filename = fields.get("filename_download", "file")
+            file = self.add_file(filename, content, **fields)
+            return 200, {"data": self.file_urls(file, host)}
+
+        raise NotFound("files")
+
+    """
+
+    Responses
+
+    """
+
+    def collection(self, name: str) -> dict:
+        if name not in self.items:
+            raise NotFound(name)
+
+        sample = next(iter(self.items[name].values()), {})
+
+        return {
+            "collection": name,
+            "note": None,
+            "hidden": False,
+            "single": False,
+            "fields": {
+                field: {"field": field, "type": type(value).__name__}
+                for field, value in sample.items()
+            },
+        }
+
+    @staticmethod
+    def file_urls(file: dict, host: str) -> dict:
+        return {
+            **file,
+            "data": {**file["data"], "full_url": host + file["data"]["url"]},
+        }
+
+    @staticmethod
+    def select(row: dict, query: Dict[str, str]) -> dict:
+        """
+        The top-level fields of the row named in the `fields` parameter
+        """
+        fields = [field.split(".")[0] for field in query.get("fields", "*").split(",")]
+        if "*" in fields:
+            return row
+
+        return {field: row[field] for field in fields if field in row}
+
+    def list_rows(self, rows: List[dict], query: Dict[str, str]) -> dict:
+        total_count = len(rows)
+        for key, value in query.items():
+            if not key.startswith("filter["):
+                continue
+            field, operator = key[len("filter[") : -1].split("][")
+            values = value.split(",")
+            rows = [
+                row
+                for row in rows
+                if field in row
+                and OPERATORS[operator](
+                    row[field],
+                    (
+                        [coerce(value, row[field]) for value in values]
+                        if operator in ("in", "nin")
+                        else coerce(value, row[field])
+                    ),
+                )
+            ]
+
+        sort = query.get("sort", "id").split(",")[0]
+        if sort and all(sort.lstrip("-") in row for row in rows):
+            rows.sort(
+                key=lambda row: row.get(sort.lstrip("-")),
+                reverse=sort.startswith("-"),
+            )
+
+        limit = int(query.get("limit", 100))
+        page = int(query["page"]) if "page" in query else None
+        offset = (page - 1) * limit if page else int(query.get("offset", 0))
+        selected = rows[offset:] if limit < 0 else rows[offset : offset + limit]
+
+        meta: Dict[str, Any] = {"result_count": len(selected)}
+        requested = query.get("meta", "").split(",")
+        if "total_count" in requested or "*" in requested:
+            meta["total_count"] = total_count
+        if "filter_count" in requested or "*" in requested:
+            meta["filter_count"] = len(rows)
+        if "page" in requested or "*" in requested:
+            meta["page"] = page or 1
+            meta["page_count"] = ceil(len(rows) / limit) if limit > 0 else 1
+
+        data = [self.select(row, query) for row in selected]
+        if query.get("single") == "1":
+            if not data:
+                raise NotFound("single")
+            return {"data": data[0], "meta": meta}
+
+        return {"data": data, "meta": meta}
+
+    @staticmethod
+    def parse_multipart(
+        body: bytes, content_type: str
+    ) -> Tuple[Dict[str, str], str, bytes]:
+        """
+        Returns
+        -------
+            (form fields, filename, file content)
+        """
+        boundary = content_type.split("boundary=")[1].encode()
+        fields: Dict[str, str] = {}
+        filename, content = "file", b""
+        for part in body.split(b"--" + boundary)[1:-1]:
+            head, _, value = part[2:].partition(b"\r\n\r\n")
+            value = value[:-2]
+            disposition = head.split(b"\r\n")[0].decode()
+            name = disposition.split('name="')[1].split('"')[0]
+            if 'filename="' in disposition:
+                filename = disposition.split('filename="')[1].split('"')[0]
+                content = value
+            else:
+                fields[name] = value.decode()
+
+        return fields, filename, content
+
+    def _handler(self) -> type:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep the connections alive, as the Directus server does
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, which must not wait for an ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def read_body(self) -> bytes:
+                if self.headers.get("transfer-encoding", "").lower() == "chunked":
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0], 16)
+                        chunk = self.rfile.read(size + 2)[:size]
+                        if not size:
+                            return b"".join(chunks)
+                        chunks.append(chunk)
+
+                return self.rfile.read(int(self.headers.get("content-length", 0)))
+
+            def send(self, status: int, body: bytes = b"", headers: dict = {}) -> None:
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                for start in range(0, len(body), WRITE_CHUNK_SIZE):
+                    self.wfile.write(body[start : start + WRITE_CHUNK_SIZE])
+
+            def respond(self) -> None:
+                with api.requests.get_lock():
+                    api.requests.value += 1
+                body = self.read_body()
+                if api.latency:
+                    sleep(api.latency)
+
+                url = urlsplit(self.path)
+                if url.path.startswith("/uploads/"):
+                    return self.upload(url.path[len("/uploads/") :])
+
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                try:
+                    status, document = api.handle(
+                        self.command, url.path, query, body, self.headers
+                    )
+                except NotFound:
+                    status, document = (
+                        404,
+                        {"error": {"code": 203, "message": "Item not found"}},
+                    )
+
+                if document is None:
+                    return self.send(status)
+
+                self.send(
+                    status,
+                    dumps(document).encode(),
+                    {"content-type": "application/json; charset=utf-8"},
+                )
+
+            def upload(self, filename_disk: str) -> None:
+                content = api.contents.get(filename_disk)
+                if content is None:
+                    return self.send(404)
+
+                byte_range = self.headers.get("range")
+                if byte_range is None:
+                    return self.send(200, content, {"accept-ranges": "bytes"})
+
+                start, _, end = byte_range[len("bytes=") :].partition("-")
+                last = min(int(end), len(content) - 1) if end else len(content) - 1
+                self.send(
+                    206,
+                    content[int(start) : last + 1],
+                    {"content-range": f"bytes {start}-{last}/{len(content)}"},
+                )
+
+            do_GET = do_POST = do_PATCH = do_DELETE = respond
+
+        return Handler
+
+
+def _serve(queue: Queue, requests: Any, options: dict) -> None:
+    server = MockDirectus(requests=requests, **options).start()
+    queue.put(server.url)
+    while True:
+        sleep(3600)
+
+
+@contextmanager
+def serve_in_process(**options) -> Iterator[Tuple[str, Any]]:
+    """
+    Run a MockDirectus in a child process, so that it competes neither for the GIL
+    nor for the memory traced in the benchmarked process
+
+    Returns
+    -------
+        (url of the server, counter of the requests received)
+    """
+    queue: Queue = Queue()
+    requests = Value("l", 0)
+    process = Process(target=_serve, args=(queue, requests, options), daemon=True)
+    process.start()
+    try:
+        yield queue.get(timeout=30), requests
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8055)
+    parser.add_argument("--project", default="_")
+    parser.add_argument("--latency", type=float, default=0, help="in milliseconds")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--item-size", type=int, default=200)
+    parser.add_argument("--file-size", type=float, default=1, help="in MB")
+    parser.add_argument("--token-ttl", type=float, default=3600)
+    args = parser.parse_args()
+
+    server = MockDirectus(
+        project=args.project,
+        latency=args.latency / 1000,
+        items=args.items,
+        item_size=args.item_size,
+        file_size=int(args.file_size * 1024 * 1024),
+        token_ttl=args.token_ttl,
+    ).start(args.host, args.port)
+    print(f"Serving the {args.project} project on {server.url}")
+    try:
+        while True:
+            sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
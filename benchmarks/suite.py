@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Measure the client against a local stand-in for the Directus API (see
+benchmarks.server), run in a child process:
+
+- get_item: latency of single item reads
+- scan, scan_parallel: full collection scans, page by page then with 4 pages in
+  flight
+- bulk_create, bulk_update: writes of 1000 items, 100 per request
+- upload, download: transfers of a file, downloaded as 4 ranges in flight
+- token_refresh: refreshes of the access token
+
+Each scenario reports its throughput, the p50 and p99 latency of its operations,
+the requests sent per operation and the peak memory allocated by an operation
+(traced in an extra run). Save the results of a run and compare a later one to
+them to spot regressions:
+
+    python -m benchmarks.suite --save before.json
+    python -m benchmarks.suite --compare before.json
+
+Run with: python -m benchmarks.suite
+"""
+
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, dataclass
+from json import dump, load
+from os.path import join
+from random import Random
+from sys import exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from directus import DirectusClient
+
+from .server import serve_in_process
+
+MB = 1024 * 1024
+
+# One run of a scenario, returning the number of units it processed
+Operation = Callable[[], float]
+
+
+@dataclass
+class Scenario:
+    """
+    Attributes
+    ----------
+    setup: callable
+        Called with (client, options, working directory), returns the operation
+    unit: str
+        The unit counted by the operation, for the throughput
+    repeat: int
+        The default number of timed operations
+    """
+
+    setup: Callable[[DirectusClient, Namespace, str], Operation]
+    unit: str
+    repeat: int
+
+
+@dataclass
+class Result:
+    scenario: str
+    operations: int
+    unit: str
+    throughput: float
+    p50: float
+    p99: float
+    requests: float
+    peak_memory: float
+
+
+def get_item(client: DirectusClient, options: Namespace, workdir: str) -> Operation:
+    ids = Random(0)
+
+    def operation() -> float:
+        client.get_item(collection="articles", id=ids.randint(1, options.items))
+        return 1
+
+    return operation
+
+
+def scan(max_in_flight: int) -> Callable[..., Operation]:
+    def setup(client: DirectusClient, options: Namespace, workdir: str) -> Operation:
+        def operation() -> float:
+            return sum(
+                1
+                for _ in client.iter_items(
+                    collection="articles", limit=100, max_in_flight=max_in_flight
+                )
+            )
+
+        return operation
+
+    return setup
+
+
+def bulk_create(client: DirectusClient, options: Namespace, workdir: str) -> Operation:
+    items = [{"name": f"Created {id}", "status": "draft"} for id in range(1000)]
+
+    def operation() -> float:
+        return len(client.create_items(collection="articles", items=items).data)
+
+    return operation
+
+
+def bulk_update(client: DirectusClient, options: Namespace, workdir: str) -> Operation:
+    items = [
+        {"id": id, "status": "archived"}
+        for id in range(1, min(options.items, 1000) + 1)
+    ]
+
+    def operation() -> float:
+        return len(client.update_items(collection="articles", items=items).data)
+
+    return operation
+
+
+def upload(client: DirectusClient, options: Namespace, workdir: str) -> Operation:
+    path = join(workdir, "upload.bin")
+    with open(path, "wb") as file:
+        file.write(bytes(range(256)) * int(options.file_size * MB / 256))
+
+    def operation() -> float:
+        file, _ = client.upload_file(path)
+        return file["filesize"] / MB
+
+    return operation
+
+
+def download(client: DirectusClient, options: Namespace, workdir: str) -> Operation:
+    file, _ = client.get_file(id=1, fields=["filesize"])
+    part_size = max(file["filesize"] // 4, 1)
+
+    def operation() -> float:
+        client.download_file(
+            id=1, dest=join(workdir, "download.bin"), part_size=part_size, resume=False
+        )
+        return file["filesize"] / MB
+
+    return operation
+
+
+def token_refresh(
+    client: DirectusClient, options: Namespace, workdir: str
+) -> Operation:
+    def operation() -> float:
+        # Any margin longer than the token lifetime forces a refresh
+        client.ApiClient._auto_refresh_token(margin=float("inf"))
+        return 1
+
+    return operation
+
+
+SCENARIOS = {
+    "get_item": Scenario(get_item, "items", 500),
+    "scan": Scenario(scan(max_in_flight=1), "items", 10),
+    "scan_parallel": Scenario(scan(max_in_flight=4), "items", 10),
+    "bulk_create": Scenario(bulk_create, "items", 10),
+    "bulk_update": Scenario(bulk_update, "items", 10),
+    "upload": Scenario(upload, "MB", 10),
+    "download": Scenario(download, "MB", 10),
+    "token_refresh": Scenario(token_refresh, "tokens", 200),
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    The nearest-rank `q` percentile of the values
+    """
+    ordered = sorted(values)
+
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+
+def run(
+    name: str, scenario: Scenario, url: str, requests: Any, options: Namespace
+) -> Result:
+    client = DirectusClient(
+        url=url, project="_", email="admin@example.com", password="password"
+    )
+    with client, TemporaryDirectory() as workdir:
+        operation = scenario.setup(client, options, workdir)
+        # Warm up the connections
+        operation()
+
+        repeat = options.repeat or scenario.repeat
+        latencies: List[float] = []
+        units = 0.0
+        sent = requests.value
+        for _ in range(repeat):
+            start = perf_counter()
+            units += operation()
+            latencies.append(perf_counter() - start)
+        sent = requests.value - sent
+
+        tracemalloc.start()
+        operation()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return Result(
+        scenario=name,
+        operations=repeat,
+        unit=scenario.unit,
+        throughput=units / sum(latencies),
+        p50=percentile(latencies, 50),
+        p99=percentile(latencies, 99),
+        requests=sent / repeat,
+        peak_memory=peak_memory / MB,
+    )
+
+
+def compare(results: List[Result], baseline: Dict[str, dict], threshold: float) -> bool:
+    """
+    Print the changes from the baseline results
+
+    Returns
+    -------
+        bool (True if a scenario regressed beyond the threshold)
+    """
+    regressed = False
+    print(f"\n{'scenario':<14} {'throughput':>11} {'p99':>9} {'peak':>9}")
+    for result in results:
+        before = baseline.get(result.scenario)
+        if before is None:
+            continue
+
+        changes = {
+            "throughput": result.throughput / before["throughput"] - 1,
+            "p99": result.p99 / before["p99"] - 1,
+            "peak": result.peak_memory / max(before["peak_memory"], 1e-9) - 1,
+        }
+        worse = (
+            changes["throughput"] < -threshold
+            or changes["p99"] > threshold
+            or changes["peak"] > threshold
+        )
+        regressed = regressed or worse
+        print(
+            f"{result.scenario:<14} {changes['throughput']:>+10.1%} "
+            f"{changes['p99']:>+8.1%} {changes['peak']:>+8.1%}"
+            f"{'  regression' if worse else ''}"
+        )
+
+    return regressed
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenarios", nargs="*", choices=[[], *SCENARIOS])
+    parser.add_argument("--latency", type=float, default=0, help="in milliseconds")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--item-size", type=int, default=200)
+    parser.add_argument("--file-size", type=float, default=16, help="in MB")
+    parser.add_argument("--repeat", type=int, help="operations per scenario")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare to the results of this JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="regression threshold (0.1: 10%%)"
+    )
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'scenario':<14} {'ops':>5} {'throughput':>16} {'p50':>10} {'p99':>10} "
+        f"{'req/op':>7} {'peak':>9}"
+    )
+    with serve_in_process(
+        latency=args.latency / 1000,
+        items=args.items,
+        item_size=args.item_size,
+        file_size=int(args.file_size * MB),
+    ) as (url, requests):
+        for name in args.scenarios or SCENARIOS:
+            result = run(name, SCENARIOS[name], url, requests, args)
+            results.append(result)
+            print(
+                f"{name:<14} {result.operations:>5} "
+                f"{result.throughput:>10.1f} {result.unit + '/s':<7}"
+                f"{result.p50 * 1000:>8.2f}ms {result.p99 * 1000:>8.2f}ms "
+                f"{result.requests:>7.1f} {result.peak_memory:>7.2f}MB"
+            )
+
+    if args.save:
+        with open(args.save, "w") as file:
+            dump(
+                {result.scenario: asdict(result) for result in results}, file, indent=2
+            )
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = load(file)
+        if compare(results, baseline, args.threshold):
+            exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,19 @@
 # -*- coding: utf-8 -*-
 
+from .asyncdirectus import AsyncDirectusClient
 from .directus import DirectusClient
 from .exceptions import DirectusException
+from .pool import AsyncDirectusClientPool, DirectusClientPool
+from .utils import (
+    AsyncTransport,
+    CircuitBreaker,
+    Compression,
+    Hooks,
+    MetricsCollector,
+    Query,
+    ReadCache,
+    RetryPolicy,
+    SqliteMirror,
+    Throttle,
+    Transport,
+)
@@ -0,0 +1,1141 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import Semaphore, gather
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .exceptions import DirectusException
+from .utils.asyncapiclient import AsyncApiClient
+from .utils.cache import ReadCache
+from .utils.codec import JsonCodec
+from .utils.compression import Compression
+from .utils.hooks import Hooks
+from .utils.loader import (
+    AsyncItemLoader,
+    Prefetch,
+    attach_relations,
+    relation_ids,
+)
+from .utils.multipart import (
+    CHUNK_SIZE,
+    FileSource,
+    MultipartBody,
+    ProgressCallback,
+)
+from .utils.pagination import (
+    check_keyset_params,
+    aiter_keyset_pages,
+    aiter_pages,
+    aiter_pages_parallel,
+    keyset_filters,
+)
+from .utils.params import (
+    collection_data,
+    email_data,
+    fields_params,
+    file_data,
+    filter_params,
+    list_params,
+)
+from .utils.query import Query
+from .utils.records import Record, record_class, schema_fields, to_records
+from .utils.retry import CircuitBreaker, RetryPolicy
+from .utils.throttle import Throttle
+from .utils.transport import AsyncTransport
+from .typing import (
+    RequestMeta,
+    RequestFields,
+    RequestParams,
+    ResponseMeta,
+    Collection,
+    Item,
+    Revision,
+    File,
+)
+
+
+class AsyncDirectusClient:
+    """
+    AsyncDirectusClient mirrors DirectusClient for asyncio applications: every method
+    is a coroutine sending its request through a pooled `AsyncTransport`.
+
+    Authentication happens on the first request, or when entering the client with
+    `async with`.
+
+    Attributes
+    ----------
+    url: str
+        The url of the Directus server you want to connect to
+
+    email: str
+        The email account you want to use to connect to the Directus server
+
+    password: str
+        The associated password corresponding to the email account
+
+    project: str
+        The name of the project you want to access on the specified server
+
+    transport: AsyncTransport
+        An optional pooled HTTP transport, which can be shared between several
+        clients pointing at the same server. When not provided, the client creates
+        its own and closes it with the client.
+
+    codec: JsonCodec
+        The codec used to serialize request bodies and parse responses, the standard
+        library `json` module by default (see `directus.utils.codec.fastest_codec`)
+
+    refresh_margin: float
+        The access token is refreshed when it expires within this number of seconds
+
+    cache: ReadCache
+        An optional cache serving get_item and get_collection, invalidated by the
+        writes sent through this client (see `directus.utils.cache.ReadCache`)
+
+    retry: RetryPolicy
+        An optional policy retrying the requests that fail with a connection error
+        or a transient status, with exponential backoff (see
+        `directus.utils.retry.RetryPolicy`)
+
+    circuit_breaker: CircuitBreaker
+        An optional per-host circuit breaker, failing requests fast while the server
+        is unhealthy. It can be shared by several clients.
+
+    throttle: Throttle
+        Optional rate and concurrency limits, client-wide and per endpoint group,
+        which can adapt to the load of the server (see
+        `directus.utils.throttle.Throttle`). It can be shared by several clients.
+
+    coalesce: bool
+        If True, concurrent identical GET requests (same path, params and user)
+        share a single HTTP request, each caller getting its own copy of the result
+
+    hooks: Hooks
+        Optional callbacks reporting each request, its timings and its outcome (see
+        `directus.utils.hooks.Hooks`, `directus.utils.metrics.MetricsCollector`)
+
+    compression: Compression
+        Optional compression of the responses and of the large request bodies (see
+        `directus.utils.compression.Compression`). It can be shared by several
+        clients.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        project: Optional[str] = None,
+        transport: Optional[AsyncTransport] = None,
+        codec: Optional[JsonCodec] = None,
+        refresh_margin: float = 60,
+        cache: Optional[ReadCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[Throttle] = None,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        compression: Optional[Compression] = None,
+    ):
+        if not url:
+            raise DirectusException("You must provide a server url")
+
+        if not project:
+            raise DirectusException("You must provide a project")
+
+        if not email and password:
+            raise DirectusException("You must provide an email")
+
+        if not password and email:
+            raise DirectusException("You must provide a password")
+
+        self.ApiClient = AsyncApiClient(
+            url=url,
+            email=email,
+            password=password,
+            project=project,
+            transport=transport,
+            codec=codec,
+            refresh_margin=refresh_margin,
+            cache=cache,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            throttle=throttle,
+            coalesce=coalesce,
+            hooks=hooks,
+            compression=compression,
+        )
+        self._record_classes: Dict[str, Type[Record]] = {}
+
+    async def close(self) -> None:
+        """
+        Release the connections held by the client. A transport shared with other
+        clients is left open and must be closed by its owner.
+        """
+        await self.ApiClient.close()
+
+    async def __aenter__(self) -> "AsyncDirectusClient":
+        await self.ApiClient.authenticate()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    """
+
+    Collections
+    https://docs.directus.io/api/collections.html
+
+    """
+
+    async def get_collections_list(
+        self, offset: int = 0, single: bool = False, meta: RequestMeta = []
+    ) -> Tuple[List[Collection], ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/collections.html#list-collections
+
+        Returns
+        -------
+            (List of Collection, Metadata)
+        """
+        path = "collections"
+
+        params = {"offset": offset, "single": int(single)}
+        response_data, response_meta = await self.ApiClient.do_get(
+            path=path, params=params, meta=meta
+        )
+
+        return list(response_data), response_meta
+
+    async def get_collection(
+        self, collection: str, meta: RequestMeta = []
+    ) -> Tuple[Collection, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/collections.html#retrieve-a-collection
+
+        Returns
+        -------
+            (Collection, Metadata)
+        """
+        path = "/".join(["collections", collection])
+
+        return await self.ApiClient.do_get(path=path, meta=meta, cached=True)
+
+    async def create_collection(
+        self, collection: Collection, meta: RequestMeta = []
+    ) -> Tuple[Collection, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/collections.html#create-a-collection
+
+        Returns
+        -------
+            (Collection, Metadata)
+        """
+        path = "collections"
+
+        return await self.ApiClient.do_post(
+            path=path, data=collection_data(collection), meta=meta
+        )
+
+    async def update_collection(
+        self, collection: str, data: dict, meta: RequestMeta = []
+    ) -> Tuple[Collection, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/collections.html#update-a-collection
+
+        Returns
+        -------
+            (Collection, Metadata)
+        """
+        path = "collections"
+
+        response_data, response_meta = await self.ApiClient.do_patch(
+            path=path, id=collection, data=data, meta=meta
+        )
+        self.ApiClient.invalidate("/".join([path, collection]))
+        self._record_classes.pop(collection, None)
+
+        return response_data, response_meta
+
+    async def delete_collection(self, collection: str) -> bool:
+        """
+        Find out more: https://docs.directus.io/api/collections.html#delete-a-collection
+
+        Returns
+        -------
+            bool (True if deleted, False if not)
+        """
+        path = "collections"
+
+        is_deleted = await self.ApiClient.do_delete(path=path, id=collection)
+        self.ApiClient.invalidate("/".join([path, collection]))
+        self._record_classes.pop(collection, None)
+
+        return is_deleted
+
+    """
+
+    Items
+    https://docs.directus.io/api/items.html
+
+    """
+
+    async def get_items_list(
+        self,
+        collection: str,
+        fields: RequestFields = ["*"],
+        page: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+        sort: List[str] = ["id"],
+        single: bool = False,
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        after: Optional[Item] = None,
+        prefetch: Prefetch = {},
+        records: bool = False,
+        query: Optional[Query] = None,
+    ) -> Tuple[List[Item], ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-the-items
+
+        If page is set, offset is not taken into account
+
+        If single, only return first corresponding result from list
+
+        If after is set, return the items following this one in sort order (keyset
+        pagination), instead of using an offset or a page. The sort fields must be
+        part of the retrieved fields and identify an item uniquely.
+
+        prefetch maps relation fields to their related collection, e.g.
+        {"team": "teams"}: the ids held by these fields are replaced by the related
+        items, fetched with one request per related collection (see loader)
+
+        If records, items are returned as compact Record objects, readable as
+        attributes or mapping keys, instead of dicts (see record_class)
+
+        A compiled query (see directus.utils.query.Query) replaces fields, sort,
+        filter, status and q, and can be reused across calls
+
+        Returns
+        -------
+            (List of Item, Metadata)
+        """
+        path = "/".join(["items", collection])
+
+        params = list_params(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            page=page,
+            sort=sort,
+            single=single,
+            filter=filter,
+            status=status,
+            q=q,
+            query=query,
+        )
+        if query is not None:
+            sort = list(query.sort)
+
+        # Items, or Records if records
+        response_data: Any
+        if after is not None:
+            response_data, response_meta = await self._get_list_after(
+                path, params=params, sort=sort, after=after, limit=limit, meta=meta
+            )
+        else:
+            data, response_meta = await self.ApiClient.do_get(
+                path, params=params, meta=meta
+            )
+            response_data = list(data)
+
+        if prefetch:
+            await self._prefetch(response_data, prefetch, self.loader())
+
+        if records:
+            response_data = to_records(
+                await self.record_class(collection), response_data
+            )
+
+        return response_data, response_meta
+
+    async def iter_items(
+        self,
+        collection: str,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        limit: int = 100,
+        page: int = 1,
+        pages: bool = False,
+        read_ahead: bool = True,
+        max_in_flight: int = 1,
+        ordered: bool = True,
+        keyset: bool = False,
+        prefetch: Prefetch = {},
+        records: bool = False,
+        query: Optional[Query] = None,
+    ) -> AsyncIterator[Union[Item, List[Item]]]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-the-items
+
+        Lazily run through pagination, `limit` items at a time. With read_ahead, the
+        next page is fetched while the current one is being consumed, so that no
+        more than two pages are ever held in memory.
+
+        If pages, yield each page as a list instead of the items one by one
+
+        If max_in_flight is greater than 1, the page count is read from the first
+        page and the following pages are fetched concurrently. Unless ordered, pages
+        are then yielded as soon as they are received rather than in page order.
+
+        If keyset, each page is requested as the items following the last item of the
+        previous page (see get_items_list), which stays fast and stable on large
+        collections being written to. page, read_ahead and max_in_flight are then
+        not taken into account.
+
+        With prefetch, the relations of each page are resolved as in
+        get_items_list, each related item being fetched once per page. The related
+        items are forgotten once their page is yielded, so that a long iteration
+        does not accumulate them
+
+        If records, items are yielded as compact Record objects (see record_class)
+
+        A compiled query replaces fields, sort, filter, status and q, as in
+        get_items_list
+
+        Returns
+        -------
+            Async iterator of Item (or of List of Item)
+        """
+        loader = self.loader() if prefetch else None
+        async for page_data, _ in self._iter_items_pages(
+            collection=collection,
+            fields=fields,
+            sort=sort,
+            filter=filter,
+            status=status,
+            q=q,
+            meta=meta,
+            limit=limit,
+            page=page,
+            read_ahead=read_ahead,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            keyset=keyset,
+            records=records,
+            query=query,
+        ):
+            if loader is not None:
+                await self._prefetch(page_data, prefetch, loader)
+            if pages:
+                yield page_data
+            else:
+                for item in page_data:
+                    yield item
+            if loader is not None:
+                loader.clear()
+
+    async def get_all_items_list(
+        self,
+        collection: str,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        page: int = 1,
+        max_in_flight: int = 1,
+        records: bool = False,
+        query: Optional[Query] = None,
+    ) -> Tuple[List[Item], ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-the-items
+
+        Prefer iter_items for large collections, as this loads every item in memory
+
+        If max_in_flight is greater than 1, the page count is read from the first
+        page and the following pages are fetched concurrently
+
+        If records, items are returned as compact Record objects (see record_class)
+
+        A compiled query replaces fields, sort, filter, status and q, as in
+        get_items_list
+
+        Returns
+        -------
+            (List of Item, Metadata of the first page)
+        """
+        response_data: List[Item] = []
+        response_meta: Optional[ResponseMeta] = None
+
+        async for page_data, page_meta in self._iter_items_pages(
+            collection=collection,
+            fields=fields,
+            sort=sort,
+            filter=filter,
+            status=status,
+            q=q,
+            meta=meta,
+            page=page,
+            max_in_flight=max_in_flight,
+            records=records,
+            query=query,
+        ):
+            response_data += page_data
+            if response_meta is None:
+                response_meta = page_meta
+
+        return response_data, response_meta or {}
+
+    def _iter_items_pages(
+        self,
+        collection: str,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        limit: int = 100,
+        page: int = 1,
+        read_ahead: bool = True,
+        max_in_flight: int = 1,
+        ordered: bool = True,
+        keyset: bool = False,
+        records: bool = False,
+        query: Optional[Query] = None,
+    ) -> AsyncIterator[Tuple[List[Item], ResponseMeta]]:
+        if keyset:
+            check_keyset_params(list_params(filter=filter, query=query))
+
+            async def fetch_after(
+                after: Optional[Item],
+            ) -> Tuple[List[Item], ResponseMeta]:
+                return await self.get_items_list(
+                    collection=collection,
+                    fields=fields,
+                    limit=limit,
+                    sort=sort,
+                    filter=filter,
+                    status=status,
+                    q=q,
+                    meta=meta,
+                    after=after,
+                    records=records,
+                    query=query,
+                )
+
+            return aiter_keyset_pages(fetch_after, limit=limit)
+
+        if "page" not in meta:
+            meta = [*meta, "page"]
+
+        async def fetch(page: int) -> Tuple[List[Item], ResponseMeta]:
+            return await self.get_items_list(
+                collection=collection,
+                fields=fields,
+                page=page,
+                limit=limit,
+                sort=sort,
+                filter=filter,
+                status=status,
+                q=q,
+                meta=meta,
+                records=records,
+                query=query,
+            )
+
+        if max_in_flight > 1:
+            return aiter_pages_parallel(
+                fetch,
+                page=page,
+                limit=limit,
+                max_in_flight=max_in_flight,
+                ordered=ordered,
+            )
+
+        return aiter_pages(fetch, page=page, limit=limit, read_ahead=read_ahead)
+
+    def loader(
+        self,
+        fields: RequestFields = ["*"],
+        primary_key: str = "id",
+        max_batch_size: int = 100,
+        max_url_length: int = 2000,
+    ) -> AsyncItemLoader:
+        """
+        Batch the items requested by id: the ids requested with `load` during an
+        event loop iteration are fetched together on the next one, with one `in`
+        filtered request per collection and batch of ids
+
+        Returns
+        -------
+            AsyncItemLoader
+        """
+        if "*" not in fields and primary_key not in fields:
+            fields = [*fields, primary_key]
+
+        async def fetch(collection: str, ids: List[Hashable]) -> List[Item]:
+            items, _ = await self.get_items_list(
+                collection=collection,
+                fields=fields,
+                filter={primary_key: {"in": ids}},
+                limit=len(ids),
+                sort=[primary_key],
+            )
+            return items
+
+        return AsyncItemLoader(
+            fetch,
+            primary_key=primary_key,
+            max_batch_size=max_batch_size,
+            max_url_length=max_url_length,
+        )
+
+    async def _prefetch(
+        self, items: List[Item], prefetch: Prefetch, loader: AsyncItemLoader
+    ) -> None:
+        keys = [
+            (collection, id)
+            for collection, ids in relation_ids(items, prefetch).items()
+            for id in ids
+        ]
+        related = dict(zip(keys, await gather(*[loader.load(*key) for key in keys])))
+        attach_relations(items, prefetch, lambda *key: related[key])
+
+    async def record_class(self, collection: str) -> Type[Record]:
+        """
+        The compact Record class of the items of a collection, generated from its
+        fields (see get_collection). The fields are read once per client, until
+        the collection is updated through it.
+
+        Returns
+        -------
+            Record subclass
+        """
+        if collection not in self._record_classes:
+            collection_info, _ = await self.get_collection(collection=collection)
+            self._record_classes[collection] = record_class(
+                collection, schema_fields(collection_info.get("fields") or {})
+            )
+
+        return self._record_classes[collection]
+
+    async def get_item(
+        self,
+        collection: str,
+        id: int,
+        fields: RequestFields = ["*"],
+        meta: RequestMeta = [],
+        records: bool = False,
+    ) -> Tuple[Item, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#retrieve-an-item
+
+        If records, the item is returned as a compact Record (see record_class)
+
+        Returns
+        -------
+            (Item, Metadata)
+        """
+        path = "/".join(["items", collection, str(id)])
+
+        params = fields_params(fields)
+
+        # An Item, or a Record if records
+        response_data: Any
+        response_data, response_meta = await self.ApiClient.do_get(
+            path=path, params=params, meta=meta, cached=True
+        )
+        if records:
+            response_data = (await self.record_class(collection))(response_data)
+
+        return response_data, response_meta
+
+    async def gather_items(
+        self,
+        collection: str,
+        ids: Iterable[int],
+        fields: RequestFields = ["*"],
+        meta: RequestMeta = [],
+        concurrency: int = 10,
+    ) -> List[Tuple[Item, ResponseMeta]]:
+        """
+        Retrieve several items concurrently, with at most `concurrency` requests in
+        flight at the same time
+
+        Returns
+        -------
+            List of (Item, Metadata), in the same order as ids
+        """
+        if concurrency < 1:
+            raise DirectusException("concurrency must be a positive integer")
+
+        semaphore = Semaphore(concurrency)
+
+        async def get_item(id: int) -> Tuple[Item, ResponseMeta]:
+            async with semaphore:
+                return await self.get_item(
+                    collection=collection, id=id, fields=fields, meta=meta
+                )
+
+        return list(await gather(*[get_item(id) for id in ids]))
+
+    async def create_item(
+        self, collection: str, item: Item, meta: RequestMeta = []
+    ) -> Tuple[Item, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#create-an-item
+
+        Returns
+        -------
+            (Item, Metadata)
+        """
+        path = "/".join(["items", collection])
+
+        return await self.ApiClient.do_post(path=path, data=item, meta=meta)
+
+    async def update_item(
+        self,
+        collection: str,
+        id: int,
+        data: dict,
+        fields: RequestFields = ["*"],
+        meta: RequestMeta = [],
+    ) -> Tuple[Item, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#update-an-item
+
+        Returns
+        -------
+            (Item, Metadata)
+        """
+        path = "/".join(["items", collection])
+
+        response_data, response_meta = await self.ApiClient.do_patch(
+            path=path, id=id, data=data, meta=meta
+        )
+        self.ApiClient.invalidate("/".join([path, str(id)]))
+
+        return response_data, response_meta
+
+    async def delete_item(self, collection: str, id: int) -> bool:
+        """
+        Find out more: https://docs.directus.io/api/items.html#delete-an-item
+
+        Returns
+        -------
+            bool (True if deleted, False if not)
+        """
+        path = "/".join(["items", collection])
+
+        is_deleted = await self.ApiClient.do_delete(path=path, id=id)
+        self.ApiClient.invalidate("/".join([path, str(id)]))
+
+        return is_deleted
+
+    async def get_item_revisions_list(
+        self,
+        collection: str,
+        id: int,
+        fields: RequestFields = ["*"],
+        limit: int = 100,
+        offset: int = 0,
+        page: Optional[int] = None,
+        sort: List[str] = ["id"],
+        single: bool = False,
+        filter: dict = {},
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        after: Optional[Revision] = None,
+        query: Optional[Query] = None,
+    ) -> Tuple[List[Revision], ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-item-revisions
+
+        If page is set, offset is not taken into account
+
+        If single, only return first corresponding result from list
+
+        If after is set, return the revisions following this one in sort order
+        (keyset pagination), instead of using an offset or a page
+
+        A compiled query replaces fields, sort, filter and q, as in get_items_list
+
+        Returns
+        -------
+            (List of revision, Metadata)
+        """
+        path = "/".join(["items", collection, str(id), "revisions"])
+
+        params = list_params(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            page=page,
+            sort=sort,
+            single=single,
+            filter=filter,
+            q=q,
+            query=query,
+        )
+        if query is not None:
+            sort = list(query.sort)
+
+        if after is not None:
+            return await self._get_list_after(
+                path, params=params, sort=sort, after=after, limit=limit, meta=meta
+            )
+
+        response_data, response_meta = await self.ApiClient.do_get(
+            path, params=params, meta=meta
+        )
+
+        return list(response_data), response_meta
+
+    async def iter_item_revisions(
+        self,
+        collection: str,
+        id: int,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        limit: int = 100,
+        pages: bool = False,
+        keyset: bool = False,
+    ) -> AsyncIterator[Union[Revision, List[Revision]]]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-item-revisions
+
+        Lazily run through the revisions of an item, `limit` revisions at a time
+
+        If pages, yield each page as a list instead of the revisions one by one
+
+        If keyset, each page is requested as the revisions following the last one of
+        the previous page (see get_item_revisions_list)
+
+        Returns
+        -------
+            Async iterator of revision (or of List of revision)
+        """
+
+        async def fetch(page: int) -> Tuple[List[Revision], ResponseMeta]:
+            return await self.get_item_revisions_list(
+                collection=collection,
+                id=id,
+                fields=fields,
+                limit=limit,
+                page=page,
+                sort=sort,
+                filter=filter,
+                q=q,
+                meta=meta if "page" in meta else [*meta, "page"],
+            )
+
+        async def fetch_after(
+            after: Optional[Revision],
+        ) -> Tuple[List[Revision], ResponseMeta]:
+            return await self.get_item_revisions_list(
+                collection=collection,
+                id=id,
+                fields=fields,
+                limit=limit,
+                sort=sort,
+                filter=filter,
+                q=q,
+                meta=meta,
+                after=after,
+            )
+
+        if keyset:
+            check_keyset_params(list_params(filter=filter))
+        page_iterator = (
+            aiter_keyset_pages(fetch_after, limit=limit)
+            if keyset
+            else aiter_pages(fetch, limit=limit)
+        )
+
+        async for page_data, _ in page_iterator:
+            if pages:
+                yield page_data
+            else:
+                for revision in page_data:
+                    yield revision
+
+    async def get_item_revision(
+        self,
+        collection: str,
+        id: int,
+        offset: int,
+        fields: RequestFields = ["*"],
+        meta: RequestMeta = [],
+    ) -> Tuple[Revision, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#retrieve-an-item-revision
+
+        Returns
+        -------
+            (revision, Metadata)
+        """
+        path = "/".join(["items", collection, str(id), "revisions", str(offset)])
+
+        params = fields_params(fields)
+
+        return await self.ApiClient.do_get(path, params=params, meta=meta)
+
+    async def revert_item_revision(
+        self,
+        collection: str,
+        id: int,
+        revision: int,
+        fields: RequestFields = ["*"],
+        meta: RequestMeta = [],
+    ) -> Tuple[Revision, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#revert-to-a-given-revision
+
+        Returns
+        -------
+            (Item, Metadata)
+        """
+        path = "/".join(["items", collection, str(id), "revert"])
+
+        params = fields_params(fields)
+
+        response_data, response_meta = await self.ApiClient.do_patch(
+            path=path, id=revision, params=params, meta=meta
+        )
+        self.ApiClient.invalidate("/".join(["items", collection, str(id)]))
+
+        return response_data, response_meta
+
+    async def _get_list_after(
+        self,
+        path: str,
+        params: RequestParams,
+        sort: List[str],
+        after: dict,
+        limit: int,
+        meta: RequestMeta,
+    ) -> Tuple[List[dict], ResponseMeta]:
+        """
+        Fetch up to `limit` rows following `after` in `sort` order, running through
+        the keyset filters until enough rows are found
+        """
+        check_keyset_params(params)
+        params = {
+            key: value for key, value in params.items() if key not in ("offset", "page")
+        }
+
+        response_data: List[dict] = []
+        response_meta: ResponseMeta = {}
+        for keyset in keyset_filters(sort, after):
+            data, response_meta = await self.ApiClient.do_get(
+                path,
+                params={
+                    **params,
+                    **filter_params(keyset),
+                    "limit": limit - len(response_data),
+                },
+                meta=meta,
+            )
+            response_data += data
+            if len(response_data) >= limit:
+                break
+
+        return response_data, response_meta
+
+    """
+
+    Files
+    https://docs.directus.io/api/files.html
+
+    """
+
+    async def get_files_list(
+        self,
+        fields: RequestFields = ["*"],
+        limit: int = 100,
+        offset: int = 0,
+        sort: List[str] = ["id"],
+        single: bool = False,
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        query: Optional[Query] = None,
+    ) -> Tuple[List[File], ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/files.html#list-the-files
+
+        If single, only return first corresponding result from list
+
+        A compiled query replaces fields, sort, filter, status and q, as in
+        get_items_list
+
+        Returns
+        -------
+            (List of File, Metadata)
+        """
+        path = "files"
+
+        params = list_params(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            single=single,
+            filter=filter,
+            status=status,
+            q=q,
+            query=query,
+        )
+
+        response_data, response_meta = await self.ApiClient.do_get(
+            path, params=params, meta=meta
+        )
+
+        return list(response_data), response_meta
+
+    async def get_file(
+        self, id: int, fields: RequestFields = ["*"], meta: RequestMeta = []
+    ) -> Tuple[File, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/files.html#retrieve-a-file
+
+        Returns
+        -------
+            (File, Metadata)
+        """
+        path = "/".join(["files", str(id)])
+
+        params = fields_params(fields)
+
+        return await self.ApiClient.do_get(path=path, params=params, meta=meta)
+
+    async def create_file(
+        self,
+        data: str,
+        filename_download: Optional[str] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        tags: Optional[str] = None,
+        metadata: Optional[str] = None,
+        meta: RequestMeta = [],
+    ) -> Tuple[File, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/files.html#create-a-file
+
+        Returns
+        -------
+            (File, Metadata)
+        """
+        path = "files"
+
+        file = file_data(
+            data=data,
+            filename_download=filename_download,
+            title=title,
+            description=description,
+            location=location,
+            tags=tags,
+            metadata=metadata,
+        )
+
+        return await self.ApiClient.do_post(path=path, data=file, meta=meta)
+
+    async def upload_file(
+        self,
+        file: FileSource,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        filename_download: Optional[str] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        tags: Optional[str] = None,
+        metadata: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        meta: RequestMeta = [],
+    ) -> Tuple[File, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/files.html#create-a-file
+
+        Upload a file from a path, a binary file object or an iterable of bytes as a
+        multipart/form-data body streamed `chunk_size` bytes at a time, instead of a
+        base64 string held in memory. `progress` is called with (bytes sent, total
+        bytes or None) after each chunk.
+
+        Returns
+        -------
+            (File, Metadata)
+        """
+        path = "files"
+
+        body = MultipartBody(
+            fields=file_data(
+                filename_download=filename_download,
+                title=title,
+                description=description,
+                location=location,
+                tags=tags,
+                metadata=metadata,
+            ),
+            file=file,
+            filename=filename,
+            content_type=content_type,
+            chunk_size=chunk_size,
+            progress=progress,
+        )
+
+        return await self.ApiClient.do_upload(path=path, body=body, meta=meta)
+
+    """
+
+    Mail
+    https://docs.directus.io/api/mail.html
+
+    """
+
+    async def send_email(
+        self,
+        send_to: List[str],
+        subject: str,
+        body: str,
+        type: Optional[str] = "txt",
+        data: Optional[dict] = {},
+    ) -> Tuple[dict, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/mail.html#send-an-email
+
+        Returns
+        -------
+            (Empty body, Metadata)
+        """
+        path = "mail"
+        email = email_data(
+            send_to=send_to, subject=subject, body=body, type=type, data=data
+        )
+        return await self.ApiClient.do_post(path=path, data=email)
@@ -1,13 +1,74 @@
 # -*- coding: utf-8 -*-
 
-from dataclasses import asdict
-from typing import List, Optional, Tuple, Union
+from os import PathLike, fspath, makedirs
+from os.path import basename, exists, getsize, join
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from requests import RequestException, Response
 
 from .exceptions import DirectusException
-from .utils import ApiClient
+from .utils import ApiClient, Transport
+from .utils.bulk import BulkResult, chunked, run_chunks
+from .utils.cache import ReadCache
+from .utils.codec import JsonCodec
+from .utils.compression import Compression
+from .utils.download import FILE_DOWNLOAD_FIELDS, PART_SIZE, ByteRange, download
+from .utils.export import (
+    ExportDestination,
+    ExportStats,
+    check_format,
+    export,
+    schema_columns,
+)
+from .utils.hooks import Hooks
+from .utils.loader import (
+    ItemLoader,
+    Prefetch,
+    attach_relations,
+    relation_ids,
+)
+from .utils.multipart import (
+    CHUNK_SIZE,
+    FileSource,
+    MultipartBody,
+    ProgressCallback,
+)
+from .utils.pagination import (
+    check_keyset_params,
+    iter_keyset_pages,
+    iter_pages,
+    iter_pages_parallel,
+    keyset_filters,
+)
+from .utils.params import (
+    collection_data,
+    email_data,
+    fields_params,
+    file_data,
+    filter_params,
+    list_params,
+)
+from .utils.query import Query
+from .utils.records import Record, record_class, schema_fields, to_records
+from .utils.retry import CircuitBreaker, RetryPolicy
+from .utils.throttle import Throttle
+from .utils.writer import BufferedWriter, WriteFailure
 from .typing import (
     RequestMeta,
     RequestFields,
+    RequestParams,
     ResponseMeta,
     Collection,
     Item,
@@ -35,6 +96,57 @@ class DirectusClient:
 
     project: str
         The name of the project you want to access on the specified server
+
+    transport: Transport
+        An optional pooled HTTP transport, which can be shared between several
+        clients pointing at the same server. When not provided, the client creates
+        its own and closes it with the client.
+
+    codec: JsonCodec
+        The codec used to serialize request bodies and parse responses, the standard
+        library `json` module by default (see `directus.utils.codec.fastest_codec`)
+
+    refresh_margin: float
+        The access token is refreshed when it expires within this number of seconds
+
+    background_refresh: bool
+        If True, the access token is refreshed by a background thread ahead of its
+        expiry, so that requests never wait for a refresh
+
+    cache: ReadCache
+        An optional cache serving get_item and get_collection, invalidated by the
+        writes sent through this client (see `directus.utils.cache.ReadCache`)
+
+    retry: RetryPolicy
+        An optional policy retrying the requests that fail with a connection error
+        or a transient status, with exponential backoff (see
+        `directus.utils.retry.RetryPolicy`)
+
+    circuit_breaker: CircuitBreaker
+        An optional per-host circuit breaker, failing requests fast while the server
+        is unhealthy. It can be shared by several clients.
+
+    throttle: Throttle
+        Optional rate and concurrency limits, client-wide and per endpoint group,
+        which can adapt to the load of the server (see
+        `directus.utils.throttle.Throttle`). It can be shared by several clients.
+
+    coalesce: bool
+        If True, concurrent identical GET requests (same path, params and user)
+        share a single HTTP request, each caller getting its own copy of the result
+
+    hooks: Hooks
+        Optional callbacks reporting each request, its timings and its outcome (see
+        `directus.utils.hooks.Hooks`, `directus.utils.metrics.MetricsCollector`)
+
+    lazy_auth: bool
+        If True, the client authenticates on its first request instead of in the
+        constructor
+
+    compression: Compression
+        Optional compression of the responses and of the large request bodies (see
+        `directus.utils.compression.Compression`). It can be shared by several
+        clients.
     """
 
     def __init__(
@@ -43,6 +155,18 @@ class DirectusClient:
         email: Optional[str] = None,
         password: Optional[str] = None,
         project: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        codec: Optional[JsonCodec] = None,
+        refresh_margin: float = 60,
+        background_refresh: bool = False,
+        cache: Optional[ReadCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[Throttle] = None,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        lazy_auth: bool = False,
+        compression: Optional[Compression] = None,
     ):
         if not url:
             raise DirectusException("You must provide a server url")
@@ -57,8 +181,37 @@ class DirectusClient:
             raise DirectusException("You must provide a password")
 
         self.ApiClient = ApiClient(
-            url=url, email=email, password=password, project=project
+            url=url,
+            email=email,
+            password=password,
+            project=project,
+            transport=transport,
+            codec=codec,
+            refresh_margin=refresh_margin,
+            background_refresh=background_refresh,
+            cache=cache,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            throttle=throttle,
+            coalesce=coalesce,
+            hooks=hooks,
+            lazy_auth=lazy_auth,
+            compression=compression,
         )
+        self._record_classes: Dict[str, Type[Record]] = {}
+
+    def close(self) -> None:
+        """
+        Release the connections held by the client. A transport shared with other
+        clients is left open and must be closed by its owner.
+        """
+        self.ApiClient.close()
+
+    def __enter__(self) -> "DirectusClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     """
 
@@ -98,7 +251,7 @@ class DirectusClient:
         """
         path = "/".join(["collections", collection])
 
-        return self.ApiClient.do_get(path=path, meta=meta)
+        return self.ApiClient.do_get(path=path, meta=meta, cached=True)
 
     def create_collection(
         self, collection: Collection, meta: RequestMeta = []
@@ -112,7 +265,9 @@ class DirectusClient:
         """
         path = "collections"
 
-        return self.ApiClient.do_post(path=path, data=asdict(collection), meta=meta)
+        return self.ApiClient.do_post(
+            path=path, data=collection_data(collection), meta=meta
+        )
 
     def update_collection(
         self, collection: str, data: dict, meta: RequestMeta = []
@@ -129,6 +284,8 @@ class DirectusClient:
         response_data, response_meta = self.ApiClient.do_patch(
             path=path, id=collection, data=data, meta=meta
         )
+        self.ApiClient.invalidate("/".join([path, collection]))
+        self._record_classes.pop(collection, None)
 
         return response_data, response_meta
 
@@ -143,6 +300,8 @@ class DirectusClient:
         path = "collections"
 
         is_deleted = self.ApiClient.do_delete(path=path, id=collection)
+        self.ApiClient.invalidate("/".join([path, collection]))
+        self._record_classes.pop(collection, None)
 
         return is_deleted
 
@@ -166,6 +325,10 @@ class DirectusClient:
         status: Optional[str] = None,
         q: Optional[str] = None,
         meta: RequestMeta = [],
+        after: Optional[Item] = None,
+        prefetch: Prefetch = {},
+        records: bool = False,
+        query: Optional[Query] = None,
     ) -> Tuple[List[Item], ResponseMeta]:
         """
         Find out more: https://docs.directus.io/api/items.html#list-the-items
@@ -174,32 +337,137 @@ class DirectusClient:
 
         If single, only return first corresponding result from list
 
+        If after is set, return the items following this one in sort order (keyset
+        pagination), instead of using an offset or a page. The sort fields must be
+        part of the retrieved fields and identify an item uniquely.
+
+        prefetch maps relation fields to their related collection, e.g.
+        {"team": "teams"}: the ids held by these fields are replaced by the related
+        items, fetched with one request per related collection (see loader)
+
+        If records, items are returned as compact Record objects, readable as
+        attributes or mapping keys, instead of dicts (see record_class)
+
+        A compiled query (see directus.utils.query.Query) replaces fields, sort,
+        filter, status and q, and can be reused across calls
+
         Returns
         -------
             (List of Item, Metadata)
         """
         path = "/".join(["items", collection])
 
-        params = {
-            "fields": ",".join(fields),
-            "limit": limit,
-            "offset": offset,
-            "sort": ",".join(sort),
-            "single": single,
-            "filter": filter,
-            "status": status,
-            "q": q,
-        }
+        params = list_params(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            page=page,
+            sort=sort,
+            single=single,
+            filter=filter,
+            status=status,
+            q=q,
+            query=query,
+        )
+        if query is not None:
+            sort = list(query.sort)
+
+        # Items, or Records if records
+        response_data: Any
+        if after is not None:
+            response_data, response_meta = self._get_list_after(
+                path, params=params, sort=sort, after=after, limit=limit, meta=meta
+            )
+        else:
+            data, response_meta = self.ApiClient.do_get(path, params=params, meta=meta)
+            response_data = list(data)
 
-        if page:
-            params["page"] = page
-            del params["offset"]
+        if prefetch:
+            self._prefetch(response_data, prefetch, self.loader())
 
-        response_data, response_meta = self.ApiClient.do_get(
-            path, params=params, meta=meta
-        )
+        if records:
+            response_data = to_records(self.record_class(collection), response_data)
 
-        return list(response_data), response_meta
+        return response_data, response_meta
+
+    def iter_items(
+        self,
+        collection: str,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        limit: int = 100,
+        page: int = 1,
+        pages: bool = False,
+        read_ahead: bool = True,
+        max_in_flight: int = 1,
+        ordered: bool = True,
+        keyset: bool = False,
+        prefetch: Prefetch = {},
+        records: bool = False,
+        query: Optional[Query] = None,
+    ) -> Iterator[Union[Item, List[Item]]]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-the-items
+
+        Lazily run through pagination, `limit` items at a time. With read_ahead, the
+        next page is fetched while the current one is being consumed, so that no
+        more than two pages are ever held in memory.
+
+        If pages, yield each page as a list instead of the items one by one
+
+        If max_in_flight is greater than 1, the page count is read from the first
+        page and the following pages are fetched concurrently. Unless ordered, pages
+        are then yielded as soon as they are received rather than in page order.
+
+        If keyset, each page is requested as the items following the last item of the
+        previous page (see get_items_list), which stays fast and stable on large
+        collections being written to. page, read_ahead and max_in_flight are then
+        not taken into account.
+
+        With prefetch, the relations of each page are resolved as in
+        get_items_list, each related item being fetched once per page. The related
+        items are forgotten once their page is yielded, so that a long iteration
+        does not accumulate them
+
+        If records, items are yielded as compact Record objects (see record_class)
+
+        A compiled query replaces fields, sort, filter, status and q, as in
+        get_items_list
+
+        Returns
+        -------
+            Iterator of Item (or of List of Item)
+        """
+        loader = self.loader() if prefetch else None
+        for page_data, _ in self._iter_items_pages(
+            collection=collection,
+            fields=fields,
+            sort=sort,
+            filter=filter,
+            status=status,
+            q=q,
+            meta=meta,
+            limit=limit,
+            page=page,
+            read_ahead=read_ahead,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            keyset=keyset,
+            records=records,
+            query=query,
+        ):
+            if loader is not None:
+                self._prefetch(page_data, prefetch, loader)
+            if pages:
+                yield page_data
+            else:
+                yield from page_data
+            if loader is not None:
+                loader.clear()
 
     def get_all_items_list(
         self,
@@ -211,46 +479,234 @@ class DirectusClient:
         q: Optional[str] = None,
         meta: RequestMeta = [],
         page: int = 1,
+        max_in_flight: int = 1,
+        records: bool = False,
+        query: Optional[Query] = None,
     ) -> Tuple[List[Item], ResponseMeta]:
         """
         Find out more: https://docs.directus.io/api/items.html#list-the-items
 
+        Prefer iter_items for large collections, as this loads every item in memory
+
+        If max_in_flight is greater than 1, the page count is read from the first
+        page and the following pages are fetched concurrently
+
+        If records, items are returned as compact Record objects (see record_class)
+
+        A compiled query replaces fields, sort, filter, status and q, as in
+        get_items_list
+
         Returns
         -------
-            (List of Item, Metadata)
+            (List of Item, Metadata of the first page)
         """
-        path = "/".join(["items", collection])
+        response_data: List[Item] = []
+        response_meta: Optional[ResponseMeta] = None
 
-        if "page" not in meta:
-            meta.append("page")
-
-        response_data, response_meta = self.get_items_list(
+        for page_data, page_meta in self._iter_items_pages(
             collection=collection,
             fields=fields,
             sort=sort,
             filter=filter,
-            page=page,
             status=status,
             q=q,
             meta=meta,
-        )
+            page=page,
+            max_in_flight=max_in_flight,
+            records=records,
+            query=query,
+        ):
+            response_data += page_data
+            if response_meta is None:
+                response_meta = page_meta
 
-        if int(response_meta["page"]) < int(response_meta["page_count"]):
-            next_page = int(response_meta["page"]) + 1
-            recursive_data, _ = self.get_all_items_list(
+        return response_data, response_meta or {}
+
+    def _iter_items_pages(
+        self,
+        collection: str,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        limit: int = 100,
+        page: int = 1,
+        read_ahead: bool = True,
+        max_in_flight: int = 1,
+        ordered: bool = True,
+        keyset: bool = False,
+        records: bool = False,
+        query: Optional[Query] = None,
+    ) -> Iterator[Tuple[List[Item], ResponseMeta]]:
+        if keyset:
+            check_keyset_params(list_params(filter=filter, query=query))
+
+            def fetch_after(after: Optional[Item]) -> Tuple[List[Item], ResponseMeta]:
+                return self.get_items_list(
+                    collection=collection,
+                    fields=fields,
+                    limit=limit,
+                    sort=sort,
+                    filter=filter,
+                    status=status,
+                    q=q,
+                    meta=meta,
+                    after=after,
+                    records=records,
+                    query=query,
+                )
+
+            return iter_keyset_pages(fetch_after, limit=limit)
+
+        if "page" not in meta:
+            meta = [*meta, "page"]
+
+        def fetch(page: int) -> Tuple[List[Item], ResponseMeta]:
+            return self.get_items_list(
                 collection=collection,
                 fields=fields,
-                page=next_page,
+                page=page,
+                limit=limit,
                 sort=sort,
                 filter=filter,
                 status=status,
                 q=q,
                 meta=meta,
+                records=records,
+                query=query,
             )
 
-            response_data += recursive_data
+        if max_in_flight > 1:
+            return iter_pages_parallel(
+                fetch,
+                page=page,
+                limit=limit,
+                max_in_flight=max_in_flight,
+                ordered=ordered,
+            )
 
-        return response_data, response_meta
+        return iter_pages(fetch, page=page, limit=limit, read_ahead=read_ahead)
+
+    def export_items(
+        self,
+        collection: str,
+        dest: ExportDestination,
+        format: str = "ndjson",
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        status: Optional[str] = None,
+        q: Optional[str] = None,
+        limit: int = 100,
+        max_in_flight: int = 1,
+        keyset: bool = False,
+        schema: bool = True,
+    ) -> ExportStats:
+        """
+        Export the items of a collection to `dest` (a path or a binary file object)
+        as `ndjson`, `csv`, `parquet` or `arrow` (the last two require pyarrow).
+        Items are written page by page as they are received, so that the whole
+        collection is never held in memory. Pagination works as in iter_items.
+
+        With schema, the columns and their types are taken from the fields of the
+        collection (see get_collection), otherwise from the first page.
+
+        Returns
+        -------
+            ExportStats (rows, pages, bytes written and duration)
+        """
+        check_format(format)
+
+        columns = None
+        if schema and format != "ndjson":
+            collection_info, _ = self.get_collection(collection=collection)
+            columns = schema_columns(collection_info.get("fields") or {}, fields)
+
+        pages = (
+            page_data
+            for page_data, _ in self._iter_items_pages(
+                collection=collection,
+                fields=fields,
+                sort=sort,
+                filter=filter,
+                status=status,
+                q=q,
+                limit=limit,
+                max_in_flight=max_in_flight,
+                keyset=keyset,
+            )
+        )
+
+        return export(
+            pages, dest, format=format, columns=columns, codec=self.ApiClient.codec
+        )
+
+    def loader(
+        self,
+        fields: RequestFields = ["*"],
+        primary_key: str = "id",
+        max_batch_size: int = 100,
+        max_url_length: int = 2000,
+    ) -> ItemLoader:
+        """
+        Batch the items requested by id: the ids requested with `load` are fetched
+        together once a result is needed (or on `dispatch`), with one `in` filtered
+        request per collection and batch of ids
+
+        Returns
+        -------
+            ItemLoader
+        """
+        if "*" not in fields and primary_key not in fields:
+            fields = [*fields, primary_key]
+
+        def fetch(collection: str, ids: List[Hashable]) -> List[Item]:
+            items, _ = self.get_items_list(
+                collection=collection,
+                fields=fields,
+                filter={primary_key: {"in": ids}},
+                limit=len(ids),
+                sort=[primary_key],
+            )
+            return items
+
+        return ItemLoader(
+            fetch,
+            primary_key=primary_key,
+            max_batch_size=max_batch_size,
+            max_url_length=max_url_length,
+        )
+
+    def _prefetch(
+        self, items: List[Item], prefetch: Prefetch, loader: ItemLoader
+    ) -> None:
+        for collection, ids in relation_ids(items, prefetch).items():
+            for id in ids:
+                loader.load(collection, id)
+        loader.dispatch()
+        attach_relations(
+            items, prefetch, lambda collection, id: loader.load(collection, id).result()
+        )
+
+    def record_class(self, collection: str) -> Type[Record]:
+        """
+        The compact Record class of the items of a collection, generated from its
+        fields (see get_collection). The fields are read once per client, until
+        the collection is updated through it.
+
+        Returns
+        -------
+            Record subclass
+        """
+        if collection not in self._record_classes:
+            collection_info, _ = self.get_collection(collection=collection)
+            self._record_classes[collection] = record_class(
+                collection, schema_fields(collection_info.get("fields") or {})
+            )
+
+        return self._record_classes[collection]
 
     def get_item(
         self,
@@ -258,19 +714,30 @@ class DirectusClient:
         id: int,
         fields: RequestFields = ["*"],
         meta: RequestMeta = [],
+        records: bool = False,
     ) -> Tuple[Item, ResponseMeta]:
         """
         Find out more: https://docs.directus.io/api/items.html#retrieve-an-item
 
+        If records, the item is returned as a compact Record (see record_class)
+
         Returns
         -------
             (Item, Metadata)
         """
         path = "/".join(["items", collection, str(id)])
 
-        params = {"fields": ",".join(fields)}
+        params = fields_params(fields)
 
-        return self.ApiClient.do_get(path=path, params=params, meta=meta)
+        # An Item, or a Record if records
+        response_data: Any
+        response_data, response_meta = self.ApiClient.do_get(
+            path=path, params=params, meta=meta, cached=True
+        )
+        if records:
+            response_data = self.record_class(collection)(response_data)
+
+        return response_data, response_meta
 
     def create_item(
         self, collection: str, item: Item, meta: RequestMeta = []
@@ -303,7 +770,12 @@ class DirectusClient:
         """
         path = "/".join(["items", collection])
 
-        return self.ApiClient.do_patch(path=path, id=id, data=data, meta=meta)
+        response_data, response_meta = self.ApiClient.do_patch(
+            path=path, id=id, data=data, meta=meta
+        )
+        self.ApiClient.invalidate("/".join([path, str(id)]))
+
+        return response_data, response_meta
 
     def delete_item(self, collection: str, id: int) -> bool:
         """
@@ -315,7 +787,167 @@ class DirectusClient:
         """
         path = "/".join(["items", collection])
 
-        return self.ApiClient.do_delete(path=path, id=id)
+        is_deleted = self.ApiClient.do_delete(path=path, id=id)
+        self.ApiClient.invalidate("/".join([path, str(id)]))
+
+        return is_deleted
+
+    def create_items(
+        self,
+        collection: str,
+        items: Iterable[Item],
+        chunk_size: int = 100,
+        max_bytes: Optional[int] = None,
+        max_in_flight: int = 1,
+        meta: RequestMeta = [],
+    ) -> BulkResult:
+        """
+        Find out more: https://docs.directus.io/api/items.html#create-an-item
+
+        Create items in bulk, `chunk_size` items (and at most `max_bytes` of JSON) per
+        request, with up to `max_in_flight` requests at a time. A failing chunk does
+        not prevent the others from being sent.
+
+        Returns
+        -------
+            BulkResult (created items in data, items of failed chunks in failed)
+        """
+        path = "/".join(["items", collection])
+
+        def send(chunk: List[Item]) -> List[Item]:
+            response_data, _ = self.ApiClient.do_post(path=path, data=chunk, meta=meta)
+            return list(response_data)
+
+        return run_chunks(
+            chunked(
+                items,
+                chunk_size=chunk_size,
+                max_bytes=max_bytes,
+                size_of=lambda item: len(self.ApiClient.codec.dumps(item)),
+            ),
+            send,
+            max_in_flight=max_in_flight,
+        )
+
+    def update_items(
+        self,
+        collection: str,
+        items: Iterable[Item],
+        chunk_size: int = 100,
+        max_bytes: Optional[int] = None,
+        max_in_flight: int = 1,
+        meta: RequestMeta = [],
+    ) -> BulkResult:
+        """
+        Find out more: https://docs.directus.io/api/items.html#update-items
+
+        Update items in bulk, each item carrying its primary key along with the
+        fields to update. Chunking works as in create_items.
+
+        Returns
+        -------
+            BulkResult (updated items in data, items of failed chunks in failed)
+        """
+        path = "/".join(["items", collection])
+
+        def send(chunk: List[Item]) -> List[Item]:
+            response_data, _ = self.ApiClient.do_patch(path=path, data=chunk, meta=meta)
+            # The primary key field is not known here, drop the whole collection
+            self.ApiClient.invalidate(path)
+            return list(response_data)
+
+        return run_chunks(
+            chunked(
+                items,
+                chunk_size=chunk_size,
+                max_bytes=max_bytes,
+                size_of=lambda item: len(self.ApiClient.codec.dumps(item)),
+            ),
+            send,
+            max_in_flight=max_in_flight,
+        )
+
+    def delete_items(
+        self,
+        collection: str,
+        ids: Iterable[int],
+        chunk_size: int = 100,
+        max_in_flight: int = 1,
+    ) -> BulkResult:
+        """
+        Find out more: https://docs.directus.io/api/items.html#delete-items
+
+        Delete items in bulk, `chunk_size` ids per request, with up to `max_in_flight`
+        requests at a time
+
+        Returns
+        -------
+            BulkResult (ids of failed chunks in failed)
+        """
+        path = "/".join(["items", collection])
+
+        def send(chunk: List[int]) -> List[int]:
+            ids = ",".join(str(id) for id in chunk)
+            if not self.ApiClient.do_delete(path=path, id=ids):
+                raise DirectusException(f"Items {ids} were not deleted")
+            for id in chunk:
+                self.ApiClient.invalidate("/".join([path, str(id)]))
+            return []
+
+        return run_chunks(
+            chunked(ids, chunk_size=chunk_size), send, max_in_flight=max_in_flight
+        )
+
+    def writer(
+        self,
+        primary_key: str = "id",
+        flush_size: int = 100,
+        flush_interval: Optional[float] = 1.0,
+        max_buffered: int = 10000,
+        max_in_flight: int = 1,
+        on_error: Optional[Callable[[WriteFailure], None]] = None,
+    ) -> BufferedWriter:
+        """
+        A write-behind buffer queuing creates, updates and deletes per collection and
+        sending them with create_items, update_items and delete_items, up to
+        `flush_size` records per request. Patches of the same item are merged and
+        updates of items deleted later are dropped (see
+        `directus.utils.writer.BufferedWriter`). Close the writer, or use it as a
+        context manager, so that no write is left in the buffer.
+
+            with client.writer(flush_interval=2) as writer:
+                for event in events:
+                    writer.update("sports", event["id"], {"score": event["score"]})
+
+        Returns
+        -------
+            BufferedWriter
+        """
+        return BufferedWriter(
+            create=lambda collection, items: self.create_items(
+                collection=collection,
+                items=items,
+                chunk_size=flush_size,
+                max_in_flight=max_in_flight,
+            ),
+            update=lambda collection, items: self.update_items(
+                collection=collection,
+                items=items,
+                chunk_size=flush_size,
+                max_in_flight=max_in_flight,
+            ),
+            delete=lambda collection, ids: self.delete_items(
+                collection=collection,
+                ids=ids,
+                chunk_size=flush_size,
+                max_in_flight=max_in_flight,
+            ),
+            primary_key=primary_key,
+            flush_size=flush_size,
+            flush_interval=flush_interval,
+            max_buffered=max_buffered,
+            on_error=on_error,
+        )
 
     def get_item_revisions_list(
         self,
@@ -330,6 +962,8 @@ class DirectusClient:
         filter: dict = {},
         q: Optional[str] = None,
         meta: RequestMeta = [],
+        after: Optional[Revision] = None,
+        query: Optional[Query] = None,
     ) -> Tuple[List[Revision], ResponseMeta]:
         """
         Find out more: https://docs.directus.io/api/items.html#list-item-revisions
@@ -338,25 +972,35 @@ class DirectusClient:
 
         If single, only return first corresponding result from list
 
+        If after is set, return the revisions following this one in sort order
+        (keyset pagination), instead of using an offset or a page
+
+        A compiled query replaces fields, sort, filter and q, as in get_items_list
+
         Returns
         -------
             (List of revision, Metadata)
         """
         path = "/".join(["items", collection, str(id), "revisions"])
 
-        params = {
-            "fields": ",".join(fields),
-            "limit": limit,
-            "offset": offset,
-            "sort": ",".join(sort),
-            "single": single,
-            "filter": filter,
-            "q": q,
-        }
+        params = list_params(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            page=page,
+            sort=sort,
+            single=single,
+            filter=filter,
+            q=q,
+            query=query,
+        )
+        if query is not None:
+            sort = list(query.sort)
 
-        if page:
-            params["page"] = page
-            del params["offset"]
+        if after is not None:
+            return self._get_list_after(
+                path, params=params, sort=sort, after=after, limit=limit, meta=meta
+            )
 
         response_data, response_meta = self.ApiClient.do_get(
             path, params=params, meta=meta
@@ -364,6 +1008,76 @@ class DirectusClient:
 
         return list(response_data), response_meta
 
+    def iter_item_revisions(
+        self,
+        collection: str,
+        id: int,
+        fields: RequestFields = ["*"],
+        sort: List[str] = ["id"],
+        filter: dict = {},
+        q: Optional[str] = None,
+        meta: RequestMeta = [],
+        limit: int = 100,
+        pages: bool = False,
+        keyset: bool = False,
+    ) -> Iterator[Union[Revision, List[Revision]]]:
+        """
+        Find out more: https://docs.directus.io/api/items.html#list-item-revisions
+
+        Lazily run through the revisions of an item, `limit` revisions at a time
+
+        If pages, yield each page as a list instead of the revisions one by one
+
+        If keyset, each page is requested as the revisions following the last one of
+        the previous page (see get_item_revisions_list)
+
+        Returns
+        -------
+            Iterator of revision (or of List of revision)
+        """
+
+        def fetch(page: int) -> Tuple[List[Revision], ResponseMeta]:
+            return self.get_item_revisions_list(
+                collection=collection,
+                id=id,
+                fields=fields,
+                limit=limit,
+                page=page,
+                sort=sort,
+                filter=filter,
+                q=q,
+                meta=meta if "page" in meta else [*meta, "page"],
+            )
+
+        def fetch_after(
+            after: Optional[Revision],
+        ) -> Tuple[List[Revision], ResponseMeta]:
+            return self.get_item_revisions_list(
+                collection=collection,
+                id=id,
+                fields=fields,
+                limit=limit,
+                sort=sort,
+                filter=filter,
+                q=q,
+                meta=meta,
+                after=after,
+            )
+
+        if keyset:
+            check_keyset_params(list_params(filter=filter))
+        page_iterator = (
+            iter_keyset_pages(fetch_after, limit=limit)
+            if keyset
+            else iter_pages(fetch, limit=limit)
+        )
+
+        for page_data, _ in page_iterator:
+            if pages:
+                yield page_data
+            else:
+                yield from page_data
+
     def get_item_revision(
         self,
         collection: str,
@@ -381,7 +1095,7 @@ class DirectusClient:
         """
         path = "/".join(["items", collection, str(id), "revisions", str(offset)])
 
-        params = {"fields": ",".join(fields)}
+        params = fields_params(fields)
 
         return self.ApiClient.do_get(path, params=params, meta=meta)
 
@@ -402,9 +1116,50 @@ class DirectusClient:
         """
         path = "/".join(["items", collection, str(id), "revert"])
 
-        params = {"fields": ",".join(fields)}
+        params = fields_params(fields)
+
+        response_data, response_meta = self.ApiClient.do_patch(
+            path=path, id=revision, params=params, meta=meta
+        )
+        self.ApiClient.invalidate("/".join(["items", collection, str(id)]))
+
+        return response_data, response_meta
 
-        return self.ApiClient.do_patch(path=path, id=revision, params=params, meta=meta)
+    def _get_list_after(
+        self,
+        path: str,
+        params: RequestParams,
+        sort: List[str],
+        after: dict,
+        limit: int,
+        meta: RequestMeta,
+    ) -> Tuple[List[dict], ResponseMeta]:
+        """
+        Fetch up to `limit` rows following `after` in `sort` order, running through
+        the keyset filters until enough rows are found
+        """
+        check_keyset_params(params)
+        params = {
+            key: value for key, value in params.items() if key not in ("offset", "page")
+        }
+
+        response_data: List[dict] = []
+        response_meta: ResponseMeta = {}
+        for keyset in keyset_filters(sort, after):
+            data, response_meta = self.ApiClient.do_get(
+                path,
+                params={
+                    **params,
+                    **filter_params(keyset),
+                    "limit": limit - len(response_data),
+                },
+                meta=meta,
+            )
+            response_data += data
+            if len(response_data) >= limit:
+                break
+
+        return response_data, response_meta
 
     """
 
@@ -424,28 +1179,33 @@ class DirectusClient:
         status: Optional[str] = None,
         q: Optional[str] = None,
         meta: RequestMeta = [],
+        query: Optional[Query] = None,
     ) -> Tuple[List[File], ResponseMeta]:
         """
         Find out more: https://docs.directus.io/api/files.html#list-the-files
 
         If single, only return first corresponding result from list
 
+        A compiled query replaces fields, sort, filter, status and q, as in
+        get_items_list
+
         Returns
         -------
             (List of File, Metadata)
         """
         path = "files"
 
-        params = {
-            "fields": ",".join(fields),
-            "limit": limit,
-            "offset": offset,
-            "sort": ",".join(sort),
-            "single": single,
-            "filter": filter,
-            "status": status,
-            "q": q,
-        }
+        params = list_params(
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            single=single,
+            filter=filter,
+            status=status,
+            q=q,
+            query=query,
+        )
 
         response_data, response_meta = self.ApiClient.do_get(
             path, params=params, meta=meta
@@ -465,7 +1225,7 @@ class DirectusClient:
         """
         path = "/".join(["files", str(id)])
 
-        params = {"fields": ",".join(fields)}
+        params = fields_params(fields)
 
         return self.ApiClient.do_get(path=path, params=params, meta=meta)
 
@@ -489,22 +1249,169 @@ class DirectusClient:
         """
         path = "files"
 
-        params = {"data": data}
+        file = file_data(
+            data=data,
+            filename_download=filename_download,
+            title=title,
+            description=description,
+            location=location,
+            tags=tags,
+            metadata=metadata,
+        )
+
+        return self.ApiClient.do_post(path=path, data=file, meta=meta)
+
+    def upload_file(
+        self,
+        file: FileSource,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        filename_download: Optional[str] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        tags: Optional[str] = None,
+        metadata: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        meta: RequestMeta = [],
+    ) -> Tuple[File, ResponseMeta]:
+        """
+        Find out more: https://docs.directus.io/api/files.html#create-a-file
+
+        Upload a file from a path, a binary file object or an iterable of bytes as a
+        multipart/form-data body streamed `chunk_size` bytes at a time, instead of a
+        base64 string held in memory. `progress` is called with (bytes sent, total
+        bytes or None) after each chunk.
+
+        Returns
+        -------
+            (File, Metadata)
+        """
+        path = "files"
+
+        body = MultipartBody(
+            fields=file_data(
+                filename_download=filename_download,
+                title=title,
+                description=description,
+                location=location,
+                tags=tags,
+                metadata=metadata,
+            ),
+            file=file,
+            filename=filename,
+            content_type=content_type,
+            chunk_size=chunk_size,
+            progress=progress,
+        )
+
+        return self.ApiClient.do_upload(path=path, body=body, meta=meta)
 
-        if filename_download:
-            params["filename_downlad"] = filename_download
-        if title:
-            params["title"] = title
-        if description:
-            params["description"] = description
-        if location:
-            params["location"] = location
-        if tags:
-            params["tags"] = tags
-        if metadata:
-            params["metadata"] = metadata
+    def download_file(
+        self,
+        id: int,
+        dest: Union[str, PathLike],
+        chunk_size: int = CHUNK_SIZE,
+        part_size: int = PART_SIZE,
+        max_in_flight: int = 4,
+        resume: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """
+        Download the content of a file to `dest`, streamed to disk `chunk_size` bytes
+        at a time. Files bigger than `part_size` are fetched as concurrent range
+        requests, up to `max_in_flight` at a time. With `resume`, an interrupted
+        download restarts from the `.part` file left next to `dest`.
 
-        return self.ApiClient.do_post(path=path, data=params, meta=meta)
+        Returns
+        -------
+            str (the path of the downloaded file)
+        """
+        file, _ = self.get_file(id=id, fields=FILE_DOWNLOAD_FIELDS)
+
+        return self._download(
+            file,
+            dest,
+            chunk_size=chunk_size,
+            part_size=part_size,
+            max_in_flight=max_in_flight,
+            resume=resume,
+            progress=progress,
+        )
+
+    def download_files(
+        self,
+        dest: Union[str, PathLike],
+        filter: dict = {},
+        q: Optional[str] = None,
+        limit: int = 100,
+        max_in_flight: int = 4,
+        chunk_size: int = CHUNK_SIZE,
+        skip_existing: bool = True,
+    ) -> BulkResult:
+        """
+        Download the files matching `filter` and `q` into the `dest` directory, under
+        their name on the server storage, with up to `max_in_flight` files downloaded
+        at a time. With `skip_existing`, files already present with the same size are
+        not downloaded again.
+
+        Returns
+        -------
+            BulkResult (paths in data, files that could not be downloaded in failed)
+        """
+        dest = fspath(dest)
+        makedirs(dest, exist_ok=True)
+
+        def fetch(page: int) -> Tuple[List[File], ResponseMeta]:
+            return self.get_files_list(
+                fields=FILE_DOWNLOAD_FIELDS,
+                limit=limit,
+                offset=(page - 1) * limit,
+                filter=filter,
+                q=q,
+            )
+
+        def send(chunk: List[File]) -> List[str]:
+            file = chunk[0]
+            path = join(dest, basename(file["filename_disk"]))
+            if skip_existing and exists(path) and getsize(path) == file["filesize"]:
+                return [path]
+
+            try:
+                return [
+                    self._download(file, path, chunk_size=chunk_size, max_in_flight=1)
+                ]
+            except RequestException:
+                raise
+            except OSError as error:
+                # Report a file that cannot be written like a failed download
+                raise DirectusException(
+                    f"Cannot download the file {file.get('id')} to {path}: {error}"
+                ) from error
+
+        files = (
+            [file]
+            for page_data, _ in iter_pages(fetch, limit=limit)
+            for file in page_data
+        )
+
+        return run_chunks(files, send, max_in_flight=max_in_flight)
+
+    def _download(self, file: File, dest: Union[str, PathLike], **kwargs) -> str:
+        url = (file.get("data") or {}).get("full_url")
+        if not url:
+            raise DirectusException(f"The file {file.get('id')} has no full_url")
+
+        def open_range(byte_range: Optional[ByteRange]) -> Response:
+            headers = {}
+            if byte_range is not None:
+                start, end = byte_range
+                headers["range"] = f"bytes={start}-{'' if end is None else end}"
+
+            return self.ApiClient.do_stream(url, headers=headers)
+
+        return download(open_range, dest, size=file.get("filesize"), **kwargs)
 
     """
 
@@ -529,11 +1436,7 @@ class DirectusClient:
             (Empty body, Metadata)
         """
         path = "mail"
-        params = {
-            "to": send_to,
-            "subject": subject,
-            "body": body,
-            "type": type,
-            "data": data,
-        }
-        return self.ApiClient.do_post(path=path, data=params)
+        email = email_data(
+            send_to=send_to, subject=subject, body=body, type=type, data=data
+        )
+        return self.ApiClient.do_post(path=path, data=email)
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from .asyncdirectus import AsyncDirectusClient
+from .directus import DirectusClient
+from .exceptions import DirectusException
+from .utils import AsyncTransport, Transport
+
+# A per-project client of a pool, and the pooled transport it sends requests with
+C = TypeVar("C")
+T = TypeVar("T")
+
+# (project, email)
+ViewKey = Tuple[str, Optional[str]]
+
+
+class BaseClientPool(ABC, Generic[C, T]):
+    """
+    The per-project views of a pool, kept in least recently used order
+    """
+
+    def __init__(
+        self,
+        url: Optional[str],
+        email: Optional[str],
+        password: Optional[str],
+        transport: Optional[T],
+        max_projects: int,
+        options: Dict[str, Any],
+    ):
+        if not url:
+            raise DirectusException("You must provide a server url")
+
+        if max_projects < 1:
+            raise DirectusException("max_projects must be a positive integer")
+
+        self.url = url
+        self.email = email
+        self.password = password
+        self.max_projects = max_projects
+        self.options = options
+        self.transport = transport or self._new_transport()
+        self._owns_transport = transport is None
+        self._views: "OrderedDict[ViewKey, Tuple[Optional[str], C]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    @abstractmethod
+    def _new_transport(self) -> T:
+        """
+        The pooled transport of a pool created without one
+        """
+
+    @abstractmethod
+    def _new_client(
+        self, project: str, email: Optional[str], password: Optional[str]
+    ) -> C:
+        """
+        A client of the project, authenticating on its first request
+        """
+
+    def client(
+        self,
+        project: str,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> C:
+        """
+        The client of a project, authenticated as `email` (the credentials of the
+        pool by default). Clients are created once per (project, email) and
+        authenticate on their first request.
+
+        Returns
+        -------
+            The client of the project
+        """
+        if not project:
+            raise DirectusException("You must provide a project")
+
+        if email is None and password is None:
+            email, password = self.email, self.password
+
+        key = (project, email)
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None and view[0] == password:
+                self._views.move_to_end(key)
+                return view[1]
+
+            client = self._new_client(project, email, password)
+            self._views[key] = (password, client)
+            self._views.move_to_end(key)
+            evicted = self._evict_over_limit()
+            # A client replaced because its password changed
+            if view is not None:
+                evicted.append(view[1])
+
+        self._release(evicted)
+
+        return client
+
+    def _evict_over_limit(self) -> List[C]:
+        evicted = []
+        while len(self._views) > self.max_projects:
+            _, (_, client) = self._views.popitem(last=False)
+            evicted.append(client)
+
+        return evicted
+
+    def evict(self, project: str, email: Optional[str] = None) -> None:
+        """
+        Forget the client of a project, which authenticates again if it is requested
+        later
+        """
+        with self._lock:
+            view = self._views.pop((project, email or self.email), None)
+
+        if view is not None:
+            self._release([view[1]])
+
+    def _release(self, clients: List[C]) -> None:
+        """
+        Release the resources of evicted clients. The pooled transport is left open:
+        a client still held by a caller keeps working.
+        """
+
+
+class DirectusClientPool(BaseClientPool[DirectusClient, Transport]):
+    """
+    DirectusClientPool serves several projects of a Directus server, for
+    multi-tenant applications. Its clients share one pooled transport, and each
+    (project, user) pair gets its own client, created on first use and
+    authenticated on its first request. Switching projects is a dictionary lookup:
+    tokens are kept with the clients and refreshed as usual.
+
+        pool = DirectusClientPool(
+            url="https://directus.example.com", email=..., password=...
+        )
+        items, _ = pool.client(tenant).get_items_list(collection="orders")
+
+    The least recently used clients are evicted beyond `max_projects`, and
+    authenticate again when they are requested later.
+
+    Attributes
+    ----------
+    url: str
+        The url of the Directus server
+
+    email, password: str
+        The default credentials of the clients, a client can use its own
+
+    transport: Transport
+        The pooled HTTP transport shared by the clients. When not provided, the
+        pool creates its own and closes it with the pool.
+
+    max_projects: int
+        The maximum number of clients kept
+
+    options:
+        The options of DirectusClient used by every client (codec, refresh_margin,
+        retry, circuit_breaker, throttle, coalesce, hooks, cache). A shared read
+        cache keeps the entries of each project and user apart.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        max_projects: int = 64,
+        **options: Any,
+    ):
+        super().__init__(url, email, password, transport, max_projects, options)
+
+    def _new_transport(self) -> Transport:
+        return Transport()
+
+    def _new_client(
+        self, project: str, email: Optional[str], password: Optional[str]
+    ) -> DirectusClient:
+        return DirectusClient(
+            url=self.url,
+            email=email,
+            password=password,
+            project=project,
+            transport=self.transport,
+            lazy_auth=True,
+            **self.options,
+        )
+
+    def _release(self, clients: List[DirectusClient]) -> None:
+        for client in clients:
+            client.close()
+
+    def close(self) -> None:
+        """
+        Forget every client and close the transport, unless it was provided by the
+        caller
+        """
+        with self._lock:
+            clients = [client for _, client in self._views.values()]
+            self._views.clear()
+
+        self._release(clients)
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "DirectusClientPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class AsyncDirectusClientPool(BaseClientPool[AsyncDirectusClient, AsyncTransport]):
+    """
+    The asyncio counterpart of DirectusClientPool, handing out AsyncDirectusClient
+    sharing one AsyncTransport
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        transport: Optional[AsyncTransport] = None,
+        max_projects: int = 64,
+        **options: Any,
+    ):
+        super().__init__(url, email, password, transport, max_projects, options)
+
+    def _new_transport(self) -> AsyncTransport:
+        return AsyncTransport()
+
+    def _new_client(
+        self, project: str, email: Optional[str], password: Optional[str]
+    ) -> AsyncDirectusClient:
+        return AsyncDirectusClient(
+            url=self.url,
+            email=email,
+            password=password,
+            project=project,
+            transport=self.transport,
+            **self.options,
+        )
+
+    async def close(self) -> None:
+        with self._lock:
+            self._views.clear()
+
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncDirectusClientPool":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
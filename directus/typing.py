@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, List
+from typing import Any, AsyncIterable, Dict, Iterable, List, Tuple, Union
 
 
 RequestMeta = List[str]
 RequestFields = List[str]
 RequestHeaders = Dict[str, str]
-RequestData = Dict
+RequestData = Union[Dict[str, Any], List[Dict[str, Any]]]
 RequestParams = Dict
+RequestContent = Union[bytes, Iterable[bytes], AsyncIterable[bytes]]
+Timeout = Union[float, Tuple[float, float]]
 ResponseMeta = Dict
 Collection = Dict
 Item = Dict
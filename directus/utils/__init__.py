@@ -1,3 +1,22 @@
 # -*- coding: utf-8 -*-
 
 from .apiclient import ApiClient
+from .asyncapiclient import AsyncApiClient
+from .bulk import BulkChunkResult, BulkResult
+from .cache import CacheStats, ReadCache
+from .coalesce import AsyncSingleFlight, SingleFlight
+from .codec import JsonCodec, OrjsonCodec, fastest_codec
+from .compression import Compression
+from .export import ExportStats
+from .hooks import Hooks, RequestEvent, TokenRefreshEvent
+from .loader import AsyncItemLoader, ItemLoader
+from .metrics import MetricsCollector
+from .mirror import SqliteMirror, SyncResult
+from .multipart import MultipartBody
+from .otel import OpenTelemetryAdapter
+from .query import Query
+from .records import Record, record_class
+from .retry import CircuitBreaker, CircuitOpen, RetryPolicy
+from .throttle import ConcurrencyGovernor, Throttle, TokenBucket
+from .transport import AsyncTransport, Transport
+from .writer import BufferedWriter, WriteFailure, WriterStats
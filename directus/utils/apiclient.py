@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from json.decoder import JSONDecodeError
-from typing import List, Optional, Tuple, Union
-from urllib.parse import urljoin
-from jwt import decode
-from time import time
+from hashlib import sha256
+from threading import Event, Lock, Thread
+from typing import Any, Hashable, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+from jwt import PyJWTError, decode
+from time import monotonic, sleep, time
 
-from requests import Response, request
+from requests import RequestException, Response
 
 from ..exceptions import DirectusException
 from ..typing import (
@@ -14,29 +15,554 @@ from ..typing import (
     RequestMeta,
     RequestHeaders,
     RequestData,
+    RequestContent,
     RequestParams,
+    Timeout,
 )
+from .cache import CacheEntry, CacheKey, ReadCache
+from .coalesce import SingleFlight, flight_key
+from .codec import JsonCodec
+from .compression import Compression, wire_size
+from .hooks import Hooks, RequestEvent, TokenRefreshEvent, templated_path
+from .multipart import MultipartBody
+from .retry import CircuitBreaker, RetryPolicy
+from .throttle import Throttle
+from .transport import TRANSPORT_ERRORS, Transport
 
 
-class ApiClient(object):
+class BaseApiClient(object):
+    """
+    Request building and response parsing shared by the sync and async api clients
+    """
+
     def __init__(
         self,
         url: str,
         project: str,
-        email: Optional[str] = None,
-        password: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+        refresh_margin: float = 60,
+        cache: Optional[ReadCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[Throttle] = None,
+        hooks: Optional[Hooks] = None,
+        compression: Optional[Compression] = None,
     ):
         self.baseHeader = {}
         self.token = ""
+        self.token_expiry: Optional[float] = None
+        self.refresh_margin = refresh_margin
         self.url = url
         self.baseUrl = urljoin(url, project)
         self.project = project
-        if email and password:
-            auth, _ = self.do_post(
-                path="auth/authenticate", data={"email": email, "password": password}
+        # The project and user the reads are cached for, anonymous until a token is set
+        self.identity = self.baseUrl
+        self.codec = codec or JsonCodec()
+        self.cache = cache
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.throttle = throttle
+        self.hooks = hooks
+        self.compression = compression
+        if compression is not None:
+            self.baseHeader["accept-encoding"] = compression.accept_encoding
+        self.single_flight: Any = None
+
+    def _build_url(self, path: str, id: Optional[Union[str, int]] = None) -> str:
+        if id is None:
+            return "/".join([self.baseUrl, path])
+
+        return "/".join([self.baseUrl, path, str(id)])
+
+    def _build_headers(
+        self, headers: RequestHeaders, body: Optional[bytes] = None
+    ) -> RequestHeaders:
+        if body is not None:
+            return {**self.baseHeader, "content-type": "application/json", **headers}
+
+        return {**self.baseHeader, **headers}
+
+    @staticmethod
+    def _build_params(params: RequestParams, meta: RequestMeta) -> RequestParams:
+        built = {}
+        for key, value in {**params, "meta": ",".join(meta)}.items():
+            if value is None or value == {}:
+                continue
+            built[key] = int(value) if isinstance(value, bool) else value
+
+        return built
+
+    def _is_server_url(self, url: str) -> bool:
+        """
+        Whether a url points at the Directus server, rather than at another host
+        (e.g. the storage serving the files)
+        """
+        return urlsplit(url)[:2] == urlsplit(self.url)[:2]
+
+    def _encode(self, data: Optional[RequestData]) -> Optional[bytes]:
+        return self.codec.dumps(data) if data is not None else None
+
+    def _compress(
+        self, body: Optional[bytes], content: Optional[RequestContent]
+    ) -> Optional[bytes]:
+        """
+        Returns
+        -------
+            The gzip compressed JSON body, or None if it is sent as is
+        """
+        if self.compression is None or content is not None:
+            return None
+
+        return self.compression.compress(body)
+
+    @staticmethod
+    def _compressed_headers(
+        headers: RequestHeaders, compressed: Optional[bytes]
+    ) -> RequestHeaders:
+        if compressed is None:
+            return headers
+
+        return {**headers, "content-encoding": "gzip"}
+
+    def _compression_rejected(self, compressed: Optional[bytes], response: Any) -> bool:
+        if compressed is None or self.compression is None:
+            return False
+
+        error = None
+        if response.status_code == 400:
+            result = self._decode(response)
+            if isinstance(result, dict) and isinstance(result.get("error"), dict):
+                error = result["error"].get("message")
+
+        return self.compression.rejects(response.status_code, error)
+
+    def _record_fallback(self, fell_back: bool, response: Any) -> None:
+        """
+        Stop compressing request bodies once a request rejected compressed was
+        accepted uncompressed
+        """
+        if fell_back and self.compression is not None and response.status_code < 400:
+            self.compression.rejected = True
+
+    def _decode(self, response: Any) -> Optional[Any]:
+        """
+        Parse the response body, once for the whole request processing
+
+        Returns
+        -------
+            The decoded body, or None if it is empty or not JSON
+        """
+        if not response.content:
+            return None
+
+        try:
+            return self.codec.loads(response.content)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _raise_for_error(result: Optional[Any]) -> None:
+        """
+        Raise a DirectusException if the decoded response carries an API error
+        """
+        if isinstance(result, dict) and result.get("error"):
+            raise DirectusException(
+                f"{result['error']['message']} ( Code {result['error']['code']}: Please have a look at https://docs.directus.io/api/errors.html )"
+            )
+
+    @staticmethod
+    def _parse_result(
+        result: Optional[Any], single: bool = False
+    ) -> Tuple[Any, ResponseMeta]:
+        if result is None:
+            return ({}, {})
+
+        return (
+            [result["data"]] if single else result["data"],
+            result["meta"] if result.get("meta") else {},
+        )
+
+    def _cache_key(
+        self, path: str, params: RequestParams, cached: bool
+    ) -> Optional[CacheKey]:
+        if not cached or self.cache is None:
+            return None
+
+        return self.cache.key(path, params, self.identity)
+
+    def _cached_entry(self, key: Optional[CacheKey]) -> Optional[CacheEntry]:
+        if key is None or self.cache is None:
+            return None
+
+        return self.cache.get(key)
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[CacheEntry]) -> RequestHeaders:
+        """
+        Headers revalidating an expired entry with the validators the server sent
+        """
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["if-none-match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["if-modified-since"] = entry.last_modified
+
+        return headers
+
+    def _modified_params(self, entry: CacheEntry) -> Optional[RequestParams]:
+        """
+        Without validators, an expired item is revalidated by fetching only its
+        modified field and comparing it to the cached one
+
+        Returns
+        -------
+            The params of this cheap request, or None if it cannot be used
+        """
+        if (
+            self.cache is None
+            or self.cache.modified_field is None
+            or entry.etag
+            or entry.last_modified
+            or entry.modified is None
+        ):
+            return None
+
+        return {"fields": self.cache.modified_field}
+
+    def _is_unmodified(self, entry: CacheEntry, result: Optional[Any]) -> bool:
+        if self.cache is None or self.cache.modified_field is None:
+            return False
+
+        data, _ = self._parse_result(result)
+
+        return (
+            isinstance(data, dict)
+            and data.get(self.cache.modified_field) == entry.modified
+        )
+
+    def _cache_hit(self, key: CacheKey, entry: CacheEntry) -> Any:
+        """
+        Returns
+        -------
+            The decoded cached body, renewing the entry if it was revalidated
+        """
+        if not entry.fresh and self.cache is not None:
+            self.cache.renew(key)
+
+        return self.codec.loads(entry.body)
+
+    def _cache_response(
+        self, key: Optional[CacheKey], response: Any, result: Optional[Any]
+    ) -> None:
+        cache = self.cache
+        if cache is None or key is None or result is None:
+            return
+
+        data = result.get("data") if isinstance(result, dict) else None
+        modified = (
+            data.get(cache.modified_field)
+            if isinstance(data, dict) and cache.modified_field
+            else None
+        )
+        cache.set(
+            key,
+            response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            modified=modified,
+        )
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop the cached reads of a path and of the paths below it, and let the
+        following reads send their own request rather than join one in flight
+        """
+        if self.cache is not None:
+            self.cache.invalidate(path)
+        if self.single_flight is not None:
+            self.single_flight.forget(path)
+
+    def _flight_key(
+        self, path: str, params: RequestParams, headers: RequestHeaders
+    ) -> Hashable:
+        # The token is the auth identity, responses differ from one user to another
+        return flight_key(path, params, headers, self.token)
+
+    def _copy_result(self, shared: Tuple[Any, Optional[Any]]) -> Tuple[Any, Any]:
+        """
+        A copy of the result of a coalesced request, decoded again from the raw
+        body so that callers can modify it independently
+        """
+        response, _ = shared
+
+        return response, self._decode(response)
+
+    @staticmethod
+    def _multipart_headers(body: MultipartBody) -> RequestHeaders:
+        headers = {"content-type": body.content_type}
+        if body.len is not None:
+            headers["content-length"] = str(body.len)
+
+        return headers
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        content: Optional[RequestContent],
+        idempotent: Optional[bool],
+        response: Optional[Any] = None,
+    ) -> Optional[float]:
+        """
+        Streamed bodies are consumed by the first attempt, they are never retried
+
+        Returns
+        -------
+            The number of seconds to wait before sending a failed request again, or
+            None if it must not be retried
+        """
+        if (
+            self.retry is None
+            or content is not None
+            or not self.retry.allows(method, attempt, idempotent)
+        ):
+            return None
+
+        retry_after = (
+            response.headers.get("retry-after") if response is not None else None
+        )
+
+        return self.retry.delay(attempt, retry_after)
+
+    def _is_retryable(self, response: Any) -> bool:
+        return self.retry is not None and response.status_code in self.retry.statuses
+
+    def _endpoint_group(self, url: str) -> Optional[str]:
+        """
+        The first segment of the path of a url in the project (items, files...)
+        """
+        prefix = self.baseUrl + "/"
+        if not url.startswith(prefix):
+            return None
+
+        return url[len(prefix) :].split("/", 1)[0]
+
+    def _before_request(self, url: str) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(url)
+
+    def _record_response(self, url: str, response: Any) -> None:
+        if self.circuit_breaker is None:
+            return
+
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure(url)
+        else:
+            self.circuit_breaker.record_success(url)
+
+    def _record_error(self, url: str) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure(url)
+
+    def _request_event(
+        self,
+        method: str,
+        url: str,
+        headers: RequestHeaders,
+        body: Optional[bytes],
+        attempt: int,
+        sent: Optional[RequestContent] = None,
+    ) -> Optional[RequestEvent]:
+        """
+        `body` is the JSON body of the request, and `sent` the body actually sent,
+        possibly compressed
+
+        Returns
+        -------
+            The event of an attempt, once reported to the before_request hooks, or
+            None without hooks
+        """
+        if not self.hooks:
+            return None
+
+        prefix = self.baseUrl + "/"
+        size = len(body) if body is not None else headers.get("content-length")
+        bytes_sent = int(size) if size is not None else None
+        event = RequestEvent(
+            method=method,
+            url=url,
+            path=templated_path(url[len(prefix) :]) if url.startswith(prefix) else url,
+            attempt=attempt,
+            bytes_sent=bytes_sent,
+            wire_bytes_sent=len(sent) if isinstance(sent, bytes) else bytes_sent,
+        )
+        self.hooks.emit("before_request", event)
+
+        return event
+
+    @staticmethod
+    def _time_http(
+        event: RequestEvent, queued: float, start: float, ttfb: Optional[float] = None
+    ) -> None:
+        event.timings["queue"] = start - queued
+        event.timings["http"] = monotonic() - start
+        if ttfb is not None:
+            event.timings["ttfb"] = ttfb
+            event.timings["download"] = max(event.timings["http"] - ttfb, 0.0)
+
+    def _decode_response(
+        self, response: Any, event: Optional[RequestEvent]
+    ) -> Optional[Any]:
+        if event is None:
+            return self._decode(response)
+
+        start = monotonic()
+        result = self._decode(response)
+        event.timings["decode"] = monotonic() - start
+
+        return result
+
+    @staticmethod
+    def _record_received(event: RequestEvent, response: Any) -> None:
+        event.status = response.status_code
+        event.bytes_received = len(response.content)
+        event.wire_bytes_received = wire_size(response)
+
+    def _emit_response(self, event: Optional[RequestEvent], response: Any) -> None:
+        if event is not None and self.hooks is not None:
+            self._record_received(event, response)
+            self.hooks.emit("after_response", event)
+
+    def _emit_retry(
+        self,
+        event: Optional[RequestEvent],
+        delay: float,
+        response: Optional[Any] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if event is not None and self.hooks is not None:
+            event.retry_delay = delay
+            event.error = error
+            if response is not None:
+                self._record_received(event, response)
+            self.hooks.emit("on_retry", event)
+
+    def _emit_error(self, event: Optional[RequestEvent], error: BaseException) -> None:
+        if event is not None and self.hooks is not None:
+            event.error = error
+            self.hooks.emit("on_error", event)
+
+    def _emit_token_refresh(self, seconds: float) -> None:
+        if self.hooks:
+            self.hooks.emit(
+                "on_token_refresh",
+                TokenRefreshEvent(seconds=seconds, expires_at=self.token_expiry),
+            )
+
+    @staticmethod
+    def _is_deleted(response: Any) -> bool:
+        return response.status_code == 204
+
+    def _set_token(self, token: str) -> None:
+        """
+        Use a newly issued token, reading its expiry and user once and for all
+        """
+        try:
+            claims = decode(token, verify=False)
+        except PyJWTError:
+            claims = {}
+        try:
+            self.token_expiry = float(claims["exp"])
+        except (KeyError, TypeError, ValueError):
+            self.token_expiry = None
+
+        # A refreshed token keeps the identity of its user, an opaque token is its
+        # own identity
+        user = claims.get("id") if isinstance(claims, dict) else None
+        if user is None:
+            user = sha256(token.encode()).hexdigest()
+        self.identity = f"{self.baseUrl}#{user}"
+
+        self.token = token
+        self.baseHeader["authorization"] = f"Bearer {token}"
+
+    def _token_expires_soon(self, margin: Optional[float] = None) -> bool:
+        if not self.token or self.token_expiry is None:
+            return False
+
+        margin = self.refresh_margin if margin is None else margin
+
+        return self.token_expiry - margin < time()
+
+
+class ApiClient(BaseApiClient):
+    """
+    With `lazy_auth`, the client authenticates on its first request (or explicitly
+    with `authenticate`) rather than in the constructor.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        project: str,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        codec: Optional[JsonCodec] = None,
+        refresh_margin: float = 60,
+        background_refresh: bool = False,
+        cache: Optional[ReadCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[Throttle] = None,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        lazy_auth: bool = False,
+        compression: Optional[Compression] = None,
+    ):
+        super().__init__(
+            url=url,
+            project=project,
+            codec=codec,
+            refresh_margin=refresh_margin,
+            cache=cache,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            throttle=throttle,
+            hooks=hooks,
+            compression=compression,
+        )
+        self.single_flight = SingleFlight() if coalesce else None
+        self.transport = transport or Transport()
+        self._owns_transport = transport is None
+        self._refresh_lock = Lock()
+        self._refresher: Optional[Thread] = None
+        self._refresher_stop = Event()
+        self._credentials = (
+            {"email": email, "password": password} if email and password else None
+        )
+        if not lazy_auth:
+            self.authenticate()
+
+        if background_refresh:
+            self.start_token_refresher()
+
+    def authenticate(self) -> None:
+        if not self._credentials or self.token:
+            return
+
+        with self._refresh_lock:
+            if self.token:
+                return
+
+            _, result = self._send(
+                "POST",
+                self._build_url("auth/authenticate"),
+                data=self._credentials,
+                idempotent=True,
             )
-            self.token = auth["token"]
-            self.baseHeader["authorization"] = f"Bearer {self.token}"
+            auth, _ = self._parse_result(result)
+            self._set_token(auth["token"])
 
     def do_get(
         self,
@@ -44,23 +570,89 @@ class ApiClient(object):
         params: RequestParams = {},
         headers: RequestHeaders = {},
         meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+        cached: bool = False,
     ) -> Tuple[dict, ResponseMeta]:
-        headers = {**self.baseHeader, **headers}
-        params["meta"] = ",".join(meta)
-        response = self._make_request(
-            "GET", "/".join([self.baseUrl, path]), headers=headers, params=params
+        """
+        With `cached`, the response is served from and stored in the client cache
+        (if any). Expired entries are revalidated with a conditional request, or by
+        comparing the modified field of the item when the server sends no validators.
+        """
+        params = self._build_params(params, meta)
+        single = bool(params.get("single"))
+        if cached:
+            # The cache key holds the user of the client, known once authenticated
+            self.authenticate()
+        key = self._cache_key(path, params, cached)
+        entry = self._cached_entry(key)
+        if (
+            key is not None
+            and entry is not None
+            and (
+                entry.fresh or self._revalidate_modified(path, entry, headers, timeout)
+            )
+        ):
+            return self._parse_result(self._cache_hit(key, entry), single=single)
+
+        response, result = self._get(
+            path,
+            headers={**self._conditional_headers(entry), **headers},
+            params=params,
+            timeout=timeout,
         )
+        if key is not None and entry is not None and response.status_code == 304:
+            return self._parse_result(self._cache_hit(key, entry), single=single)
 
-        if not response:
-            return ({}, {})
+        self._cache_response(key, response, result)
 
-        result = response.json()
+        return self._parse_result(result, single=single)
 
-        return (
-            [result["data"]]
-            if params.get("single") and params["single"]
-            else result["data"],
-            result["meta"] if result.get("meta") else {},
+    def _revalidate_modified(
+        self,
+        path: str,
+        entry: CacheEntry,
+        headers: RequestHeaders,
+        timeout: Optional[Timeout],
+    ) -> bool:
+        """
+        Returns
+        -------
+            bool (True if the modified field of the expired item did not change)
+        """
+        params = self._modified_params(entry)
+        if params is None:
+            return False
+
+        _, result = self._get(path, headers=headers, params=params, timeout=timeout)
+
+        return self._is_unmodified(entry, result)
+
+    def _get(
+        self,
+        path: str,
+        headers: RequestHeaders,
+        params: RequestParams,
+        timeout: Optional[Timeout],
+    ) -> Tuple[Response, Optional[Any]]:
+        """
+        Send a GET request, or join the identical one already in flight when
+        requests are coalesced
+        """
+
+        def fetch() -> Tuple[Response, Optional[Any]]:
+            return self._make_request(
+                "GET",
+                self._build_url(path),
+                headers=headers,
+                params=params,
+                timeout=timeout,
+            )
+
+        if self.single_flight is None:
+            return fetch()
+
+        return self.single_flight.do(
+            self._flight_key(path, params, headers), fetch, self._copy_result
         )
 
     def do_post(
@@ -69,93 +661,325 @@ class ApiClient(object):
         data: RequestData,
         headers: RequestHeaders = {},
         meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+        idempotent: Optional[bool] = None,
     ) -> Tuple[dict, ResponseMeta]:
-        headers = {**self.baseHeader, **headers}
-        params = {"meta": ",".join(meta)}
-        response = self._make_request(
+        """
+        With `idempotent`, the request is retried like a GET by the retry policy
+        """
+        _, result = self._make_request(
             "POST",
-            "/".join([self.baseUrl, path]),
+            self._build_url(path),
             headers=headers,
             data=data,
-            params=params,
+            params=self._build_params({}, meta),
+            timeout=timeout,
+            idempotent=idempotent,
         )
 
-        if not response:
-            return ({}, {})
-
-        result = response.json()
-
-        return result["data"], result["meta"] if result.get("meta") else {}
+        return self._parse_result(result)
 
     def do_patch(
         self,
         path: str,
-        id: Union[str, int],
+        id: Optional[Union[str, int]] = None,
         data: RequestData = {},
         params: RequestParams = {},
         headers: RequestHeaders = {},
         meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+        idempotent: Optional[bool] = None,
     ) -> Tuple[dict, ResponseMeta]:
-        headers = {**self.baseHeader, **headers}
-        params["meta"] = ",".join(meta)
-        url = "/".join([self.baseUrl, path, str(id)])
+        """
+        With `idempotent`, the request is retried like a GET by the retry policy
+        """
+        _, result = self._make_request(
+            "PATCH",
+            self._build_url(path, id),
+            headers=headers,
+            data=data,
+            params=self._build_params(params, meta),
+            timeout=timeout,
+            idempotent=idempotent,
+        )
+
+        return self._parse_result(result)
 
-        response = self._make_request(
-            "PATCH", url, headers=headers, data=data, params=params
+    def do_upload(
+        self,
+        path: str,
+        body: MultipartBody,
+        headers: RequestHeaders = {},
+        meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+    ) -> Tuple[dict, ResponseMeta]:
+        """
+        Send a streamed multipart/form-data body
+        """
+        _, result = self._make_request(
+            "POST",
+            self._build_url(path),
+            headers={**self._multipart_headers(body), **headers},
+            content=body,
+            params=self._build_params({}, meta),
+            timeout=timeout,
         )
 
-        if not response:
-            return ({}, {})
+        return self._parse_result(result)
 
-        result = response.json()
+    def do_stream(
+        self,
+        url: str,
+        headers: RequestHeaders = {},
+        timeout: Optional[Timeout] = None,
+    ) -> Response:
+        """
+        GET a binary resource without reading its body. The response must be
+        consumed or closed by the caller. The access token is only sent to the
+        Directus server, not to the other hosts files may be served from (S3, a
+        CDN...).
 
-        return result["data"], result["meta"] if result.get("meta") else {}
+        Returns
+        -------
+            Response (streamed)
+        """
+        self.authenticate()
+        self._auto_refresh_token()
+        headers = self._build_headers(headers)
+        if not self._is_server_url(url):
+            headers.pop("authorization", None)
+        response = self.transport.request(
+            method="GET",
+            url=url,
+            headers=headers,
+            timeout=timeout,
+            stream=True,
+        )
 
-    def do_delete(
-        self, path: str, id: Union[int, str], headers: RequestHeaders = {}
-    ) -> bool:
-        headers = {**self.baseHeader, **headers}
-        url = "/".join([self.baseUrl, path, str(id)])
-        response = self._make_request("DELETE", url, headers=headers)
+        if response.status_code >= 400:
+            result = self._decode(response)
+            response.close()
+            self._raise_for_error(result)
+            raise DirectusException(
+                f"Request to {url} failed ( HTTP {response.status_code} )"
+            )
 
-        if not response:
-            return False
+        return response
 
-        if response.status_code != 204:
-            return False
+    def do_delete(
+        self,
+        path: str,
+        id: Union[int, str],
+        headers: RequestHeaders = {},
+        timeout: Optional[Timeout] = None,
+    ) -> bool:
+        response, _ = self._make_request(
+            "DELETE", self._build_url(path, id), headers=headers, timeout=timeout
+        )
 
-        return True
+        return self._is_deleted(response)
 
     def _make_request(
         self,
         method: str,
         url: str,
         headers: RequestHeaders,
-        data: RequestData = {},
+        data: Optional[RequestData] = None,
         params: RequestParams = {},
-    ) -> Optional[Response]:
+        timeout: Optional[Timeout] = None,
+        content: Optional[RequestContent] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[Response, Optional[Any]]:
+        """
+        Send a request and decode its response body
+
+        Returns
+        -------
+            (Response, decoded body or None)
+        """
+        self.authenticate()
         self._auto_refresh_token()
-        response = request(
-            method=method, url=url, headers=headers, json=data, params=params
+
+        return self._send(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            content=content,
+            idempotent=idempotent,
         )
 
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: RequestHeaders = {},
+        data: Optional[RequestData] = None,
+        params: RequestParams = {},
+        timeout: Optional[Timeout] = None,
+        content: Optional[RequestContent] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[Response, Optional[Any]]:
+        body = self._encode(data)
+        headers = self._build_headers(headers, body)
+        compressed = self._compress(body, content)
+        fell_back = False
+        attempt = 1
+        while True:
+            sent = compressed or (body if content is None else content)
+            event = self._request_event(method, url, headers, body, attempt, sent)
+            try:
+                response = self._request_once(
+                    method=method,
+                    url=url,
+                    event=event,
+                    headers=self._compressed_headers(headers, compressed),
+                    data=sent,
+                    params=params,
+                    timeout=timeout,
+                )
+            except TRANSPORT_ERRORS as error:
+                self._record_error(url)
+                delay = self._retry_delay(method, attempt, content, idempotent)
+                if delay is None:
+                    self._emit_error(event, error)
+                    raise
+                self._emit_retry(event, delay, error=error)
+            except DirectusException as error:
+                self._emit_error(event, error)
+                raise
+            else:
+                self._record_response(url, response)
+                if self._compression_rejected(compressed, response):
+                    # Send the body again uncompressed, right away
+                    compressed, fell_back, delay = None, True, 0.0
+                else:
+                    delay = (
+                        self._retry_delay(
+                            method, attempt, content, idempotent, response
+                        )
+                        if self._is_retryable(response)
+                        else None
+                    )
+                    if delay is None:
+                        break
+                self._emit_retry(event, delay, response=response)
+
+            sleep(delay)
+            attempt += 1
+
+        self._record_fallback(fell_back, response)
+        result = self._decode_response(response, event)
+        self._emit_response(event, response)
+        try:
+            self._raise_for_error(result)
+        except DirectusException as error:
+            self._emit_error(event, error)
+            raise
+
+        return response, result
+
+    def _request_once(
+        self, method: str, url: str, event: Optional[RequestEvent], **kwargs
+    ) -> Response:
+        """
+        Send a single attempt of a request, within the limits of the circuit
+        breaker and of the throttle
+        """
+        self._before_request(url)
+        group = self._endpoint_group(url)
+        queued = monotonic()
+        if self.throttle is not None:
+            self.throttle.acquire(group)
+
+        start = monotonic()
+        status = None
         try:
-            if response.json().get("error"):
-                raise DirectusException(
-                    f"{response.json()['error']['message']} ( Code {response.json()['error']['code']}: Please have a look at https://docs.directus.io/api/errors.html )"
+            response = self.transport.request(method=method, url=url, **kwargs)
+            status = response.status_code
+            if event is not None:
+                self._time_http(
+                    event,
+                    queued,
+                    start,
+                    ttfb=response.elapsed.total_seconds(),
                 )
-        except JSONDecodeError:
-            return None
+            return response
+        finally:
+            if self.throttle is not None:
+                self.throttle.release(group, monotonic() - start, status)
+            if event is not None and status is None:
+                self._time_http(event, queued, start)
 
-        return response
+    def _auto_refresh_token(self, margin: Optional[float] = None) -> None:
+        """
+        Refresh the token when it expires within `margin` seconds. Concurrent callers
+        wait for a single in-flight refresh instead of each sending their own.
+        """
+        if not self._token_expires_soon(margin):
+            return
 
-    def _auto_refresh_token(self) -> None:
-        if self.token:
-            decoded_token = decode(self.token, verify=False)
+        expiring_token = self.token
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while we were waiting
+            if self.token != expiring_token or not self._token_expires_soon(margin):
+                return
 
-        if self.token and int(decoded_token["exp"] - 60) < int(time()):
-            new_token, _ = self.do_post(
-                "/".join(["auth", "refresh"]), data={"token": self.token}
+            started = monotonic()
+            _, result = self._send(
+                "POST", self._build_url("auth/refresh"), data={"token": self.token}
             )
-            self.token = new_token["token"]
-            self.baseHeader["token"] = new_token["token"]
+            new_token, _ = self._parse_result(result)
+            self._set_token(new_token["token"])
+            self._emit_token_refresh(monotonic() - started)
+
+    def start_token_refresher(self, retry_delay: float = 5) -> None:
+        """
+        Refresh the token in a background thread, ahead of the margin at which
+        requests would refresh it, so that no request has to wait for a refresh
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._refresher_stop.clear()
+        self._refresher = Thread(
+            target=self._run_token_refresher,
+            args=(retry_delay,),
+            name="directus-token-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_token_refresher(self) -> None:
+        self._refresher_stop.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+    def _run_token_refresher(self, retry_delay: float) -> None:
+        lead = 2 * self.refresh_margin
+        while True:
+            if self.token_expiry is None:
+                delay = retry_delay
+            else:
+                delay = max(self.token_expiry - lead - time(), 0)
+
+            if self._refresher_stop.wait(delay):
+                return
+
+            try:
+                self._auto_refresh_token(margin=lead)
+            except (DirectusException, RequestException):
+                if self._refresher_stop.wait(retry_delay):
+                    return
+
+    def close(self) -> None:
+        """
+        Close the underlying transport, unless it was provided by the caller and may
+        be shared with other clients
+        """
+        self.stop_token_refresher()
+        if self._owns_transport:
+            self.transport.close()
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import Lock, sleep
+from time import monotonic
+from typing import Any, Optional, Tuple, Union
+
+from ..exceptions import DirectusException
+from ..typing import (
+    ResponseMeta,
+    RequestMeta,
+    RequestHeaders,
+    RequestData,
+    RequestContent,
+    RequestParams,
+    Timeout,
+)
+from .apiclient import BaseApiClient
+from .cache import CacheEntry, ReadCache
+from .coalesce import AsyncSingleFlight
+from .codec import JsonCodec
+from .compression import Compression
+from .hooks import Hooks, RequestEvent
+from .multipart import MultipartBody
+from .retry import CircuitBreaker, RetryPolicy
+from .throttle import Throttle
+from .transport import ASYNC_TRANSPORT_ERRORS, AsyncTransport
+
+
+class AsyncApiClient(BaseApiClient):
+    """
+    The asyncio counterpart of ApiClient. As authentication cannot happen in the
+    constructor, it is done on the first request (or explicitly with `authenticate`).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        project: str,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        transport: Optional[AsyncTransport] = None,
+        codec: Optional[JsonCodec] = None,
+        refresh_margin: float = 60,
+        cache: Optional[ReadCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[Throttle] = None,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        compression: Optional[Compression] = None,
+    ):
+        super().__init__(
+            url=url,
+            project=project,
+            codec=codec,
+            refresh_margin=refresh_margin,
+            cache=cache,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            throttle=throttle,
+            hooks=hooks,
+            compression=compression,
+        )
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.transport = transport or AsyncTransport()
+        self._owns_transport = transport is None
+        self._credentials = (
+            {"email": email, "password": password} if email and password else None
+        )
+        self._auth_lock: Optional[Lock] = None
+
+    async def authenticate(self) -> None:
+        if not self._credentials or self.token:
+            return
+
+        # The lock is created lazily so that it binds to the running event loop
+        if self._auth_lock is None:
+            self._auth_lock = Lock()
+
+        async with self._auth_lock:
+            if self.token:
+                return
+
+            _, result = await self._send(
+                "POST",
+                self._build_url("auth/authenticate"),
+                data=self._credentials,
+                idempotent=True,
+            )
+            auth, _ = self._parse_result(result)
+            self._set_token(auth["token"])
+
+    async def do_get(
+        self,
+        path: str,
+        params: RequestParams = {},
+        headers: RequestHeaders = {},
+        meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+        cached: bool = False,
+    ) -> Tuple[dict, ResponseMeta]:
+        params = self._build_params(params, meta)
+        single = bool(params.get("single"))
+        if cached:
+            # The cache key holds the user of the client, known once authenticated
+            await self.authenticate()
+        key = self._cache_key(path, params, cached)
+        entry = self._cached_entry(key)
+        if (
+            key is not None
+            and entry is not None
+            and (
+                entry.fresh
+                or await self._revalidate_modified(path, entry, headers, timeout)
+            )
+        ):
+            return self._parse_result(self._cache_hit(key, entry), single=single)
+
+        response, result = await self._get(
+            path,
+            headers={**self._conditional_headers(entry), **headers},
+            params=params,
+            timeout=timeout,
+        )
+        if key is not None and entry is not None and response.status_code == 304:
+            return self._parse_result(self._cache_hit(key, entry), single=single)
+
+        self._cache_response(key, response, result)
+
+        return self._parse_result(result, single=single)
+
+    async def _revalidate_modified(
+        self,
+        path: str,
+        entry: CacheEntry,
+        headers: RequestHeaders,
+        timeout: Optional[Timeout],
+    ) -> bool:
+        params = self._modified_params(entry)
+        if params is None:
+            return False
+
+        _, result = await self._get(
+            path, headers=headers, params=params, timeout=timeout
+        )
+
+        return self._is_unmodified(entry, result)
+
+    async def _get(
+        self,
+        path: str,
+        headers: RequestHeaders,
+        params: RequestParams,
+        timeout: Optional[Timeout],
+    ) -> Tuple[Any, Optional[Any]]:
+        """
+        Send a GET request, or join the identical one already in flight when
+        requests are coalesced
+        """
+
+        async def fetch() -> Tuple[Any, Optional[Any]]:
+            return await self._make_request(
+                "GET",
+                self._build_url(path),
+                headers=headers,
+                params=params,
+                timeout=timeout,
+            )
+
+        if self.single_flight is None:
+            return await fetch()
+
+        return await self.single_flight.do(
+            self._flight_key(path, params, headers), fetch, self._copy_result
+        )
+
+    async def do_post(
+        self,
+        path: str,
+        data: RequestData,
+        headers: RequestHeaders = {},
+        meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[dict, ResponseMeta]:
+        """
+        With `idempotent`, the request is retried like a GET by the retry policy
+        """
+        _, result = await self._make_request(
+            "POST",
+            self._build_url(path),
+            headers=headers,
+            data=data,
+            params=self._build_params({}, meta),
+            timeout=timeout,
+            idempotent=idempotent,
+        )
+
+        return self._parse_result(result)
+
+    async def do_patch(
+        self,
+        path: str,
+        id: Optional[Union[str, int]] = None,
+        data: RequestData = {},
+        params: RequestParams = {},
+        headers: RequestHeaders = {},
+        meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[dict, ResponseMeta]:
+        """
+        With `idempotent`, the request is retried like a GET by the retry policy
+        """
+        _, result = await self._make_request(
+            "PATCH",
+            self._build_url(path, id),
+            headers=headers,
+            data=data,
+            params=self._build_params(params, meta),
+            timeout=timeout,
+            idempotent=idempotent,
+        )
+
+        return self._parse_result(result)
+
+    async def do_upload(
+        self,
+        path: str,
+        body: MultipartBody,
+        headers: RequestHeaders = {},
+        meta: RequestMeta = [],
+        timeout: Optional[Timeout] = None,
+    ) -> Tuple[dict, ResponseMeta]:
+        """
+        Send a streamed multipart/form-data body
+        """
+        _, result = await self._make_request(
+            "POST",
+            self._build_url(path),
+            headers={**self._multipart_headers(body), **headers},
+            content=body.__aiter__(),
+            params=self._build_params({}, meta),
+            timeout=timeout,
+        )
+
+        return self._parse_result(result)
+
+    async def do_delete(
+        self,
+        path: str,
+        id: Union[int, str],
+        headers: RequestHeaders = {},
+        timeout: Optional[Timeout] = None,
+    ) -> bool:
+        response, _ = await self._make_request(
+            "DELETE", self._build_url(path, id), headers=headers, timeout=timeout
+        )
+
+        return self._is_deleted(response)
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        headers: RequestHeaders,
+        data: Optional[RequestData] = None,
+        params: RequestParams = {},
+        timeout: Optional[Timeout] = None,
+        content: Optional[RequestContent] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[Any, Optional[Any]]:
+        await self.authenticate()
+        await self._auto_refresh_token()
+
+        return await self._send(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            content=content,
+            idempotent=idempotent,
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: RequestHeaders = {},
+        data: Optional[RequestData] = None,
+        params: RequestParams = {},
+        timeout: Optional[Timeout] = None,
+        content: Optional[RequestContent] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[Any, Optional[Any]]:
+        body = self._encode(data)
+        headers = self._build_headers(headers, body)
+        compressed = self._compress(body, content)
+        fell_back = False
+        attempt = 1
+        while True:
+            sent = compressed or (body if content is None else content)
+            event = self._request_event(method, url, headers, body, attempt, sent)
+            try:
+                response = await self._request_once(
+                    method=method,
+                    url=url,
+                    event=event,
+                    headers=self._compressed_headers(headers, compressed),
+                    data=sent,
+                    params=params,
+                    timeout=timeout,
+                )
+            except ASYNC_TRANSPORT_ERRORS as error:
+                self._record_error(url)
+                delay = self._retry_delay(method, attempt, content, idempotent)
+                if delay is None:
+                    self._emit_error(event, error)
+                    raise
+                self._emit_retry(event, delay, error=error)
+            except DirectusException as error:
+                self._emit_error(event, error)
+                raise
+            else:
+                self._record_response(url, response)
+                if self._compression_rejected(compressed, response):
+                    # Send the body again uncompressed, right away
+                    compressed, fell_back, delay = None, True, 0.0
+                else:
+                    delay = (
+                        self._retry_delay(
+                            method, attempt, content, idempotent, response
+                        )
+                        if self._is_retryable(response)
+                        else None
+                    )
+                    if delay is None:
+                        break
+                self._emit_retry(event, delay, response=response)
+
+            await sleep(delay)
+            attempt += 1
+
+        self._record_fallback(fell_back, response)
+        result = self._decode_response(response, event)
+        self._emit_response(event, response)
+        try:
+            self._raise_for_error(result)
+        except DirectusException as error:
+            self._emit_error(event, error)
+            raise
+
+        return response, result
+
+    async def _request_once(
+        self, method: str, url: str, event: Optional[RequestEvent], **kwargs
+    ) -> Any:
+        """
+        Send a single attempt of a request, within the limits of the circuit
+        breaker and of the throttle
+        """
+        self._before_request(url)
+        group = self._endpoint_group(url)
+        queued = monotonic()
+        if self.throttle is not None:
+            await self.throttle.acquire_async(group)
+
+        start = monotonic()
+        status = None
+        try:
+            response = await self.transport.request(method=method, url=url, **kwargs)
+            status = response.status_code
+            if event is not None:
+                self._time_http(
+                    event,
+                    queued,
+                    start,
+                )
+            return response
+        finally:
+            if self.throttle is not None:
+                self.throttle.release(group, monotonic() - start, status)
+            if event is not None and status is None:
+                self._time_http(event, queued, start)
+
+    async def _auto_refresh_token(self) -> None:
+        """
+        Refresh the token when it expires soon. Concurrent tasks wait for a single
+        in-flight refresh instead of each sending their own.
+        """
+        if not self._token_expires_soon():
+            return
+
+        if self._auth_lock is None:
+            self._auth_lock = Lock()
+
+        expiring_token = self.token
+        async with self._auth_lock:
+            # Another task may have refreshed the token while we were waiting
+            if self.token != expiring_token or not self._token_expires_soon():
+                return
+
+            started = monotonic()
+            _, result = await self._send(
+                "POST", self._build_url("auth/refresh"), data={"token": self.token}
+            )
+            new_token, _ = self._parse_result(result)
+            self._set_token(new_token["token"])
+            self._emit_token_refresh(monotonic() - started)
+
+    async def close(self) -> None:
+        """
+        Close the underlying transport, unless it was provided by the caller and may
+        be shared with other clients
+        """
+        if self._owns_transport:
+            await self.transport.close()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from json import dumps
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from requests import RequestException
+
+from ..exceptions import DirectusException
+
+
+@dataclass
+class BulkChunkResult:
+    """
+    The outcome of a single bulk request
+
+    Attributes
+    ----------
+    records: list
+        The records (or ids) sent in the request
+
+    data: list
+        The data returned by the API for these records
+
+    error: Exception
+        The error raised by the request, if it failed
+    """
+
+    records: List[Any]
+    data: List[Any] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
+@dataclass
+class BulkResult:
+    """
+    The outcome of a bulk operation, one chunk result per request sent
+    """
+
+    chunks: List[BulkChunkResult] = field(default_factory=list)
+
+    @property
+    def data(self) -> List[Any]:
+        return [entry for chunk in self.chunks for entry in chunk.data]
+
+    @property
+    def failed(self) -> List[Any]:
+        return [
+            record for chunk in self.chunks if chunk.error for record in chunk.records
+        ]
+
+    @property
+    def errors(self) -> List[Exception]:
+        return [chunk.error for chunk in self.chunks if chunk.error]
+
+
+def chunked(
+    records: Iterable[Any],
+    chunk_size: int = 100,
+    max_bytes: Optional[int] = None,
+    size_of: Callable[[Any], int] = lambda record: len(dumps(record).encode()),
+) -> Iterator[List[Any]]:
+    """
+    Split records into lists of at most `chunk_size` records and, if max_bytes is
+    set, of at most `max_bytes` bytes as measured by `size_of`. A record bigger than
+    max_bytes is sent alone in its own chunk.
+    """
+    if chunk_size < 1:
+        raise DirectusException("chunk_size must be a positive integer")
+
+    chunk: List[Any] = []
+    chunk_bytes = 0
+    for record in records:
+        record_bytes = size_of(record) if max_bytes is not None else 0
+        if chunk and (
+            len(chunk) >= chunk_size
+            or (max_bytes is not None and chunk_bytes + record_bytes > max_bytes)
+        ):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(record)
+        chunk_bytes += record_bytes
+
+    if chunk:
+        yield chunk
+
+
+def run_chunks(
+    chunks: Iterable[List[Any]],
+    send: Callable[[List[Any]], List[Any]],
+    max_in_flight: int = 1,
+) -> BulkResult:
+    """
+    Send each chunk with `send`, with at most `max_in_flight` requests at a time.
+    A failing chunk is recorded in the result without interrupting the others.
+    """
+
+    def run(chunk: List[Any]) -> BulkChunkResult:
+        try:
+            return BulkChunkResult(records=chunk, data=send(chunk))
+        except (DirectusException, RequestException) as error:
+            return BulkChunkResult(records=chunk, error=error)
+
+    if max_in_flight <= 1:
+        return BulkResult(chunks=[run(chunk) for chunk in chunks])
+
+    result = BulkResult()
+    chunks = iter(chunks)
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        pending: deque = deque(
+            executor.submit(run, chunk) for chunk in islice(chunks, max_in_flight)
+        )
+        while pending:
+            future: Future = pending.popleft()
+            following = next(chunks, None)
+            if following is not None:
+                pending.append(executor.submit(run, following))
+            result.chunks.append(future.result())
+
+    return result
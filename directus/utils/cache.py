@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+from ..exceptions import DirectusException
+from ..typing import RequestParams
+
+# (path, normalized params, identity of the client)
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], str]
+
+# Comma separated params whose order does not change the response
+UNORDERED_PARAMS = ("fields", "meta")
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a ReadCache, to tune its size and TTLs
+
+    Attributes
+    ----------
+    hits: int
+        Reads served from the cache
+
+    misses: int
+        Reads that had to be sent to the server (or revalidated)
+
+    revalidations: int
+        Expired entries served again after the server confirmed they did not change
+
+    evictions: int
+        Entries dropped to make room for new ones
+
+    invalidations: int
+        Entries dropped because the client wrote to the resource
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response body, the moment it expires and what is needed to revalidate
+    it once expired: the `ETag` and `Last-Modified` validators sent by the server,
+    or else the value of the modified field of the cached item.
+    """
+
+    body: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    modified: Optional[Any] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > monotonic()
+
+    @property
+    def revalidable(self) -> bool:
+        return bool(self.etag or self.last_modified) or self.modified is not None
+
+
+class ReadCache(object):
+    """
+    An in-memory LRU cache of response bodies, keyed on the request path, its
+    normalized params and the identity of the client (its project and the user of
+    its token), as the server filters responses by permissions. It is thread-safe
+    and can be shared by several clients, a client only reading the entries cached
+    for its own user.
+
+    Attributes
+    ----------
+    ttl: float
+        Number of seconds an entry is served before being fetched again
+
+    ttls: dict
+        Per-collection TTLs overriding `ttl`, keyed by collection name
+
+    max_entries: int
+        The maximum number of entries, least recently used entries are evicted first
+
+    max_bytes: int
+        The maximum total size of the cached bodies (None for no limit)
+
+    modified_field: str
+        The field holding the modification date of items, compared to revalidate
+        expired items when the server sends no validators (None to disable)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttls: Dict[str, float] = {},
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        modified_field: Optional[str] = "modified_on",
+    ):
+        if max_entries < 1:
+            raise DirectusException("max_entries must be a positive integer")
+
+        self.ttl = ttl
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.modified_field = modified_field
+        self.stats = CacheStats()
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(path: str, params: RequestParams, identity: str = "") -> CacheKey:
+        """
+        The cache key of a request sent with `identity`, identical for params
+        differing only by the order of their fields or meta
+        """
+        normalized = []
+        for name, value in params.items():
+            if name in UNORDERED_PARAMS and isinstance(value, str):
+                value = ",".join(sorted(value.split(",")))
+            normalized.append((name, str(value)))
+
+        return (path.strip("/"), tuple(sorted(normalized)), identity)
+
+    def ttl_for(self, path: str) -> float:
+        """
+        The TTL of a path, from the collection it belongs to
+        (`items/<collection>/...` or `collections/<collection>`)
+        """
+        parts = path.strip("/").split("/")
+        if len(parts) > 1 and parts[1] in self.ttls:
+            return self.ttls[parts[1]]
+
+        return self.ttl
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Returns
+        -------
+            The cached entry, possibly expired if it can be revalidated, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fresh:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry
+
+            self.stats.misses += 1
+            if entry is not None and not entry.revalidable:
+                self._drop(key)
+                return None
+
+            return entry
+
+    def renew(self, key: CacheKey) -> None:
+        """
+        Serve an expired entry for another TTL, once the server confirmed it is
+        still current
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = monotonic() + self.ttl_for(key[0])
+                self._entries.move_to_end(key)
+                self.stats.revalidations += 1
+
+    def set(
+        self,
+        key: CacheKey,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        modified: Optional[Any] = None,
+    ) -> None:
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or (self.max_bytes is not None and len(body) > self.max_bytes):
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = CacheEntry(
+                body=body,
+                expires_at=monotonic() + ttl,
+                etag=etag,
+                last_modified=last_modified,
+                modified=modified,
+            )
+            self.size += len(body)
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop the entries of a path and of the paths below it
+        (invalidating `items/sports` drops `items/sports/1`)
+        """
+        path = path.strip("/")
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == path or key[0].startswith(path + "/")
+            ]
+            for key in keys:
+                self._drop(key)
+            self.stats.invalidations += len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _drop(self, key: CacheKey) -> None:
+        self.size -= len(self._entries.pop(key).body)
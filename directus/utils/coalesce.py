@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import Future, ensure_future, shield
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..typing import RequestHeaders, RequestParams
+from .cache import ReadCache
+
+FlightKey = Tuple[Any, ...]
+
+
+def flight_key(
+    path: str, params: RequestParams, headers: RequestHeaders, identity: str
+) -> FlightKey:
+    """
+    The key of a GET request: its path, its normalized params (see ReadCache.key),
+    its headers and the identity it is sent with
+    """
+    return (*ReadCache.key(path, params, identity), tuple(sorted(headers.items())))
+
+
+def _in_path(key: FlightKey, path: str) -> bool:
+    return key[0] == path or key[0].startswith(path + "/")
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(object):
+    """
+    Deduplicate identical requests in flight across threads: the first caller
+    sends the request, the callers arriving while it is in flight wait for it and
+    get a copy of its result (or its exception).
+
+    Attributes
+    ----------
+    shared: int
+        The number of calls served by a request another caller sent
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls: Dict[FlightKey, _Call] = {}
+        self._lock = Lock()
+
+    def do(self, key: FlightKey, fetch: Callable[[], Any], copy: Callable[[Any], Any]):
+        with self._lock:
+            sent = self._calls.get(key)
+            leader = sent is None
+            if sent is None:
+                call = self._calls[key] = _Call()
+            else:
+                call = sent
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy(call.value)
+
+        try:
+            call.value = fetch()
+            return call.value
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def forget(self, path: str) -> None:
+        """
+        Let the following calls on a path (and the paths below it) send their own
+        request rather than join one sent before a write
+        """
+        path = path.strip("/")
+        with self._lock:
+            for key in [key for key in self._calls if _in_path(key, path)]:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(object):
+    """
+    The asyncio counterpart of SingleFlight. The request runs in its own task, so
+    that the cancellation of the caller that sent it does not cancel it for the
+    others.
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls: Dict[FlightKey, "Future[Any]"] = {}
+
+    async def do(
+        self,
+        key: FlightKey,
+        fetch: Callable[[], Awaitable[Any]],
+        copy: Callable[[Any], Any],
+    ):
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = ensure_future(fetch())
+            task.add_done_callback(lambda done: self._done(key, done))
+            return await shield(task)
+
+        self.shared += 1
+
+        return copy(await shield(task))
+
+    def _done(self, key: FlightKey, task: "Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # The error is raised to the callers, it must not be reported as unhandled
+        if not task.cancelled():
+            task.exception()
+
+    def forget(self, path: str) -> None:
+        path = path.strip("/")
+        for key in [key for key in self._calls if _in_path(key, path)]:
+            del self._calls[key]
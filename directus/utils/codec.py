@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from ..exceptions import DirectusException
+
+
+class JsonCodec(object):
+    """
+    Serialize request bodies and parse response bodies with the standard library
+    `json` module. A codec only needs `dumps` (object to bytes) and `loads` (bytes
+    to object, raising a ValueError on invalid input).
+    """
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    A faster codec backed by the optional `orjson` dependency
+    (`pip install directus[fast]`)
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise DirectusException(
+                "OrjsonCodec requires orjson, install it with `pip install orjson`"
+            )
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+def fastest_codec() -> JsonCodec:
+    """
+    The fastest codec available in the current environment
+    """
+    return OrjsonCodec() if orjson is not None else JsonCodec()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import zlib
+from typing import Any, Optional, Tuple
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import brotlicffi as brotli  # type: ignore
+    except ImportError:
+        brotli = None
+
+from ..exceptions import DirectusException
+
+# The response encodings the transports can decode, brotli requiring the optional
+# `brotli` (or `brotlicffi`) dependency
+ACCEPT_ENCODING = "br, gzip" if brotli is not None else "gzip"
+
+# What the error of a 400 response says when the server could not read a
+# compressed body, rather than reject its content
+DECODE_ERRORS = ("decode", "malformed", "syntax error", "payload can not be empty")
+
+
+def gzip_compress(data: bytes, level: int) -> bytes:
+    # A gzip stream without timestamp, so that identical bodies compress identically
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    return compressor.compress(data) + compressor.flush()
+
+
+def wire_size(response: Any) -> Optional[int]:
+    """
+    The size of a response body as transferred, before its content encoding is
+    decoded by the transport
+
+    Returns
+    -------
+        int, or None if the transport does not report it
+    """
+    if not response.headers.get("content-encoding"):
+        return len(response.content)
+
+    # httpx counts the bytes received, urllib3 the bytes read from the connection
+    downloaded = getattr(response, "num_bytes_downloaded", None)
+    if downloaded is None:
+        try:
+            downloaded = response.raw.tell()
+        except (AttributeError, ValueError):
+            downloaded = None
+    if downloaded:
+        return downloaded
+
+    length = response.headers.get("content-length")
+
+    return int(length) if length and length.isdigit() else None
+
+
+class Compression(object):
+    """
+    Compression of the request and response bodies, for links where the transfer
+    size is the bottleneck. Responses are requested gzip or brotli encoded, and the
+    JSON request bodies of at least `min_size` bytes are sent gzip compressed.
+
+    Servers may not accept compressed request bodies: a request answered with one
+    of `reject_statuses`, or with a 400 error saying that the body could not be
+    decoded, is sent again uncompressed, and if that one succeeds, no request body
+    is compressed anymore. Other 400 errors (invalid payloads) are not sent twice.
+    The compression can be shared by the clients of a server.
+
+    Attributes
+    ----------
+    min_size: int
+        The size from which request bodies are compressed (None to only compress
+        the responses)
+
+    level: int
+        The gzip compression level, from 1 (fastest) to 9 (smallest)
+
+    reject_statuses: tuple
+        The statuses of a response rejecting a compressed request body
+
+    rejected: bool
+        True once the server rejected a compressed request body
+    """
+
+    def __init__(
+        self,
+        min_size: Optional[int] = 1024,
+        level: int = 6,
+        reject_statuses: Tuple[int, ...] = (415,),
+    ):
+        if not 1 <= level <= 9:
+            raise DirectusException("The compression level must be between 1 and 9")
+
+        self.min_size = min_size
+        self.level = level
+        self.reject_statuses = reject_statuses
+        self.rejected = False
+        self.accept_encoding = ACCEPT_ENCODING
+
+    def compress(self, body: Optional[bytes]) -> Optional[bytes]:
+        """
+        Returns
+        -------
+            The gzip compressed body, or None if it is not to be compressed
+        """
+        if (
+            body is None
+            or self.rejected
+            or self.min_size is None
+            or len(body) < self.min_size
+        ):
+            return None
+
+        return gzip_compress(body, self.level)
+
+    def rejects(self, status: int, error: Optional[str] = None) -> bool:
+        """
+        Whether a response with `status` and `error` message rejected a compressed
+        request body
+        """
+        if status in self.reject_statuses:
+            return True
+
+        return (
+            status == 400
+            and error is not None
+            and any(message in error.lower() for message in DECODE_ERRORS)
+        )
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike, fspath, remove, replace
+from os.path import exists, getsize
+from threading import Lock
+from typing import Callable, List, Optional, Set, Tuple, Union
+
+from requests import Response
+
+from ..exceptions import DirectusException
+from .multipart import CHUNK_SIZE, ProgressCallback
+
+# (first byte, last byte or None for the end of the file)
+ByteRange = Tuple[int, Optional[int]]
+OpenRange = Callable[[Optional[ByteRange]], Response]
+
+PART_SIZE = 8 * 1024 * 1024
+
+# The file fields needed to download its content
+FILE_DOWNLOAD_FIELDS = ["id", "filename_disk", "filesize", "data"]
+
+
+class RangesNotSupported(DirectusException):
+    """
+    The server answered a range request with the whole file
+    """
+
+
+def split_ranges(size: int, part_size: int = PART_SIZE) -> List[Tuple[int, int]]:
+    return [
+        (start, min(start + part_size, size) - 1) for start in range(0, size, part_size)
+    ]
+
+
+def download(
+    open_range: OpenRange,
+    dest: Union[str, PathLike],
+    size: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    part_size: int = PART_SIZE,
+    max_in_flight: int = 4,
+    resume: bool = True,
+    progress: Optional[ProgressCallback] = None,
+) -> str:
+    """
+    Download a file to `dest`, `chunk_size` bytes at a time, through a `.part` file
+    renamed once the download is complete. `open_range` sends the request for a
+    range of bytes (or the whole file for None) and returns the streamed response.
+
+    When the size is known and bigger than `part_size`, the file is fetched as
+    `part_size` ranges, up to `max_in_flight` at a time, falling back to a single
+    request if the server does not support ranges. With `resume`, an interrupted
+    download continues from what the `.part` file already holds.
+
+    Returns
+    -------
+        str (the path of the downloaded file)
+    """
+    dest = fspath(dest)
+    partial = dest + ".part"
+
+    # The partial file of an interrupted ranged download is sparse, it is resumed
+    # from its log of completed ranges
+    if size is not None and (
+        exists(partial + ".ranges") or (max_in_flight > 1 and size > part_size)
+    ):
+        try:
+            download_ranges(
+                open_range,
+                partial,
+                size,
+                chunk_size=chunk_size,
+                part_size=part_size,
+                max_in_flight=max_in_flight,
+                resume=resume,
+                progress=progress,
+            )
+        except RangesNotSupported:
+            download_stream(
+                open_range, partial, size, chunk_size, resume=False, progress=progress
+            )
+    else:
+        download_stream(open_range, partial, size, chunk_size, resume, progress)
+
+    replace(partial, dest)
+
+    return dest
+
+
+def download_stream(
+    open_range: OpenRange,
+    partial: str,
+    size: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = True,
+    progress: Optional[ProgressCallback] = None,
+) -> None:
+    """
+    Download a file with a single request, appending to the bytes already held by
+    the partial file when resuming. A partial file left by download_ranges is
+    downloaded again from the start.
+    """
+    log = partial + ".ranges"
+    if exists(log):
+        # Its size is the size of the file, whatever the ranges it holds
+        remove(log)
+        resume = False
+
+    offset = getsize(partial) if resume and exists(partial) else 0
+    if size is not None and offset > size:
+        offset = 0
+    if size is not None and offset == size and offset > 0:
+        return
+
+    response = open_range((offset, None) if offset else None)
+    with response:
+        if response.status_code != 206:
+            offset = 0
+
+        with open(partial, "r+b" if offset else "wb") as file:
+            file.seek(offset)
+            file.truncate()
+            for chunk in response.iter_content(chunk_size):
+                file.write(chunk)
+                offset += len(chunk)
+                if progress is not None:
+                    progress(offset, size)
+
+    if size is not None and offset != size:
+        raise DirectusException(f"Incomplete download: {offset} of {size} bytes")
+
+
+def download_ranges(
+    open_range: OpenRange,
+    partial: str,
+    size: int,
+    chunk_size: int = CHUNK_SIZE,
+    part_size: int = PART_SIZE,
+    max_in_flight: int = 4,
+    resume: bool = True,
+    progress: Optional[ProgressCallback] = None,
+) -> None:
+    """
+    Download a file as concurrent range requests, each written at its offset in the
+    partial file. Completed ranges are logged next to it so that resuming only
+    fetches the missing ones.
+    """
+    log = partial + ".ranges"
+    ranges = split_ranges(size, part_size)
+
+    done: Set[str] = set()
+    if resume and exists(partial) and exists(log) and getsize(partial) == size:
+        with open(log) as log_file:
+            done = set(log_file.read().split())
+    else:
+        with open(partial, "wb") as file:
+            file.truncate(size)
+        open(log, "w").close()
+
+    lock = Lock()
+    downloaded = sum(
+        end - start + 1 for start, end in ranges if f"{start}-{end}" in done
+    )
+
+    def fetch(byte_range: Tuple[int, int]) -> None:
+        nonlocal downloaded
+        start, end = byte_range
+        written = 0
+        with open_range(byte_range) as response:
+            if response.status_code != 206:
+                raise RangesNotSupported("The server does not support range requests")
+
+            with open(partial, "r+b") as file:
+                file.seek(start)
+                for chunk in response.iter_content(chunk_size):
+                    # Never write past the range, into one another thread may own
+                    chunk = chunk[: end - start + 1 - written]
+                    file.write(chunk)
+                    written += len(chunk)
+                    with lock:
+                        downloaded += len(chunk)
+                        if progress is not None:
+                            progress(downloaded, size)
+
+        if written != end - start + 1:
+            raise DirectusException(
+                f"Incomplete range {start}-{end}: {written} bytes received"
+            )
+
+        with lock, open(log, "a") as file:
+            file.write(f"{start}-{end}\n")
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        futures = [
+            executor.submit(fetch, byte_range)
+            for byte_range in ranges
+            if f"{byte_range[0]}-{byte_range[1]}" not in done
+        ]
+        for future in futures:
+            future.result()
+
+    remove(log)
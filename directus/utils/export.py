@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from csv import DictWriter
+from dataclasses import dataclass
+from io import TextIOWrapper
+from os import PathLike
+from time import perf_counter
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from ..exceptions import DirectusException
+from ..typing import Item, RequestFields
+from .codec import JsonCodec
+
+ExportDestination = Union[str, PathLike, BinaryIO]
+
+# Directus field types that are not columns of the collection table
+VIRTUAL_TYPES = frozenset(["alias", "o2m", "m2m", "translation"])
+
+# Arrow types of the Directus field types, other types are exported as strings
+# (JSON encoded for objects and lists)
+ARROW_TYPES = {
+    "integer": "int64",
+    "sort": "int64",
+    "decimal": "float64",
+    "boolean": "bool_",
+}
+
+
+@dataclass
+class ExportStats:
+    """
+    The outcome of an export
+
+    Attributes
+    ----------
+    rows: int
+        The number of rows written
+
+    pages: int
+        The number of pages fetched
+
+    bytes: int
+        The size of the written output (None if it could not be measured)
+
+    seconds: float
+        The duration of the export, requests included
+    """
+
+    rows: int = 0
+    pages: int = 0
+    bytes: Optional[int] = None
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        if self.bytes is None:
+            return None
+
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+def schema_columns(
+    schema: Union[Dict[str, dict], List[dict]], fields: RequestFields = ["*"]
+) -> Dict[str, str]:
+    """
+    The exported columns and their Directus types, from the `fields` of a collection
+    (as returned by get_collection) restricted to the requested fields. Nested
+    fields (`author.name`) are exported in their top level column.
+
+    Returns
+    -------
+        dict (column name: Directus field type)
+    """
+    if isinstance(schema, list):
+        schema = {field["field"]: field for field in schema}
+
+    requested = [field.split(".")[0] for field in fields if field != "*"]
+    columns = {}
+    for name, field in schema.items():
+        if name in requested or (
+            "*" in fields and field.get("type") not in VIRTUAL_TYPES
+        ):
+            columns[name] = field.get("type") or "string"
+    for name in requested:
+        columns.setdefault(name, "string")
+
+    return columns
+
+
+class ExportWriter(ABC):
+    """
+    Write pages of items to a binary file. `columns` maps the exported columns to
+    their Directus type, or is None to take the columns of the first page.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        columns: Optional[Dict[str, str]] = None,
+        codec: Optional[JsonCodec] = None,
+    ):
+        self.file = file
+        self.columns = columns
+        self.codec = codec or JsonCodec()
+
+    @abstractmethod
+    def write(self, rows: List[Item]) -> None:
+        """
+        Write a page of items
+        """
+
+    def close(self) -> None:
+        pass
+
+    def _text(self, value: Any) -> Any:
+        if isinstance(value, (dict, list)):
+            return self.codec.dumps(value).decode("utf-8")
+
+        return value
+
+
+class NdjsonWriter(ExportWriter):
+    """
+    One JSON object per line, with all the fields of the items
+    """
+
+    def write(self, rows: List[Item]) -> None:
+        self.file.write(b"".join(self.codec.dumps(row) + b"\n" for row in rows))
+
+
+class CsvWriter(ExportWriter):
+    """
+    A CSV file with a header row, objects and lists being JSON encoded
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._text_file = TextIOWrapper(self.file, encoding="utf-8", newline="")
+        self._writer: Optional[DictWriter] = None
+
+    def write(self, rows: List[Item]) -> None:
+        if self._writer is None:
+            if self.columns is None:
+                self.columns = {name: "string" for name in rows[0]} if rows else {}
+            self._writer = DictWriter(
+                self._text_file, fieldnames=list(self.columns), extrasaction="ignore"
+            )
+            self._writer.writeheader()
+
+        columns = self.columns or {}
+        self._writer.writerows(
+            {name: self._text(row.get(name)) for name in columns} for row in rows
+        )
+
+    def close(self) -> None:
+        self._text_file.flush()
+        # Leave the binary file open, it is closed by its owner
+        self._text_file.detach()
+
+
+def import_pyarrow() -> Any:
+    """
+    Import pyarrow on first use, so that importing directus does not load it
+
+    Returns
+    -------
+        The pyarrow module, with its ipc and parquet modules
+    """
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.ipc  # type: ignore
+        import pyarrow.parquet  # type: ignore
+    except ImportError:
+        raise DirectusException(
+            "Arrow and Parquet exports require pyarrow, install it with `pip install pyarrow`"
+        )
+
+    return pyarrow
+
+
+class ArrowWriter(ExportWriter):
+    """
+    Arrow record batches written as a Parquet file, or as an Arrow IPC file if not
+    `parquet`. Requires the optional `pyarrow` dependency
+    (`pip install directus[arrow]`).
+    """
+
+    def __init__(self, *args, parquet: bool = True, **kwargs):
+        self.pyarrow = import_pyarrow()
+        super().__init__(*args, **kwargs)
+        self.parquet = parquet
+        self._schema = self._arrow_schema(self.columns) if self.columns else None
+        self._writer = None
+
+    def _arrow_schema(self, columns: Dict[str, str]) -> Any:
+        return self.pyarrow.schema(
+            [
+                (name, getattr(self.pyarrow, ARROW_TYPES.get(type, "string"))())
+                for name, type in columns.items()
+            ]
+        )
+
+    def _converter(self, type: Any) -> Callable[[Any], Any]:
+        """
+        Directus may return numbers and booleans as strings, they are converted to
+        the type of their column
+        """
+        convert: Callable[[Any], Any]
+        if self.pyarrow.types.is_integer(type):
+            convert = int
+        elif self.pyarrow.types.is_floating(type):
+            convert = float
+        elif self.pyarrow.types.is_boolean(type):
+            convert = lambda value: (
+                value in ("1", "true") if isinstance(value, str) else bool(value)
+            )
+        elif self.pyarrow.types.is_string(type):
+            convert = lambda value: str(self._text(value))
+        else:
+            return lambda value: value
+
+        return lambda value: convert(value) if value is not None else None
+
+    def write(self, rows: List[Item]) -> None:
+        if not rows:
+            return
+
+        if self._schema is None:
+            self._schema = self.pyarrow.RecordBatch.from_pylist(rows).schema
+
+        converters = [self._converter(field.type) for field in self._schema]
+        batch = self.pyarrow.RecordBatch.from_arrays(
+            [
+                self.pyarrow.array(
+                    [convert(row.get(field.name)) for row in rows], field.type
+                )
+                for field, convert in zip(self._schema, converters)
+            ],
+            schema=self._schema,
+        )
+        self._open_writer().write_batch(batch)
+
+    def _open_writer(self):
+        if self._writer is None:
+            self._writer = (
+                self.pyarrow.parquet.ParquetWriter(self.file, self._schema)
+                if self.parquet
+                else self.pyarrow.ipc.new_file(self.file, self._schema)
+            )
+
+        return self._writer
+
+    def close(self) -> None:
+        # Without any row, an empty file is still written if the schema is known
+        if self._writer is not None or self._schema is not None:
+            self._open_writer().close()
+
+
+WRITERS: Dict[str, Callable[..., ExportWriter]] = {
+    "ndjson": NdjsonWriter,
+    "csv": CsvWriter,
+    "parquet": lambda *args, **kwargs: ArrowWriter(*args, parquet=True, **kwargs),
+    "arrow": lambda *args, **kwargs: ArrowWriter(*args, parquet=False, **kwargs),
+}
+
+
+def check_format(format: str) -> None:
+    if format not in WRITERS:
+        raise DirectusException(
+            f"Unknown export format {format}, use one of {', '.join(WRITERS)}"
+        )
+
+
+@contextmanager
+def _open_destination(dest: ExportDestination) -> Iterator[BinaryIO]:
+    if isinstance(dest, (str, PathLike)):
+        with open(dest, "wb") as file:
+            yield file
+    else:
+        yield dest
+
+
+def export(
+    pages: Iterable[List[Item]],
+    dest: ExportDestination,
+    format: str = "ndjson",
+    columns: Optional[Dict[str, str]] = None,
+    codec: Optional[JsonCodec] = None,
+) -> ExportStats:
+    """
+    Write pages of items to `dest` (a path or a binary file object) one page at a
+    time, in the `ndjson`, `csv`, `parquet` or `arrow` format
+
+    Returns
+    -------
+        ExportStats
+    """
+    check_format(format)
+
+    stats = ExportStats()
+    start = perf_counter()
+    with _open_destination(dest) as file:
+        position = file.tell() if file.seekable() else None
+        writer = WRITERS[format](file, columns=columns, codec=codec)
+        for page in pages:
+            writer.write(page)
+            stats.rows += len(page)
+            stats.pages += 1
+        writer.close()
+
+        if position is not None:
+            stats.bytes = file.tell() - position
+
+    stats.seconds = perf_counter() - start
+
+    return stats
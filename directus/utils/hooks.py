@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ..exceptions import DirectusException
+
+EVENTS = (
+    "before_request",
+    "after_response",
+    "on_error",
+    "on_retry",
+    "on_token_refresh",
+)
+
+# Path segments naming an action rather than a resource, kept as is in templates
+ACTION_SEGMENTS = frozenset(
+    ["authenticate", "refresh", "revisions", "revert", "password", "request", "reset"]
+)
+
+# Resources whose second path segment is a collection name
+COLLECTION_RESOURCES = frozenset(["items", "collections", "fields", "relations"])
+
+
+def templated_path(path: str) -> str:
+    """
+    The path of a request with its variable segments replaced by placeholders, so
+    that requests to the same endpoint are reported together
+    (`items/sports/1` becomes `items/{collection}/{id}`)
+    """
+    parts = path.strip("/").split("/")
+    template = parts[:1]
+    for index, part in enumerate(parts[1:], start=1):
+        if part in ACTION_SEGMENTS:
+            template.append(part)
+        elif index == 1 and parts[0] in COLLECTION_RESOURCES:
+            template.append("{collection}")
+        else:
+            template.append("{id}")
+
+    return "/".join(template)
+
+
+@dataclass
+class RequestEvent:
+    """
+    A single attempt of a request, as reported to the hooks
+
+    Attributes
+    ----------
+    method: str
+        The HTTP method
+
+    url: str
+        The requested url, without its query string
+
+    path: str
+        The templated path of the request in the project (e.g.
+        `items/{collection}/{id}`), or the url for requests outside the project
+
+    attempt: int
+        The attempt number, starting at 1
+
+    status: int
+        The response status, None until a response is received
+
+    bytes_sent: int
+        The size of the request body (None if unknown, e.g. streamed)
+
+    bytes_received: int
+        The size of the response body
+
+    wire_bytes_sent, wire_bytes_received: int
+        The size of the bodies as transferred, smaller than bytes_sent and
+        bytes_received when they are compressed (None if unknown)
+
+    timings: dict
+        Seconds spent in each phase: `queue` (waiting for the throttle), `http`
+        (sending the request and receiving the response), split into `ttfb` (until
+        the response headers) and `download` when the transport reports it, then
+        `decode` (parsing the JSON body)
+
+    error: Exception
+        The error the attempt failed with
+
+    retry_delay: float
+        The seconds waited before the next attempt, for retried attempts
+
+    context: dict
+        Free storage for the listeners, e.g. to keep a span between events
+    """
+
+    method: str
+    url: str
+    path: str
+    attempt: int = 1
+    status: Optional[int] = None
+    bytes_sent: Optional[int] = None
+    bytes_received: Optional[int] = None
+    wire_bytes_sent: Optional[int] = None
+    wire_bytes_received: Optional[int] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[BaseException] = None
+    retry_delay: Optional[float] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """
+        The total time of the attempt, the `ttfb` and `download` phases being
+        part of `http`
+        """
+        return sum(
+            seconds
+            for phase, seconds in self.timings.items()
+            if phase in ("queue", "http", "decode")
+        )
+
+
+@dataclass
+class TokenRefreshEvent:
+    """
+    A refresh of the access token
+
+    Attributes
+    ----------
+    seconds: float
+        The duration of the refresh request
+
+    expires_at: float
+        The expiry of the new token, as a UNIX timestamp (None if unknown)
+    """
+
+    seconds: float
+    expires_at: Optional[float] = None
+
+
+Hook = Callable[[Any], None]
+
+
+class Hooks(object):
+    """
+    Callbacks called by the api client around each request:
+
+    - `before_request(RequestEvent)`: before each attempt is sent
+    - `after_response(RequestEvent)`: once the final response is decoded
+    - `on_error(RequestEvent)`: when a request fails, with a connection error or
+      an error returned by the API
+    - `on_retry(RequestEvent)`: when an attempt fails and is going to be retried
+    - `on_token_refresh(TokenRefreshEvent)`: after the access token is refreshed
+
+    Callbacks run in the thread (or task) sending the request and must be quick.
+    An exception raised by a callback is raised to the caller of the request.
+    Without any callback, the client skips building the events altogether.
+    """
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Hook]] = {event: [] for event in EVENTS}
+
+    def __bool__(self) -> bool:
+        return any(self._hooks.values())
+
+    def add(self, event: str, hook: Hook) -> Hook:
+        """
+        Returns
+        -------
+            The hook (to remove it later)
+        """
+        if event not in self._hooks:
+            raise DirectusException(
+                f"Unknown hook event {event}, use one of {', '.join(EVENTS)}"
+            )
+
+        self._hooks[event].append(hook)
+
+        return hook
+
+    def remove(self, event: str, hook: Hook) -> None:
+        if hook in self._hooks.get(event, []):
+            self._hooks[event].remove(hook)
+
+    def add_listener(self, listener: Any) -> Any:
+        """
+        Register the methods of `listener` named after the events (see
+        MetricsCollector)
+        """
+        for event in EVENTS:
+            hook = getattr(listener, event, None)
+            if hook is not None:
+                self.add(event, hook)
+
+        return listener
+
+    def emit(self, event: str, payload: Any) -> None:
+        for hook in self._hooks[event]:
+            hook(payload)
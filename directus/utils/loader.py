@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import Future, Task, gather, get_running_loop
+from threading import Lock
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import quote
+
+from ..typing import Item
+from .bulk import chunked
+
+LoaderKey = Tuple[str, Hashable]
+# The related collection of each relation field
+Prefetch = Dict[str, str]
+
+
+def id_batches(
+    ids: Iterable[Hashable], max_batch_size: int = 100, max_url_length: int = 2000
+) -> Iterator[List[Hashable]]:
+    """
+    Split ids into lists of at most `max_batch_size` ids whose `in` filter stays
+    within `max_url_length` characters once url encoded
+    """
+    return chunked(
+        ids,
+        chunk_size=max_batch_size,
+        max_bytes=max_url_length,
+        # The id and its url encoded comma separator
+        size_of=lambda id: len(quote(str(id), safe="")) + 3,
+    )
+
+
+def relation_ids(items: List[Item], prefetch: Prefetch) -> Dict[str, List[Hashable]]:
+    """
+    The distinct ids referenced by the relation fields of the items, by related
+    collection. Relations already expanded by the server are left out.
+
+    Returns
+    -------
+        dict (related collection: list of ids)
+    """
+    ids: Dict[str, Dict[Hashable, None]] = {}
+    for field, collection in prefetch.items():
+        for item in items:
+            value = item.get(field)
+            if value is not None and not isinstance(value, (dict, list)):
+                ids.setdefault(collection, {})[value] = None
+
+    return {collection: list(values) for collection, values in ids.items()}
+
+
+def attach_relations(
+    items: List[Item],
+    prefetch: Prefetch,
+    related: Callable[[str, Hashable], Optional[Item]],
+) -> List[Item]:
+    """
+    Replace the ids of the relation fields by the related items (or None if the
+    related item could not be read)
+    """
+    for field, collection in prefetch.items():
+        for item in items:
+            value = item.get(field)
+            if value is not None and not isinstance(value, (dict, list)):
+                item[field] = related(collection, value)
+
+    return items
+
+
+class PendingItem(object):
+    """
+    An item requested from an ItemLoader, fetched along with the other pending
+    items when its result is first needed
+    """
+
+    def __init__(self, loader: "ItemLoader", key: LoaderKey):
+        self.loader = loader
+        self.key = key
+
+    def result(self) -> Optional[Item]:
+        """
+        Returns
+        -------
+            Item, or None if it does not exist or cannot be read
+        """
+        return self.loader._result(self.key)
+
+
+class ItemLoader(object):
+    """
+    Batch and deduplicate the items requested by id, so that N lookups cost one
+    `in` filtered request per collection instead of N requests.
+
+    `load` only registers an id and returns a PendingItem. All pending ids are
+    fetched when a result is needed, when `dispatch` is called or when leaving the
+    loader used as a context manager. Loaded items are kept, so that each item is
+    fetched once for the lifetime of the loader.
+
+    Attributes
+    ----------
+    fetch: callable
+        Fetch the items of a collection from a list of ids
+
+    primary_key: str
+        The field identifying the items in the fetched results
+
+    max_batch_size: int
+        The maximum number of ids per request
+
+    max_url_length: int
+        The maximum length of the url encoded ids of a request
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, List[Hashable]], List[Item]],
+        primary_key: str = "id",
+        max_batch_size: int = 100,
+        max_url_length: int = 2000,
+    ):
+        self.fetch = fetch
+        self.primary_key = primary_key
+        self.max_batch_size = max_batch_size
+        self.max_url_length = max_url_length
+        self._pending: Dict[str, Dict[Hashable, None]] = {}
+        self._loaded: Dict[LoaderKey, Optional[Item]] = {}
+        self._lock = Lock()
+
+    def load(self, collection: str, id: Hashable) -> PendingItem:
+        key = (collection, id)
+        with self._lock:
+            if key not in self._loaded:
+                self._pending.setdefault(collection, {})[id] = None
+
+        return PendingItem(self, key)
+
+    def load_many(
+        self, collection: str, ids: Iterable[Hashable]
+    ) -> List[Optional[Item]]:
+        """
+        Returns
+        -------
+            List of Item (None for the ids that do not exist or cannot be read)
+        """
+        pending = [self.load(collection, id) for id in ids]
+        self.dispatch()
+
+        return [item.result() for item in pending]
+
+    def prime(self, collection: str, item: Item) -> None:
+        """
+        Add an already known item, so that it is not fetched
+        """
+        with self._lock:
+            self._loaded[(collection, item[self.primary_key])] = item
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded.clear()
+
+    def dispatch(self) -> None:
+        """
+        Fetch all the pending ids, one request per collection and batch of ids
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        batches = [
+            (collection, batch)
+            for collection, ids in pending.items()
+            for batch in id_batches(ids, self.max_batch_size, self.max_url_length)
+        ]
+        for index, (collection, batch) in enumerate(batches):
+            try:
+                items = self.fetch(collection, batch)
+            except Exception:
+                # Keep the ids not fetched yet for the next dispatch
+                with self._lock:
+                    for unfetched_collection, unfetched in batches[index:]:
+                        self._pending.setdefault(unfetched_collection, {}).update(
+                            dict.fromkeys(unfetched)
+                        )
+                raise
+
+            found = {item[self.primary_key]: item for item in items}
+            with self._lock:
+                for id in batch:
+                    self._loaded[(collection, id)] = found.get(id)
+
+    def _result(self, key: LoaderKey) -> Optional[Item]:
+        if key not in self._loaded:
+            self.dispatch()
+
+        return self._loaded.get(key)
+
+    def __enter__(self) -> "ItemLoader":
+        return self
+
+    def __exit__(self, error_type, *args) -> None:
+        if error_type is None:
+            self.dispatch()
+
+
+class AsyncItemLoader(object):
+    """
+    The asyncio counterpart of ItemLoader: the ids requested with `load` during
+    an event loop iteration are fetched together on the next one, the requests of
+    the different collections and batches being sent concurrently.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, List[Hashable]], Awaitable[List[Item]]],
+        primary_key: str = "id",
+        max_batch_size: int = 100,
+        max_url_length: int = 2000,
+    ):
+        self.fetch = fetch
+        self.primary_key = primary_key
+        self.max_batch_size = max_batch_size
+        self.max_url_length = max_url_length
+        self._pending: Dict[str, Dict[Hashable, None]] = {}
+        self._futures: Dict[LoaderKey, "Future[Optional[Item]]"] = {}
+        self._scheduled = False
+        self._tasks: Set[Task] = set()
+
+    def load(self, collection: str, id: Hashable) -> "Future[Optional[Item]]":
+        key = (collection, id)
+        if key not in self._futures:
+            loop = get_running_loop()
+            self._futures[key] = loop.create_future()
+            self._pending.setdefault(collection, {})[id] = None
+            if not self._scheduled:
+                # The task runs once the coroutines already scheduled have run and
+                # requested their ids
+                self._scheduled = True
+                task = loop.create_task(self.dispatch())
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        return self._futures[key]
+
+    async def load_many(
+        self, collection: str, ids: Iterable[Hashable]
+    ) -> List[Optional[Item]]:
+        return list(await gather(*[self.load(collection, id) for id in ids]))
+
+    def prime(self, collection: str, item: Item) -> None:
+        future = get_running_loop().create_future()
+        future.set_result(item)
+        self._futures[(collection, item[self.primary_key])] = future
+
+    def clear(self) -> None:
+        self._futures = {
+            key: future for key, future in self._futures.items() if not future.done()
+        }
+
+    async def dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+
+        await gather(
+            *[
+                self._fetch_batch(collection, batch)
+                for collection, ids in pending.items()
+                for batch in id_batches(ids, self.max_batch_size, self.max_url_length)
+            ]
+        )
+
+    async def _fetch_batch(self, collection: str, batch: List[Hashable]) -> None:
+        try:
+            items = await self.fetch(collection, batch)
+        except Exception as error:
+            for id in batch:
+                future = self._futures.pop((collection, id))
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        found: Dict[Any, Item] = {item[self.primary_key]: item for item in items}
+        for id in batch:
+            future = self._futures[(collection, id)]
+            if not future.done():
+                future.set_result(found.get(id))
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from .hooks import RequestEvent, TokenRefreshEvent
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (method, templated path)
+Endpoint = Tuple[str, str]
+
+
+class Histogram(object):
+    """
+    Counts of observations per bucket, the last bucket holding the observations
+    above the highest bound
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        An estimate of the `q` quantile: the upper bound of the bucket it falls in
+        (None if it falls above the highest bound, or without observations)
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+
+        return None
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    The metrics of an endpoint
+
+    Attributes
+    ----------
+    requests: int
+        The number of responses received
+
+    errors: int
+        The number of failed requests (connection errors and API errors)
+
+    retries: int
+        The number of attempts retried
+
+    statuses: dict
+        The number of responses per status
+
+    bytes_sent: int
+        The total size of the request bodies
+
+    bytes_received: int
+        The total size of the response bodies
+
+    wire_bytes_sent, wire_bytes_received: int
+        The total size of the bodies as transferred, once compressed
+
+    latency: Histogram
+        The duration of the requests, in seconds
+
+    phases: dict
+        The total seconds spent in each phase (see RequestEvent.timings)
+    """
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    wire_bytes_sent: int = 0
+    wire_bytes_received: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    phases: Dict[str, float] = field(default_factory=dict)
+
+
+def _first(*sizes: Optional[int]) -> int:
+    return next((size for size in sizes if size is not None), 0)
+
+
+class MetricsCollector(object):
+    """
+    In-process counters and latency histograms per endpoint (method and templated
+    path), fed by the client hooks:
+
+        metrics = MetricsCollector()
+        hooks = Hooks()
+        hooks.add_listener(metrics)
+        client = DirectusClient(..., hooks=hooks)
+
+    It is thread-safe and can collect the requests of several clients.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.endpoints: Dict[Endpoint, EndpointMetrics] = {}
+        self.token_refreshes: List[float] = []
+        self._lock = Lock()
+
+    def _endpoint(self, event: RequestEvent) -> EndpointMetrics:
+        key = (event.method, event.path)
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointMetrics(latency=Histogram(self.buckets))
+
+        return self.endpoints[key]
+
+    def _record_transfer(self, metrics: EndpointMetrics, event: RequestEvent) -> None:
+        metrics.bytes_sent += event.bytes_sent or 0
+        metrics.bytes_received += event.bytes_received or 0
+        metrics.wire_bytes_sent += _first(event.wire_bytes_sent, event.bytes_sent)
+        metrics.wire_bytes_received += _first(
+            event.wire_bytes_received, event.bytes_received
+        )
+        for phase, seconds in event.timings.items():
+            metrics.phases[phase] = metrics.phases.get(phase, 0.0) + seconds
+
+    def after_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoint(event)
+            metrics.requests += 1
+            if event.status is not None:
+                metrics.statuses[event.status] = (
+                    metrics.statuses.get(event.status, 0) + 1
+                )
+            metrics.latency.observe(event.duration)
+            self._record_transfer(metrics, event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoint(event)
+            metrics.errors += 1
+            # Errors returned by the API were already counted as responses
+            if event.status is None:
+                self._record_transfer(metrics, event)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoint(event)
+            metrics.retries += 1
+            self._record_transfer(metrics, event)
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        with self._lock:
+            self.token_refreshes.append(event.seconds)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns
+        -------
+            dict ("METHOD templated/path": dict of metrics)
+        """
+        with self._lock:
+            return {
+                f"{method} {path}": {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "retries": metrics.retries,
+                    "statuses": dict(metrics.statuses),
+                    "bytes_sent": metrics.bytes_sent,
+                    "bytes_received": metrics.bytes_received,
+                    "wire_bytes_sent": metrics.wire_bytes_sent,
+                    "wire_bytes_received": metrics.wire_bytes_received,
+                    "latency_mean": metrics.latency.mean,
+                    "latency_p50": metrics.latency.quantile(0.5),
+                    "latency_p95": metrics.latency.quantile(0.95),
+                    "latency_p99": metrics.latency.quantile(0.99),
+                    "phases": dict(metrics.phases),
+                }
+                for (method, path), metrics in self.endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints.clear()
+            self.token_refreshes.clear()
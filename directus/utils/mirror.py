@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+
+import sqlite3
+from dataclasses import dataclass
+from os import PathLike
+from threading import Lock
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from ..exceptions import DirectusException
+from ..typing import Item
+from .codec import JsonCodec
+from .export import schema_columns
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..directus import DirectusClient
+
+# SQLite types of the Directus field types, other fields are stored as TEXT
+SQLITE_TYPES = {
+    "integer": "INTEGER",
+    "sort": "INTEGER",
+    "decimal": "REAL",
+    "boolean": "INTEGER",
+}
+
+# Directus field types whose values may be objects or lists, stored JSON encoded
+JSON_TYPES = frozenset(
+    ["json", "array", "file", "m2o", "o2m", "translation", "owner", "user_updated"]
+)
+
+STATE_TABLE = "_directus_sync"
+
+
+@dataclass
+class SyncResult:
+    """
+    The outcome of the synchronization of a collection
+
+    Attributes
+    ----------
+    collection: str
+        The synchronized collection
+
+    full: bool
+        True if the whole collection was loaded, False if only changes were fetched
+
+    upserted: int
+        The number of rows inserted or updated
+
+    deleted: int
+        The number of rows deleted because they no longer exist on the server
+
+    seconds: float
+        The duration of the synchronization
+    """
+
+    collection: str
+    full: bool
+    upserted: int = 0
+    deleted: int = 0
+    seconds: float = 0.0
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SqliteMirror(object):
+    """
+    A local SQLite copy of Directus collections, kept up to date incrementally.
+
+    The first sync of a collection loads it entirely, with one table per collection
+    whose columns come from the collection fields (see get_collection). Following
+    syncs only fetch the items whose `modified_field` is at or after the highest
+    value seen so far, and delete the rows whose primary key is no longer listed by
+    the server (a request of primary keys only). Collections without the modified
+    field are loaded entirely on each sync.
+
+    Items are fetched with keyset pagination, so that writes on the server during a
+    sync do not shift the following pages. The database is only locked while each
+    fetched page is written, local reads go on during a sync.
+
+    Attributes
+    ----------
+    client: DirectusClient
+        The client the collections are fetched with
+
+    path: str
+        The SQLite database file (":memory:" for an in-memory mirror)
+
+    modified_field: str
+        The field holding the modification date of the items
+
+    indexes: dict
+        Columns to index for local lookups, by collection (the primary key is
+        always indexed)
+
+    limit: int
+        The number of items fetched per request
+
+    status: str
+        The status filter applied to the fetched items (see get_items_list)
+    """
+
+    def __init__(
+        self,
+        client: "DirectusClient",
+        path: Union[str, PathLike] = ":memory:",
+        modified_field: str = "modified_on",
+        indexes: Dict[str, List[str]] = {},
+        limit: int = 500,
+        status: Optional[str] = None,
+    ):
+        self.client = client
+        self.modified_field = modified_field
+        self.indexes = indexes
+        self.limit = limit
+        self.status = status
+        self.codec: JsonCodec = client.ApiClient.codec
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {STATE_TABLE} ("
+            "collection TEXT PRIMARY KEY, primary_key TEXT, columns TEXT, "
+            "high_water TEXT, synced_at REAL)"
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteMirror":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    """
+
+    Synchronization
+
+    """
+
+    def sync(self, collection: str, full: bool = False) -> SyncResult:
+        """
+        Bring the mirror of a collection up to date, loading it entirely on the
+        first sync or if `full`
+
+        Returns
+        -------
+            SyncResult
+        """
+        start = perf_counter()
+        state = self._state(collection)
+
+        if state is None or full or state[2] is None:
+            result = self._full_sync(collection)
+        else:
+            result = self._incremental_sync(collection, *state)
+
+        result.seconds = perf_counter() - start
+
+        return result
+
+    def sync_all(self, collections: List[str]) -> List[SyncResult]:
+        return [self.sync(collection) for collection in collections]
+
+    def _full_sync(self, collection: str) -> SyncResult:
+        primary_key, columns = self._schema(collection)
+        result = SyncResult(collection=collection, full=True)
+        high_water = None
+        remote_keys: Set[Hashable] = set()
+
+        with self._lock, self._connection:
+            self._create_table(collection, primary_key, columns)
+
+        # The rows are replaced page by page rather than dropped first, so that the
+        # table stays complete for the local reads during the sync
+        for page in self._pages(collection, sort=[primary_key]):
+            with self._lock, self._connection:
+                result.upserted += self._upsert(collection, columns, page)
+            high_water = self._high_water(page, high_water)
+            remote_keys.update(item[primary_key] for item in page)
+
+        with self._lock, self._connection:
+            result.deleted = self._delete_missing(collection, primary_key, remote_keys)
+            self._save_state(collection, primary_key, columns, high_water)
+
+        return result
+
+    def _incremental_sync(
+        self,
+        collection: str,
+        primary_key: str,
+        columns: Dict[str, str],
+        high_water: str,
+    ) -> SyncResult:
+        result = SyncResult(collection=collection, full=False)
+
+        # Items modified in the same second as the high-water mark may have been
+        # missed by the previous sync, they are fetched again (upserts are idempotent)
+        changes = self._pages(
+            collection,
+            sort=[self.modified_field, primary_key],
+            filter={self.modified_field: {"gte": high_water}},
+        )
+
+        latest: Optional[str] = high_water
+        for page in changes:
+            with self._lock, self._connection:
+                result.upserted += self._upsert(collection, columns, page)
+            latest = self._high_water(page, latest)
+
+        # Deletions leave no modified item behind, they are found by listing the
+        # primary keys only, after the changes so that no new item is missed
+        remote_keys: Set[Hashable] = set()
+        for page in self._pages(collection, sort=[primary_key], fields=[primary_key]):
+            remote_keys.update(item[primary_key] for item in page)
+
+        with self._lock, self._connection:
+            result.deleted = self._delete_missing(collection, primary_key, remote_keys)
+            self._save_state(collection, primary_key, columns, latest)
+
+        return result
+
+    def _delete_missing(
+        self, collection: str, primary_key: str, remote_keys: Set[Hashable]
+    ) -> int:
+        """
+        Delete the rows whose primary key the server no longer lists
+
+        Returns
+        -------
+            int (the number of deleted rows)
+        """
+        local_keys = [
+            key
+            for key, in self._connection.execute(
+                f"SELECT {quote(primary_key)} FROM {quote(collection)}"
+            )
+        ]
+        deleted = [(key,) for key in local_keys if key not in remote_keys]
+        self._connection.executemany(
+            f"DELETE FROM {quote(collection)} WHERE {quote(primary_key)} = ?",
+            deleted,
+        )
+
+        return len(deleted)
+
+    def _schema(self, collection: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Returns
+        -------
+            (primary key, dict of column name: Directus field type)
+        """
+        info, _ = self.client.get_collection(collection=collection)
+        fields = info.get("fields") or {}
+        if isinstance(fields, list):
+            fields = {field["field"]: field for field in fields}
+
+        primary_key = next(
+            (name for name, field in fields.items() if field.get("primary_key")), "id"
+        )
+        columns = schema_columns(fields)
+        if primary_key not in columns:
+            raise DirectusException(
+                f"The primary key {primary_key} of {collection} is not readable"
+            )
+
+        return primary_key, columns
+
+    def _pages(self, collection: str, **kwargs):
+        return self.client.iter_items(
+            collection=collection,
+            status=self.status,
+            limit=self.limit,
+            pages=True,
+            keyset=True,
+            **kwargs,
+        )
+
+    def _create_table(
+        self, collection: str, primary_key: str, columns: Dict[str, str]
+    ) -> None:
+        table = quote(collection)
+        definitions = ", ".join(
+            f"{quote(name)} {SQLITE_TYPES.get(type, 'TEXT')}"
+            + (" PRIMARY KEY" if name == primary_key else "")
+            for name, type in columns.items()
+        )
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definitions})")
+
+        # Fields added to the collection since the table was created
+        existing = {
+            row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")
+        }
+        for name, type in columns.items():
+            if name not in existing:
+                self._connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {quote(name)} "
+                    f"{SQLITE_TYPES.get(type, 'TEXT')}"
+                )
+
+        for column in self.indexes.get(collection, []):
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {quote(f'{collection}_{column}')} "
+                f"ON {table} ({quote(column)})"
+            )
+
+    def _upsert(
+        self, collection: str, columns: Dict[str, str], items: List[Item]
+    ) -> int:
+        names = list(columns)
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {quote(collection)} "
+            f"({', '.join(map(quote, names))}) VALUES ({', '.join('?' * len(names))})",
+            [
+                [self._to_sqlite(item.get(name), columns[name]) for name in names]
+                for item in items
+            ],
+        )
+
+        return len(items)
+
+    def _high_water(
+        self, items: List[Item], high_water: Optional[str]
+    ) -> Optional[str]:
+        values = [
+            item[self.modified_field]
+            for item in items
+            if item.get(self.modified_field) is not None
+        ]
+        if high_water is not None:
+            values.append(high_water)
+
+        return max(values) if values else None
+
+    def _state(self, collection: str) -> Optional[Tuple[str, Dict[str, str], Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT primary_key, columns, high_water FROM {STATE_TABLE} "
+                "WHERE collection = ?",
+                (collection,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        primary_key, columns, high_water = row
+
+        return primary_key, self.codec.loads(columns), high_water
+
+    def _save_state(
+        self,
+        collection: str,
+        primary_key: str,
+        columns: Dict[str, str],
+        high_water: Optional[str],
+    ) -> None:
+        self._connection.execute(
+            f"INSERT OR REPLACE INTO {STATE_TABLE} VALUES (?, ?, ?, ?, ?)",
+            (
+                collection,
+                primary_key,
+                self.codec.dumps(columns).decode("utf-8"),
+                high_water,
+                time(),
+            ),
+        )
+
+    def _synced_state(self, collection: str) -> Tuple[str, Dict[str, str], Any]:
+        state = self._state(collection)
+        if state is None:
+            raise DirectusException(f"The collection {collection} was never synced")
+
+        return state
+
+    def _to_sqlite(self, value: Any, type: str) -> Any:
+        if value is None:
+            return None
+        if type in JSON_TYPES or isinstance(value, (dict, list)):
+            return self.codec.dumps(value).decode("utf-8")
+        if isinstance(value, bool):
+            return int(value)
+
+        return value
+
+    def _from_sqlite(self, value: Any, type: str) -> Any:
+        if value is None:
+            return None
+        if type in JSON_TYPES:
+            return self.codec.loads(value)
+        if type == "boolean":
+            return bool(value)
+
+        return value
+
+    """
+
+    Local reads
+
+    """
+
+    def get_item(self, collection: str, id: Any) -> Optional[Item]:
+        """
+        Returns
+        -------
+            Item, or None if it is not in the mirror
+        """
+        primary_key, _, _ = self._synced_state(collection)
+        items = self.get_items_list(collection, filter={primary_key: id}, limit=1)
+
+        return items[0] if items else None
+
+    def get_items_list(
+        self,
+        collection: str,
+        filter: Dict[str, Any] = {},
+        sort: List[str] = [],
+        limit: Optional[int] = None,
+    ) -> List[Item]:
+        """
+        Read items from the mirror, `filter` being a dict of field: value equalities
+        and sort a list of fields (prefixed with "-" for a descending order)
+
+        Returns
+        -------
+            List of Item
+        """
+        _, columns, _ = self._synced_state(collection)
+        conditions = dict(filter)
+
+        query = f"SELECT {', '.join(map(quote, columns))} FROM {quote(collection)}"
+        if conditions:
+            query += " WHERE " + " AND ".join(
+                f"{quote(field)} = ?" for field in conditions
+            )
+        if sort:
+            query += " ORDER BY " + ", ".join(
+                f"{quote(field[1:])} DESC" if field.startswith("-") else quote(field)
+                for field in sort
+            )
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        with self._lock:
+            rows = self._connection.execute(
+                query,
+                [
+                    self._to_sqlite(value, columns.get(field, "string"))
+                    for field, value in conditions.items()
+                ],
+            ).fetchall()
+
+        return [
+            {
+                name: self._from_sqlite(value, type)
+                for (name, type), value in zip(columns.items(), row)
+            }
+            for row in rows
+        ]
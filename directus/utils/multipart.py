@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import get_running_loop
+from io import SEEK_END
+from mimetypes import guess_type
+from os import PathLike, fspath
+from os.path import basename, getsize
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    cast,
+)
+from uuid import uuid4
+
+FileSource = Union[str, PathLike, BinaryIO, Iterable[bytes]]
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartBody(object):
+    """
+    A multipart/form-data body streamed chunk by chunk, so that uploading a file
+    never holds more than `chunk_size` bytes of it in memory
+
+    Attributes
+    ----------
+    fields: dict
+        The form fields sent before the file
+
+    file: str, path, binary file object or iterable of bytes
+        The file content. A path is opened when the body is sent, a file object is
+        read from its current position and an iterable is sent as it is produced.
+
+    filename: str
+        The name of the uploaded file, guessed from the path or file object if not
+        provided
+
+    content_type: str
+        The content type of the file, guessed from its name if not provided
+
+    field_name: str
+        The name of the form field holding the file
+
+    chunk_size: int
+        The number of bytes read from the file at a time
+
+    progress: callable
+        Called with (bytes sent, total bytes or None) after each chunk of the file
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file: FileSource,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        field_name: str = "data",
+        chunk_size: int = CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        self.file = file
+        self.filename = filename or self._guess_filename(file)
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        file_type = content_type or guess_type(self.filename)[0]
+        self._head = b"".join(
+            self._part_header(name, None) + str(value).encode() + b"\r\n"
+            for name, value in fields.items()
+        ) + self._part_header(
+            field_name, self.filename, file_type or "application/octet-stream"
+        )
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+        self.file_size = self._size_of(file)
+        # `len` is read by requests to send a Content-Length instead of a chunked body
+        self.len = (
+            len(self._head) + self.file_size + len(self._tail)
+            if self.file_size is not None
+            else None
+        )
+
+    def _part_header(
+        self,
+        name: str,
+        filename: Optional[str],
+        content_type: Optional[str] = None,
+    ) -> bytes:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type is not None:
+            header += f"Content-Type: {content_type}\r\n"
+
+        return (header + "\r\n").encode()
+
+    @staticmethod
+    def _guess_filename(file: FileSource) -> str:
+        if isinstance(file, (str, PathLike)):
+            return basename(fspath(file))
+
+        name = getattr(file, "name", None)
+
+        return basename(name) if isinstance(name, str) else "file"
+
+    @staticmethod
+    def _size_of(file: FileSource) -> Optional[int]:
+        if isinstance(file, (str, PathLike)):
+            return getsize(file)
+
+        if hasattr(file, "seekable") and cast(BinaryIO, file).seekable():
+            stream = cast(BinaryIO, file)
+            position = stream.tell()
+            size = stream.seek(0, SEEK_END) - position
+            stream.seek(position)
+            return size
+
+        return None
+
+    def _file_chunks(self) -> Iterator[bytes]:
+        if isinstance(self.file, (str, PathLike)):
+            with open(self.file, "rb") as file:
+                yield from iter(lambda: file.read(self.chunk_size), b"")
+        elif hasattr(self.file, "read"):
+            stream = cast(BinaryIO, self.file)
+            yield from iter(lambda: stream.read(self.chunk_size), b"")
+        else:
+            yield from cast(Iterable[bytes], self.file)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+
+        sent = 0
+        for chunk in self._file_chunks():
+            if not chunk:
+                continue
+            yield chunk
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self.file_size)
+
+        yield self._tail
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        loop = get_running_loop()
+        yield self._head
+
+        sent = 0
+        chunks = self._file_chunks()
+        while True:
+            # The file is read in a worker thread, not to block the event loop
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                break
+            if not chunk:
+                continue
+            yield chunk
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self.file_size)
+
+        yield self._tail
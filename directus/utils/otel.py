@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, Optional
+
+try:
+    from opentelemetry import metrics, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+from ..exceptions import DirectusException
+from .hooks import RequestEvent, TokenRefreshEvent
+
+
+class OpenTelemetryAdapter(object):
+    """
+    Report the client requests to OpenTelemetry, as a hooks listener: a client span
+    per attempt and request duration, bytes and token refresh metrics. Requires
+    the optional `opentelemetry-api` dependency (`pip install directus[otel]`).
+
+        hooks = Hooks()
+        hooks.add_listener(OpenTelemetryAdapter())
+
+    Attributes
+    ----------
+    tracer_provider: TracerProvider
+        The provider of the tracer (the global one by default)
+
+    meter_provider: MeterProvider
+        The provider of the meter (the global one by default)
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        if trace is None:
+            raise DirectusException(
+                "The OpenTelemetry adapter requires opentelemetry-api, install it "
+                "with `pip install opentelemetry-api`"
+            )
+
+        self.tracer = trace.get_tracer("directus", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("directus", meter_provider=meter_provider)
+        self.duration = meter.create_histogram(
+            "http.client.request.duration",
+            unit="s",
+            description="Duration of the Directus API requests",
+        )
+        self.bytes_sent = meter.create_counter(
+            "directus.client.bytes_sent", unit="By", description="Request body sizes"
+        )
+        self.bytes_received = meter.create_counter(
+            "directus.client.bytes_received",
+            unit="By",
+            description="Response body sizes",
+        )
+        self.token_refreshes = meter.create_counter(
+            "directus.client.token_refreshes", description="Access token refreshes"
+        )
+
+    @staticmethod
+    def _attributes(event: RequestEvent) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.template": event.path,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+
+        return attributes
+
+    def before_request(self, event: RequestEvent) -> None:
+        event.context["span"] = self.tracer.start_span(
+            f"{event.method} {event.path}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                **self._attributes(event),
+                "url.full": event.url,
+                "http.request.resend_count": event.attempt - 1,
+            },
+        )
+
+    def _end(self, event: RequestEvent, error: Optional[BaseException]) -> None:
+        span = event.context.pop("span", None)
+        if span is None:
+            # The span of a request failing with an API error ended on its response
+            return
+
+        attributes = self._attributes(event)
+        span.set_attributes(attributes)
+        for phase, seconds in event.timings.items():
+            span.set_attribute(f"directus.timing.{phase}", seconds)
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+        elif event.status is not None and event.status >= 400:
+            span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+        self.duration.record(event.duration, attributes)
+        if event.bytes_sent:
+            self.bytes_sent.add(event.bytes_sent, attributes)
+        if event.bytes_received:
+            self.bytes_received.add(event.bytes_received, attributes)
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._end(event, None)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._end(event, event.error)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self._end(event, event.error)
+
+    def on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        self.token_refreshes.add(1)
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import FIRST_COMPLETED as ASYNC_FIRST_COMPLETED
+from asyncio import Future as AsyncFuture
+from asyncio import ensure_future
+from asyncio import wait as async_wait
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..exceptions import DirectusException
+from ..typing import Item, RequestParams, ResponseMeta
+
+Page = Tuple[List[Any], ResponseMeta]
+
+
+def next_page(
+    page: int, data: List[Any], meta: ResponseMeta, limit: int
+) -> Optional[int]:
+    """
+    The number of the page following `page`, or None if `page` was the last one.
+    Relies on the `page_count` metadata when available, else on a short page.
+    """
+    if meta.get("page_count") is not None:
+        return page + 1 if page < int(meta["page_count"]) else None
+
+    return page + 1 if len(data) >= limit else None
+
+
+def keyset_filters(sort: List[str], after: Item) -> List[dict]:
+    """
+    Express "every row after `after` in `sort` order" as a list of filters that only
+    AND comparisons together, ordered so that their rows follow each other.
+    For instance, with sort ["a", "-b"], after {"a": 1, "b": 2} gives
+    [{"a": {"eq": 1}, "b": {"lt": 2}}, {"a": {"gt": 1}}].
+
+    The sort fields must identify a row uniquely (e.g. end with the primary key).
+    """
+    keys = [
+        (field[1:], "lt") if field.startswith("-") else (field, "gt") for field in sort
+    ]
+
+    missing = [field for field, _ in keys if field not in after]
+    if missing:
+        raise DirectusException(
+            f"Keyset pagination requires the sort fields in the rows, missing: {', '.join(missing)}"
+        )
+
+    filters = []
+    for position in reversed(range(len(keys))):
+        keyset = {field: {"eq": after[field]} for field, _ in keys[:position]}
+        field, operator = keys[position]
+        keyset[field] = {operator: after[field]}
+        filters.append(keyset)
+
+    return filters
+
+
+def check_keyset_params(params: RequestParams) -> None:
+    """
+    Keyset filters are appended to the filter of the request, and the v8 query
+    grammar has no parentheses: after an or group, they would only apply to its
+    last branch, and the rows of the other branches would come back on every page
+    """
+    if any(key.endswith("[logical]") for key in params):
+        raise DirectusException(
+            "Keyset pagination does not support filters with an or group, use "
+            "offset pagination instead"
+        )
+
+
+def iter_keyset_pages(
+    fetch_after: Callable[[Optional[Item]], Page], limit: int = 100
+) -> Iterator[Page]:
+    """
+    Fetch pages one after the other, each one starting after the last row of the
+    previous one rather than at an offset
+    """
+    after = None
+    while True:
+        data, meta = fetch_after(after)
+        if data:
+            yield data, meta
+        if len(data) < limit:
+            return
+        after = data[-1]
+
+
+def iter_pages(
+    fetch: Callable[[int], Page],
+    page: int = 1,
+    limit: int = 100,
+    read_ahead: bool = True,
+) -> Iterator[Page]:
+    """
+    Fetch pages one after the other, starting from `page`.
+
+    With read_ahead, the next page is fetched in a background thread while the
+    current one is being consumed, so that at most two pages are held in memory.
+    """
+    if not read_ahead:
+        current: Optional[int] = page
+        while current is not None:
+            data, meta = fetch(current)
+            yield data, meta
+            current = next_page(current, data, meta, limit)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: Optional["Future[Page]"] = executor.submit(fetch, page)
+        try:
+            while pending is not None:
+                data, meta = pending.result()
+                following = next_page(page, data, meta, limit)
+                pending = None
+                if following is not None:
+                    page = following
+                    pending = executor.submit(fetch, page)
+                yield data, meta
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def iter_pages_parallel(
+    fetch: Callable[[int], Page],
+    page: int = 1,
+    limit: int = 100,
+    max_in_flight: int = 4,
+    ordered: bool = True,
+) -> Iterator[Page]:
+    """
+    Fetch the first page, then read `page_count` from its metadata and fetch the
+    remaining pages concurrently, with at most `max_in_flight` requests at a time.
+
+    If ordered, pages are yielded in page order, else as soon as they are received.
+    Items inserted while running through the pages are not taken into account.
+    """
+    data, meta = fetch(page)
+    yield data, meta
+
+    if next_page(page, data, meta, limit) is None:
+        return
+
+    if meta.get("page_count") is None:
+        # Without page count, there is no way to know what to fetch concurrently
+        yield from iter_pages(fetch, page=page + 1, limit=limit)
+        return
+
+    remaining = iter(range(page + 1, int(meta["page_count"]) + 1))
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        pending = deque(
+            executor.submit(fetch, number)
+            for number in islice(remaining, max_in_flight)
+        )
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in completed]
+                    for future in done:
+                        pending.remove(future)
+
+                for future in done:
+                    following = next(remaining, None)
+                    if following is not None:
+                        pending.append(executor.submit(fetch, following))
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def aiter_pages(
+    fetch: Callable[[int], Awaitable[Page]],
+    page: int = 1,
+    limit: int = 100,
+    read_ahead: bool = True,
+) -> AsyncIterator[Page]:
+    """
+    The asyncio counterpart of iter_pages, reading ahead with a concurrent task
+    """
+    if not read_ahead:
+        current: Optional[int] = page
+        while current is not None:
+            data, meta = await fetch(current)
+            yield data, meta
+            current = next_page(current, data, meta, limit)
+        return
+
+    pending: Optional["AsyncFuture[Page]"] = ensure_future(fetch(page))
+    try:
+        while pending is not None:
+            data, meta = await pending
+            following = next_page(page, data, meta, limit)
+            pending = None
+            if following is not None:
+                page = following
+                pending = ensure_future(fetch(page))
+            yield data, meta
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_pages_parallel(
+    fetch: Callable[[int], Awaitable[Page]],
+    page: int = 1,
+    limit: int = 100,
+    max_in_flight: int = 4,
+    ordered: bool = True,
+) -> AsyncIterator[Page]:
+    """
+    The asyncio counterpart of iter_pages_parallel
+    """
+    data, meta = await fetch(page)
+    yield data, meta
+
+    if next_page(page, data, meta, limit) is None:
+        return
+
+    if meta.get("page_count") is None:
+        # Without page count, there is no way to know what to fetch concurrently
+        async for following_page in aiter_pages(fetch, page=page + 1, limit=limit):
+            yield following_page
+        return
+
+    remaining = iter(range(page + 1, int(meta["page_count"]) + 1))
+    pending = deque(
+        ensure_future(fetch(number)) for number in islice(remaining, max_in_flight)
+    )
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                completed, _ = await async_wait(
+                    pending, return_when=ASYNC_FIRST_COMPLETED
+                )
+                done = [task for task in pending if task in completed]
+                for task in done:
+                    pending.remove(task)
+
+            for task in done:
+                following = next(remaining, None)
+                if following is not None:
+                    pending.append(ensure_future(fetch(following)))
+                yield await task
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aiter_keyset_pages(
+    fetch_after: Callable[[Optional[Item]], Awaitable[Page]], limit: int = 100
+) -> AsyncIterator[Page]:
+    """
+    The asyncio counterpart of iter_keyset_pages
+    """
+    after = None
+    while True:
+        data, meta = await fetch_after(after)
+        if data:
+            yield data, meta
+        if len(data) < limit:
+            return
+        after = data[-1]
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import asdict, is_dataclass
+from typing import Dict, List, Optional
+
+from ..typing import Collection, RequestData, RequestFields, RequestParams
+from .query import Query, branches, encode_filter
+
+
+def fields_params(fields: RequestFields) -> RequestParams:
+    return {"fields": ",".join(fields)}
+
+
+def filter_params(filter: dict) -> RequestParams:
+    """
+    Encode a filter to the `filter[field][operator]=value` query syntax, from
+    either `{field: value}` (equality) or `{field: {operator: value}}`, possibly
+    grouped in a top-level `{"or": [filter, ...]}` (see query.encode_filter).
+    List values (for in, nin, between...) are joined with commas.
+    """
+    return dict(encode_filter(branches(filter)))
+
+
+def list_params(
+    fields: RequestFields = ["*"],
+    limit: int = 100,
+    offset: int = 0,
+    page: Optional[int] = None,
+    sort: List[str] = ["id"],
+    single: bool = False,
+    filter: dict = {},
+    status: Optional[str] = None,
+    q: Optional[str] = None,
+    query: Optional[Query] = None,
+) -> RequestParams:
+    """
+    Query parameters of the list endpoints (items, revisions, files)
+
+    If page is set, offset is not taken into account
+
+    A compiled query replaces fields, sort, filter, status and q
+    """
+    if query is not None:
+        params = {
+            **query.params(),
+            "limit": limit,
+            "offset": offset,
+            "single": single,
+        }
+    else:
+        params = {
+            "fields": ",".join(fields),
+            "limit": limit,
+            "offset": offset,
+            "sort": ",".join(sort),
+            "single": single,
+            "status": status,
+            "q": q,
+            **filter_params(filter),
+        }
+
+    if page:
+        params["page"] = page
+        del params["offset"]
+
+    return params
+
+
+def collection_data(collection: Collection) -> RequestData:
+    return asdict(collection) if is_dataclass(collection) else dict(collection)
+
+
+def file_data(
+    data: Optional[str] = None,
+    filename_download: Optional[str] = None,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    tags: Optional[str] = None,
+    metadata: Optional[str] = None,
+) -> Dict[str, str]:
+    file = {"data": data} if data is not None else {}
+
+    if filename_download:
+        file["filename_download"] = filename_download
+    if title:
+        file["title"] = title
+    if description:
+        file["description"] = description
+    if location:
+        file["location"] = location
+    if tags:
+        file["tags"] = tags
+    if metadata:
+        file["metadata"] = metadata
+
+    return file
+
+
+def email_data(
+    send_to: List[str],
+    subject: str,
+    body: str,
+    type: Optional[str] = "txt",
+    data: Optional[dict] = {},
+) -> RequestData:
+    return {
+        "to": send_to,
+        "subject": subject,
+        "body": body,
+        "type": type,
+        "data": data,
+    }
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from ..exceptions import DirectusException
+from ..typing import RequestParams
+
+# Filter operators of the Directus v8 query grammar
+OPERATORS = frozenset(
+    [
+        "eq",
+        "neq",
+        "lt",
+        "lte",
+        "gt",
+        "gte",
+        "in",
+        "nin",
+        "null",
+        "nnull",
+        "contains",
+        "ncontains",
+        "like",
+        "nlike",
+        "rlike",
+        "nrlike",
+        "between",
+        "nbetween",
+        "empty",
+        "nempty",
+        "has",
+        "all",
+    ]
+)
+
+# (field, operator, encoded value)
+Condition = Tuple[str, str, Any]
+# Conditions joined by AND
+Branch = Tuple[Condition, ...]
+
+# Relation fields of Query.select: a field name, a list of names, or nested relations
+Relation = Union[str, List[Any], Mapping[str, Any]]
+
+
+def encode_value(value: Any) -> Any:
+    """
+    A filter value in the query grammar: lists joined with commas, booleans as
+    1 or 0 and dates in the `YYYY-MM-DD HH:MM:SS` format
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(str(encode_value(element)) for element in value)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+
+    return value
+
+
+def conditions(filter: Mapping[str, Any]) -> Branch:
+    """
+    The conditions of a filter, from either `{field: value}` (equality, or `null`
+    for None) or `{field: {operator: value}}`
+    """
+    compiled = []
+    for field, condition in filter.items():
+        if field in ("and", "or"):
+            raise DirectusException(
+                "Logical groups are only supported at the top level of a filter"
+            )
+
+        if not isinstance(condition, Mapping):
+            condition = {"null": ""} if condition is None else {"eq": condition}
+        for operator, value in condition.items():
+            if operator not in OPERATORS:
+                raise DirectusException(
+                    f"Unknown filter operator {operator} on field {field}"
+                )
+            compiled.append((field, operator, encode_value(value)))
+
+    return tuple(compiled)
+
+
+def branches(filter: Mapping[str, Any]) -> Tuple[Branch, ...]:
+    """
+    The branches joined by OR of a filter, which is either a plain filter (a
+    single branch) or `{"or": [filter, ...]}`
+    """
+    if "or" not in filter:
+        return (conditions(filter),) if filter else ()
+
+    if len(filter) > 1:
+        raise DirectusException(
+            "An or group cannot be combined with other conditions, as the v8 query "
+            "grammar has no parentheses: distribute them in each branch"
+        )
+
+    return tuple(conditions(branch) for branch in filter["or"] if branch)
+
+
+def encode_filter(filter_branches: Tuple[Branch, ...]) -> List[Tuple[str, Any]]:
+    """
+    Encode the branches of a filter to the `filter[field][operator]=value` syntax.
+    Conditions are sent in order and the v8 API applies them as a chain of AND,
+    switching to OR at each field carrying `[logical]=or`. As AND takes precedence,
+    the first field of each branch after the first one starts an OR branch.
+
+    A field can only appear in one branch, and the field starting a branch can
+    only carry one operator, since `logical` applies to all of its conditions.
+
+    Returns
+    -------
+        list of (query parameter, value)
+    """
+    params: List[Tuple[str, Any]] = []
+    owners: Dict[str, int] = {}
+    for index, branch in enumerate(filter_branches):
+        operators: Dict[str, List[str]] = {}
+        for field, operator, _ in branch:
+            if owners.setdefault(field, index) != index:
+                raise DirectusException(
+                    f"The field {field} appears in several or branches, use the in "
+                    "operator or a single branch instead"
+                )
+            operators.setdefault(field, []).append(operator)
+
+        if index > 0 and branch:
+            # Lead the branch with a field carrying a single condition
+            lead = next(
+                (field for field, names in operators.items() if len(names) == 1),
+                None,
+            )
+            if lead is None:
+                raise DirectusException(
+                    "Each or branch needs a field with a single condition"
+                )
+            branch = tuple(sorted(branch, key=lambda condition: condition[0] != lead))
+            params.append((f"filter[{lead}][logical]", "or"))
+
+        for field, operator, value in branch:
+            params.append((f"filter[{field}][{operator}]", value))
+
+    return params
+
+
+def relation_fields(name: str, relation: Relation) -> List[str]:
+    """
+    The dotted paths of the fields of a relation: `author=["name", "email"]` gives
+    `author.name,author.email`, and relations can be nested in a dict
+    """
+    if isinstance(relation, str):
+        return [f"{name}.{relation}"]
+    if isinstance(relation, Mapping):
+        return [
+            path
+            for field, nested in relation.items()
+            for path in relation_fields(f"{name}.{field}", nested)
+        ]
+
+    return [
+        path
+        for field in relation
+        for path in (
+            relation_fields(name, field)
+            if isinstance(field, Mapping)
+            else [f"{name}.{field}"]
+        )
+    ]
+
+
+@dataclass(frozen=True)
+class Query:
+    """
+    A list query (fields, filter, sort, status and search) compiled once to the
+    v8 query parameters, to be reused across pages and calls. Queries are
+    immutable, each method returning a new one:
+
+        query = (
+            Query()
+            .select("id", "title", author=["name", "email"])
+            .where(status="published", score={"gt": 3})
+            .or_where(featured=True)
+            .order_by("-published_on", "id")
+        )
+        client.iter_items(collection="articles", query=query)
+
+    where conditions are joined by AND, and or_where starts a new branch joined to
+    the previous ones by OR. The compiled parameters are cached per query.
+
+    Attributes
+    ----------
+    fields: tuple
+        The fields to retrieve, relation fields as dotted paths (`author.name`)
+
+    filter: tuple
+        The branches of the filter, joined by OR, each one a tuple of conditions
+        (field, operator, value) joined by AND
+
+    sort: tuple
+        The sort fields, prefixed with `-` for descending order
+
+    status: str
+        The statuses to retrieve, comma separated
+
+    q: str
+        A full-text search
+    """
+
+    fields: Tuple[str, ...] = ("*",)
+    filter: Tuple[Branch, ...] = ()
+    sort: Tuple[str, ...] = ("id",)
+    status: Optional[str] = None
+    q: Optional[str] = None
+
+    @classmethod
+    def from_filter(cls, filter: Mapping[str, Any]) -> "Query":
+        """
+        A query of a filter dict, plain or with a top-level `or` group
+        """
+        return cls(filter=branches(filter))
+
+    def select(self, *fields: str, **relations: Relation) -> "Query":
+        paths = list(fields)
+        for name, relation in relations.items():
+            paths += relation_fields(name, relation)
+
+        return replace(self, fields=tuple(paths))
+
+    def where(self, filter: Mapping[str, Any] = {}, **values: Any) -> "Query":
+        """
+        Add conditions, joined by AND to those of the last branch
+        """
+        added = conditions({**filter, **values})
+        if not self.filter:
+            return replace(self, filter=(added,))
+
+        return replace(self, filter=self.filter[:-1] + (self.filter[-1] + added,))
+
+    def or_where(self, filter: Mapping[str, Any] = {}, **values: Any) -> "Query":
+        """
+        Start a new branch of conditions, joined by OR to the previous ones
+        """
+        return replace(self, filter=self.filter + (conditions({**filter, **values}),))
+
+    def order_by(self, *sort: str) -> "Query":
+        return replace(self, sort=sort)
+
+    def with_status(self, *status: str) -> "Query":
+        return replace(self, status=",".join(status))
+
+    def search(self, q: str) -> "Query":
+        return replace(self, q=q)
+
+    def params(self) -> RequestParams:
+        """
+        Returns
+        -------
+            dict (query parameter: value)
+        """
+        return dict(compile_query(self))
+
+
+@lru_cache(maxsize=256)
+def compile_query(query: Query) -> Tuple[Tuple[str, Any], ...]:
+    params: List[Tuple[str, Any]] = [
+        ("fields", ",".join(query.fields)),
+        ("sort", ",".join(query.sort)),
+    ]
+    if query.status is not None:
+        params.append(("status", query.status))
+    if query.q is not None:
+        params.append(("q", query.q))
+
+    return tuple(params + encode_filter(query.filter))
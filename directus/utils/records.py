@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Mapping
+from keyword import iskeyword
+from re import split
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+# Record classes generated in this process, by (collection, fields)
+_classes: Dict[Tuple[str, Tuple[str, ...]], Type["Record"]] = {}
+_classes_lock = Lock()
+
+
+class Record(Mapping):
+    """
+    A compact item, holding its values in the slots of a class generated per
+    collection (see record_class) instead of a dict, which saves several hundred
+    bytes per item. Fields are readable both as attributes and as mapping keys:
+
+        record.name == record["name"]
+
+    Fields whose name is not a valid attribute name or clashes with a method of
+    the mapping (`items`, `keys`...) are only readable as mapping keys. Fields
+    missing from the schema of the collection are kept in a dict of extra fields.
+    A record compares equal to a dict of the same fields.
+    """
+
+    __slots__ = ("_extra",)
+
+    # The fields of the collection, and the slot holding each one of them
+    _collection = ""
+    _fields: Tuple[str, ...] = ()
+    _slots: Dict[str, str] = {}
+
+    def __init__(self, values: Mapping = {}):
+        self._extra: Optional[Dict[str, Any]] = None
+        slots = self._slots
+        for field, value in values.items():
+            slot = slots.get(field)
+            if slot is not None:
+                setattr(self, slot, value)
+            else:
+                self[field] = value
+
+    def __getitem__(self, field: str) -> Any:
+        slot = self._slots.get(field)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(field) from None
+
+        if self._extra is not None and field in self._extra:
+            return self._extra[field]
+
+        raise KeyError(field)
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        slot = self._slots.get(field)
+        if slot is not None:
+            setattr(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[field] = value
+
+    def __iter__(self) -> Iterator[str]:
+        for field, slot in self._slots.items():
+            if hasattr(self, slot):
+                yield field
+
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self) -> tuple:
+        # Generated classes cannot be imported, rebuild them when unpickling
+        return _unpickle, (self._collection, self._fields, dict(self))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+def _unpickle(collection: str, fields: Tuple[str, ...], values: dict) -> Record:
+    return record_class(collection, fields)(values)
+
+
+def _class_name(collection: str) -> str:
+    name = "".join(part.capitalize() for part in split(r"[^0-9a-zA-Z]+", collection))
+
+    return f"{name}Record" if name.isidentifier() else "Record"
+
+
+def _slot_name(field: str, index: int) -> str:
+    """
+    The field name itself when it can be an attribute, else a private slot name
+    """
+    if (
+        field.isidentifier()
+        and not iskeyword(field)
+        and not field.startswith("_")
+        and not hasattr(Record, field)
+    ):
+        return field
+
+    return f"_field_{index}"
+
+
+def record_class(collection: str, fields: Iterable[str]) -> Type[Record]:
+    """
+    The Record class of the items of a collection with the given fields, generated
+    once per process
+
+    Returns
+    -------
+        Record subclass
+    """
+    fields = tuple(fields)
+    key = (collection, fields)
+    with _classes_lock:
+        if key not in _classes:
+            slots = {
+                field: _slot_name(field, index) for index, field in enumerate(fields)
+            }
+            _classes[key] = type(
+                _class_name(collection),
+                (Record,),
+                {
+                    "__slots__": tuple(slots.values()),
+                    "__module__": __name__,
+                    "_collection": collection,
+                    "_fields": fields,
+                    "_slots": slots,
+                },
+            )
+
+        return _classes[key]
+
+
+def schema_fields(schema: Union[Dict[str, dict], List[dict]]) -> List[str]:
+    """
+    The field names of a collection, from its `fields` (as returned by
+    get_collection)
+    """
+    if isinstance(schema, list):
+        return [field["field"] for field in schema]
+
+    return list(schema)
+
+
+def to_records(record_type: Type[Record], items: Iterable[Mapping]) -> List[Record]:
+    return [record_type(item) for item in items]
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from time import monotonic, time
+from typing import Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+from ..exceptions import DirectusException
+
+# Methods whose repetition has the same effect as a single request
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# Statuses of a server that is overloaded or temporarily unreachable
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpen(DirectusException):
+    """
+    The request was not sent because the circuit of its host is open
+    """
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Which failed requests are sent again, and how long to wait before each attempt
+
+    Attributes
+    ----------
+    max_attempts: int
+        The maximum number of times a request is sent, the first one included
+
+    methods: frozenset
+        The methods retried by default. Other requests (e.g. POST) are only retried
+        when the caller marks them as idempotent.
+
+    statuses: frozenset
+        The response statuses retried, on top of connection errors and timeouts
+
+    backoff: float
+        The delay before the first retry, doubled on each following one
+
+    max_backoff: float
+        The maximum delay between two attempts
+
+    jitter: bool
+        If True, each delay is drawn uniformly between 0 and the backoff ("full
+        jitter"), so that clients failing together do not retry together
+
+    respect_retry_after: bool
+        If True, the `Retry-After` header of the response takes precedence over the
+        backoff, up to `max_retry_after` seconds
+    """
+
+    max_attempts: int = 3
+    methods: FrozenSet[str] = field(default=IDEMPOTENT_METHODS)
+    statuses: FrozenSet[int] = field(default=RETRY_STATUSES)
+    backoff: float = 0.1
+    max_backoff: float = 10.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def allows(self, method: str, attempt: int, idempotent: Optional[bool]) -> bool:
+        """
+        Whether a request that failed on its `attempt`-th sending (starting at 1)
+        may be sent again. `idempotent` overrides the method based default.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if idempotent is not None:
+            return idempotent
+
+        return method.upper() in self.methods
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns
+        -------
+            float (the number of seconds to wait before the next attempt)
+        """
+        if self.respect_retry_after and retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_retry_after)
+
+        backoff = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+
+        return uniform(0, backoff) if self.jitter else backoff
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Returns
+    -------
+        float (seconds to wait, from a number of seconds or an HTTP date), or None
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _Circuit:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+
+
+class CircuitBreaker(object):
+    """
+    A per-host circuit breaker. After `failure_threshold` consecutive failures
+    (connection errors and 5xx responses) the circuit of the host opens and requests
+    fail fast with CircuitOpen. After `recovery_time` seconds, a single probe request
+    is let through: the circuit closes if it succeeds and opens again otherwise.
+
+    It is thread-safe and can be shared by several clients, to track the health of
+    a server across all of them.
+
+    Attributes
+    ----------
+    failure_threshold: int
+        The number of consecutive failures opening the circuit
+
+    recovery_time: float
+        Number of seconds the circuit stays open before a probe is sent
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlsplit(url).netloc
+
+    def state(self, url: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(self.host(url))
+
+            return circuit.state if circuit is not None else CLOSED
+
+    def before_request(self, url: str) -> None:
+        """
+        Raise CircuitOpen if the request must not be sent
+        """
+        with self._lock:
+            circuit = self._circuits.get(self.host(url))
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            # This request is the probe, the others keep failing fast. A probe
+            # that never reported back is replaced after another recovery time.
+            if monotonic() - circuit.opened_at >= self.recovery_time:
+                circuit.state = HALF_OPEN
+                circuit.opened_at = monotonic()
+                return
+
+        raise CircuitOpen(f"The circuit of {self.host(url)} is open")
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            self._circuits.pop(self.host(url), None)
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(self.host(url), _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = monotonic()
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import AbstractEventLoop, Future, get_running_loop
+from asyncio import sleep as async_sleep
+from threading import Condition, Lock
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple
+
+from ..exceptions import DirectusException
+
+# Statuses of a server asking its clients to slow down
+OVERLOAD_STATUSES = frozenset([429, 503])
+
+
+class TokenBucket(object):
+    """
+    A token bucket rate limiter: requests take a token each, tokens are added at
+    `rate` per second and up to `burst` of them can be saved for bursts.
+
+    A request that finds the bucket empty reserves the next token and waits for it,
+    so that waiting threads and tasks are served in arrival order.
+
+    Attributes
+    ----------
+    rate: float
+        The number of requests per second
+
+    burst: float
+        The maximum number of requests sent at once after an idle period (`rate` by
+        default, and at least 1)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise DirectusException("The rate must be a positive number")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token
+
+        Returns
+        -------
+            float (the number of seconds to wait before it is available)
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await async_sleep(delay)
+
+
+def _wake(future: Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyGovernor(object):
+    """
+    Limit the number of requests in flight, for threads and asyncio tasks alike.
+
+    With `adaptive`, the limit follows the health of the server (AIMD): it shrinks
+    by `decrease_ratio` when a request is answered with 429 or 503, fails with a
+    connection error or takes longer than `latency_target`, and grows by one after
+    a round of `limit` healthy requests, up to `max_in_flight`. The limit shrinks
+    on the first overloaded response of a round and at most once per round, so that
+    a burst of errors from the requests already in flight shrinks it once, and a
+    round with any overloaded response does not grow it.
+
+    Attributes
+    ----------
+    max_in_flight: int
+        The maximum number of concurrent requests
+
+    min_in_flight: int
+        The lowest limit the adaptive mode can shrink to
+
+    adaptive: bool
+        If True, adapt the limit to the latency and error rate of the server
+
+    latency_target: float
+        Number of seconds above which a response is considered slow (only the
+        error rate is taken into account if None)
+
+    decrease_ratio: float
+        The factor applied to the limit when the server is overloaded
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        min_in_flight: int = 1,
+        adaptive: bool = False,
+        latency_target: Optional[float] = None,
+        decrease_ratio: float = 0.5,
+    ):
+        if max_in_flight < 1 or not 1 <= min_in_flight <= max_in_flight:
+            raise DirectusException(
+                "max_in_flight and min_in_flight must be positive, with "
+                "min_in_flight <= max_in_flight"
+            )
+
+        self.max_in_flight = max_in_flight
+        self.min_in_flight = min_in_flight
+        self.adaptive = adaptive
+        self.latency_target = latency_target
+        self.decrease_ratio = decrease_ratio
+        self.limit = max_in_flight
+        self.in_flight = 0
+        # The requests completed in the current round, and how the round went
+        self._completed = 0
+        self._overloaded = False
+        self._shrunk = False
+        self._condition = Condition()
+        self._waiters: List[Tuple[AbstractEventLoop, Future]] = []
+
+    def _try_acquire(self) -> bool:
+        if self.in_flight < self.limit:
+            self.in_flight += 1
+            return True
+
+        return False
+
+    def acquire(self) -> None:
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def acquire_async(self) -> None:
+        while True:
+            with self._condition:
+                if self._try_acquire():
+                    return
+
+                loop = get_running_loop()
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+
+            await future
+
+    def release(
+        self, latency: Optional[float] = None, status: Optional[int] = None
+    ) -> None:
+        """
+        Free the slot of a completed request. `status` is None when the request
+        failed without a response.
+        """
+        self._free(latency, status, adapt=self.adaptive)
+
+    def cancel(self) -> None:
+        """
+        Free the slot of a request that was not sent
+        """
+        self._free(adapt=False)
+
+    def _free(
+        self,
+        latency: Optional[float] = None,
+        status: Optional[int] = None,
+        adapt: bool = False,
+    ) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if adapt:
+                self._adapt(latency, status)
+
+            self._condition.notify_all()
+            waiters, self._waiters = self._waiters, []
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def _adapt(self, latency: Optional[float], status: Optional[int]) -> None:
+        overloaded = status is None or status in OVERLOAD_STATUSES
+        slow = (
+            self.latency_target is not None
+            and latency is not None
+            and latency > self.latency_target
+        )
+
+        self._completed += 1
+        if overloaded or slow:
+            self._overloaded = True
+            if not self._shrunk:
+                self.limit = max(
+                    self.min_in_flight, int(self.limit * self.decrease_ratio)
+                )
+                self._shrunk = True
+
+        if self._completed < self.limit:
+            return
+
+        if not self._overloaded and self.limit < self.max_in_flight:
+            self.limit += 1
+        self._completed = 0
+        self._overloaded = False
+        self._shrunk = False
+
+
+class Throttle(object):
+    """
+    The rate and concurrency limits of the requests of a client, with optional
+    limits per endpoint group. The group of a request is the first segment of its
+    path in the project (`items`, `files`, `auth`, `mail`...). A request takes a
+    slot and a token from both its group limits and the client-wide ones.
+
+    It is safe for threads and asyncio, and can be shared by several clients to
+    limit their combined traffic to a server.
+
+    Attributes
+    ----------
+    rate: float
+        The maximum number of requests per second (no limit if None)
+
+    burst: float
+        The number of requests that can be sent at once after an idle period
+
+    max_in_flight: int
+        The maximum number of concurrent requests (no limit if None)
+
+    adaptive: bool
+        If True, the concurrency limit adapts to the latency and error rate of the
+        server (see ConcurrencyGovernor)
+
+    groups: dict
+        The Throttle of each endpoint group
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        adaptive: bool = False,
+        min_in_flight: int = 1,
+        latency_target: Optional[float] = None,
+        groups: Dict[str, "Throttle"] = {},
+    ):
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.governor = (
+            ConcurrencyGovernor(
+                max_in_flight,
+                min_in_flight=min_in_flight,
+                adaptive=adaptive,
+                latency_target=latency_target,
+            )
+            if max_in_flight is not None
+            else None
+        )
+        self.groups = groups
+
+    def _throttles(self, group: Optional[str]) -> List["Throttle"]:
+        """
+        The group limits come first, so that all requests take their slots in the
+        same order
+        """
+        if group in self.groups:
+            return [self.groups[group], self]
+
+        return [self]
+
+    def acquire(self, group: Optional[str] = None) -> None:
+        throttles = self._throttles(group)
+        for throttle in throttles:
+            if throttle.governor is not None:
+                throttle.governor.acquire()
+        for throttle in throttles:
+            if throttle.bucket is not None:
+                throttle.bucket.acquire()
+
+    async def acquire_async(self, group: Optional[str] = None) -> None:
+        throttles = self._throttles(group)
+        acquired: List[ConcurrencyGovernor] = []
+        try:
+            for throttle in throttles:
+                if throttle.governor is not None:
+                    await throttle.governor.acquire_async()
+                    acquired.append(throttle.governor)
+            for throttle in throttles:
+                if throttle.bucket is not None:
+                    await throttle.bucket.acquire_async()
+        except BaseException:
+            # The task was cancelled while waiting, its slots go to the others
+            for governor in acquired:
+                governor.cancel()
+            raise
+
+    def release(
+        self,
+        group: Optional[str] = None,
+        latency: Optional[float] = None,
+        status: Optional[int] = None,
+    ) -> None:
+        for throttle in self._throttles(group):
+            if throttle.governor is not None:
+                throttle.governor.release(latency, status)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+from time import monotonic
+from typing import Iterable, Optional, Union, cast
+
+from requests import Response, Session, exceptions
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+from ..exceptions import DirectusException
+from ..typing import RequestContent, RequestHeaders, RequestParams, Timeout
+
+# The errors of a request that may succeed if sent again: connection failures,
+# resets and timeouts
+TRANSPORT_ERRORS = (
+    exceptions.ConnectionError,
+    exceptions.Timeout,
+    exceptions.ChunkedEncodingError,
+)
+ASYNC_TRANSPORT_ERRORS = (httpx.TransportError,) if httpx is not None else ()
+
+
+class Transport(object):
+    """
+    Transport owns a pooled, keep-alive HTTP session used by the ApiClient to talk
+    to a Directus server. A single Transport can be shared by several clients
+    pointing at the same server so that they reuse the same connections.
+
+    Attributes
+    ----------
+    pool_connections: int
+        The number of per-host connection pools to keep
+
+    pool_maxsize: int
+        The maximum number of connections kept alive per host
+
+    pool_block: bool
+        If True, wait for a free connection instead of opening a new one when the
+        pool is exhausted
+
+    keepalive_timeout: float
+        Number of seconds an idle pool is kept before its connections are dropped
+        (None keeps them until the transport is closed)
+
+    timeout: float or (float, float)
+        Default (connect, read) timeout applied to each call, can be overridden per call
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        timeout: Optional[Timeout] = None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.closed = False
+        self._lock = Lock()
+        self._last_used = monotonic()
+        self.session = self._new_session()
+
+    def _new_session(self) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: RequestHeaders = {},
+        params: RequestParams = {},
+        data: Optional[RequestContent] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+    ) -> Response:
+        """
+        With `stream`, the body is not read, it must be consumed (e.g. with
+        `iter_content`) or the response closed to release the connection
+        """
+        if self.closed:
+            raise DirectusException("Cannot send a request through a closed transport")
+
+        self._drop_idle_connections()
+
+        return self.session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            # An async iterable body is only sent through AsyncTransport
+            data=cast(Optional[Union[bytes, Iterable[bytes]]], data),
+            timeout=timeout if timeout is not None else self.timeout,
+            stream=stream,
+        )
+
+    def _drop_idle_connections(self) -> None:
+        with self._lock:
+            now = monotonic()
+            if (
+                self.keepalive_timeout is not None
+                and now - self._last_used > self.keepalive_timeout
+            ):
+                for adapter in self.session.adapters.values():
+                    if isinstance(adapter, HTTPAdapter):
+                        adapter.poolmanager.clear()
+            self._last_used = now
+
+    def close(self) -> None:
+        if not self.closed:
+            self.session.close()
+            self.closed = True
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class AsyncTransport(object):
+    """
+    AsyncTransport is the asyncio counterpart of Transport, backed by a pooled
+    `httpx.AsyncClient`. It requires the optional `httpx` dependency
+    (`pip install directus[async]`).
+
+    Attributes
+    ----------
+    max_connections: int
+        The maximum number of concurrent connections
+
+    max_keepalive_connections: int
+        The maximum number of idle connections kept alive
+
+    keepalive_timeout: float
+        Number of seconds an idle connection is kept alive
+
+    timeout: float or (float, float)
+        Default (connect, read) timeout applied to each call, can be overridden per call
+
+    client: httpx.AsyncClient
+        An already configured client to send the requests with, the pool settings
+        are ignored when provided
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_timeout: Optional[float] = 5.0,
+        timeout: Optional[Timeout] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+    ):
+        if httpx is None:
+            raise DirectusException(
+                "The async client requires httpx, install it with `pip install httpx`"
+            )
+
+        self.timeout = timeout
+        self.closed = False
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_timeout,
+            ),
+            timeout=self._httpx_timeout(timeout),
+        )
+
+    @staticmethod
+    def _httpx_timeout(timeout: Optional[Timeout]) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+
+        return httpx.Timeout(timeout)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: RequestHeaders = {},
+        params: RequestParams = {},
+        data: Optional[RequestContent] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> "httpx.Response":
+        if self.closed:
+            raise DirectusException("Cannot send a request through a closed transport")
+
+        if timeout is None:
+            return await self.client.request(
+                method=method, url=url, headers=headers, params=params, content=data
+            )
+
+        return await self.client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            content=data,
+            timeout=self._httpx_timeout(timeout),
+        )
+
+    async def close(self) -> None:
+        if not self.closed:
+            await self.client.aclose()
+            self.closed = True
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from ..exceptions import DirectusException
+from ..typing import Item
+from .bulk import BulkChunkResult, BulkResult
+
+# Send the records of a collection in bulk
+BulkSend = Callable[[str, List[Any]], BulkResult]
+
+
+@dataclass
+class WriteFailure:
+    """
+    Records of a bulk request that failed
+
+    Attributes
+    ----------
+    collection: str
+        The collection written to
+
+    operation: str
+        `create`, `update` or `delete`
+
+    records: list
+        The items (ids for deletes) sent in the failed request
+
+    error: Exception
+        The error raised by the request
+    """
+
+    collection: str
+    operation: str
+    records: List[Any]
+    error: Exception
+
+
+@dataclass
+class WriterStats:
+    """
+    Counters of a BufferedWriter
+
+    Attributes
+    ----------
+    writes: int
+        Creates, updates and deletes queued
+
+    merged: int
+        Updates merged into a create or an update of the same item already queued
+
+    dropped: int
+        Updates dropped because the item is deleted later in the buffer
+
+    sent: int
+        Records sent to the API
+
+    requests: int
+        Bulk requests sent
+
+    failed: int
+        Records of the failed requests
+    """
+
+    writes: int = 0
+    merged: int = 0
+    dropped: int = 0
+    sent: int = 0
+    requests: int = 0
+    failed: int = 0
+
+
+class CollectionBuffer(object):
+    """
+    A batch of writes queued for a collection: items to create, patches by id and
+    ids to delete, sent in this order
+    """
+
+    def __init__(self):
+        self.creates: List[Item] = []
+        # The queued creates carrying a primary key, by primary key
+        self.created: Dict[Hashable, Item] = {}
+        self.updates: Dict[Hashable, Item] = {}
+        self.deletes: Dict[Hashable, None] = {}
+
+    def __len__(self) -> int:
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+
+class BufferedWriter(object):
+    """
+    A write-behind buffer turning a stream of item writes into a few bulk requests.
+    Writes are queued per collection. Successive patches of an item are merged
+    into one update (or into its queued create), and updates are dropped when
+    the item is deleted later in the buffer. A batch sends its creates, then its
+    updates, then its deletes: a create or an update of an item whose delete is
+    queued starts a new batch, sent after it, so that it is not deleted.
+
+    The buffer is flushed in bulk when a collection holds `flush_size` writes, when
+    its oldest write has waited `flush_interval` seconds, on `flush()` and when
+    the writer is closed (or left, used as a context manager). Flushes run in a
+    background thread, or in the writing thread if `flush_interval` is None.
+    Once `max_buffered` writes are waiting, writes block until the buffer is
+    flushed.
+
+    Failed requests are passed to `on_error` as WriteFailure, or else kept in
+    `failures`.
+
+    Attributes
+    ----------
+    create, update, delete: callable
+        Send the items (ids for delete) of a collection in bulk, returning a
+        BulkResult
+
+    primary_key: str
+        The field identifying the items
+
+    flush_size: int
+        The number of writes of a collection that triggers a flush
+
+    flush_interval: float
+        The maximum number of seconds a write waits in the buffer
+
+    max_buffered: int
+        The maximum number of writes waiting in the buffer
+
+    on_error: callable
+        Called with each WriteFailure
+    """
+
+    def __init__(
+        self,
+        create: BulkSend,
+        update: BulkSend,
+        delete: BulkSend,
+        primary_key: str = "id",
+        flush_size: int = 100,
+        flush_interval: Optional[float] = 1.0,
+        max_buffered: int = 10000,
+        on_error: Optional[Callable[[WriteFailure], None]] = None,
+    ):
+        if flush_size < 1 or max_buffered < 1:
+            raise DirectusException("flush_size and max_buffered must be positive")
+
+        self.senders = {"create": create, "update": update, "delete": delete}
+        self.primary_key = primary_key
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.on_error = on_error
+        self.failures: List[WriteFailure] = []
+        self.stats = WriterStats()
+        self._buffers: Dict[str, List[CollectionBuffer]] = {}
+        self._buffered = 0
+        # When the oldest queued write was received, and whether a buffer is full
+        self._oldest: Optional[float] = None
+        self._full = False
+        self._closed = False
+        self._condition = Condition()
+        # Flushes are sent one at a time, so that writes reach the API in order
+        self._flush_lock = Lock()
+        self._flusher: Optional[Thread] = None
+
+    def create(self, collection: str, item: Item) -> None:
+        with self._condition:
+            id = item.get(self.primary_key)
+            buffer = self._buffer(collection, id)
+            item = dict(item)
+            buffer.creates.append(item)
+            if id is not None:
+                buffer.created[id] = item
+            flush = self._queued(collection, 1)
+
+        if flush:
+            self.flush()
+
+    def update(self, collection: str, id: Hashable, data: Item) -> None:
+        with self._condition:
+            buffer = self._buffer(collection, id)
+            before = len(buffer)
+            if id in buffer.created:
+                buffer.created[id].update(data)
+                self.stats.merged += 1
+            elif id in buffer.updates:
+                buffer.updates[id].update(data)
+                self.stats.merged += 1
+            else:
+                buffer.updates[id] = dict(data)
+            flush = self._queued(collection, len(buffer) - before)
+
+        if flush:
+            self.flush()
+
+    def delete(self, collection: str, id: Hashable) -> None:
+        with self._condition:
+            buffer = self._buffer(collection)
+            before = len(buffer)
+            if buffer.updates.pop(id, None) is not None:
+                self.stats.dropped += 1
+            buffer.deletes[id] = None
+            flush = self._queued(collection, len(buffer) - before)
+
+        if flush:
+            self.flush()
+
+    def _buffer(
+        self, collection: str, id: Optional[Hashable] = None
+    ) -> CollectionBuffer:
+        """
+        The batch of a collection taking a write of the item `id`, once there is
+        room for a write. The write goes to a new batch if the delete of the item
+        is queued in the last one.
+        """
+        while (
+            not self._closed
+            and self._flusher is not None
+            and self._buffered >= self.max_buffered
+        ):
+            self._condition.wait()
+
+        if self._closed:
+            raise DirectusException("The writer is closed")
+
+        batches = self._buffers.setdefault(collection, [])
+        if not batches or (id is not None and id in batches[-1].deletes):
+            batches.append(CollectionBuffer())
+
+        return batches[-1]
+
+    def _queued(self, collection: str, added: int) -> bool:
+        """
+        Account for a write, waking the flusher when a flush is due
+
+        Returns
+        -------
+            bool (True if the writing thread must flush)
+        """
+        self.stats.writes += 1
+        self._buffered += added
+        if self._oldest is None:
+            self._oldest = monotonic()
+
+        queued = sum(len(buffer) for buffer in self._buffers[collection])
+        full = queued >= self.flush_size or self._buffered >= self.max_buffered
+        if self.flush_interval is None:
+            return full
+
+        if self._flusher is None:
+            self._flusher = Thread(
+                target=self._run_flusher, name="directus-writer", daemon=True
+            )
+            self._flusher.start()
+        if full:
+            self._full = True
+            self._condition.notify_all()
+
+        return False
+
+    def flush(self) -> None:
+        """
+        Send every queued write, in bulk
+        """
+        with self._flush_lock:
+            with self._condition:
+                buffers, self._buffers = self._buffers, {}
+                self._buffered = 0
+                self._oldest = None
+                self._full = False
+                self._condition.notify_all()
+
+            for collection, batches in buffers.items():
+                for buffer in batches:
+                    self._send(collection, "create", buffer.creates)
+                    self._send(
+                        collection,
+                        "update",
+                        [
+                            {**patch, self.primary_key: id}
+                            for id, patch in buffer.updates.items()
+                        ],
+                    )
+                    self._send(collection, "delete", list(buffer.deletes))
+
+    def _send(self, collection: str, operation: str, records: List[Any]) -> None:
+        if not records:
+            return
+
+        try:
+            result = self.senders[operation](collection, records)
+        except DirectusException as error:
+            result = BulkResult(chunks=[BulkChunkResult(records=records, error=error)])
+
+        failures = [
+            WriteFailure(collection, operation, chunk.records, chunk.error)
+            for chunk in result.chunks
+            if chunk.error is not None
+        ]
+        with self._condition:
+            self.stats.sent += len(records)
+            self.stats.requests += len(result.chunks)
+            self.stats.failed += sum(len(failure.records) for failure in failures)
+            if self.on_error is None:
+                self.failures += failures
+
+        if self.on_error is not None:
+            for failure in failures:
+                self.on_error(failure)
+
+    def _flush_due(self) -> bool:
+        if self._oldest is None:
+            return False
+
+        return self._full or monotonic() - self._oldest >= (self.flush_interval or 0)
+
+    def _run_flusher(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._flush_due():
+                    timeout = None
+                    if self._oldest is not None:
+                        timeout = (
+                            self._oldest + (self.flush_interval or 0) - monotonic()
+                        )
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+            except Exception as error:
+                # An error callback raised: keep the flusher alive for the next writes
+                with self._condition:
+                    self.failures.append(WriteFailure("", "flush", [], error))
+
+    def close(self) -> None:
+        """
+        Flush the queued writes and stop the background flusher
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run, sleep
+from json import loads
+from time import time
+
+import httpx
+from jwt import encode
+from pytest import raises
+
+from directus import AsyncDirectusClient, AsyncTransport
+from directus.exceptions import DirectusException
+
+TOKEN = encode({"id": 1, "exp": int(time()) + 3600}, "secret").decode()
+
+
+def make_transport(handler):
+    return AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+class TestAsyncDirectusClient:
+    def test_client_no_server(self):
+        with raises(DirectusException):
+            AsyncDirectusClient(project="_")
+
+    def test_lazy_authentication(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path == "/_/auth/authenticate":
+                assert loads(request.content) == {
+                    "email": "email@example.com",
+                    "password": "password",
+                }
+                return httpx.Response(200, json={"data": {"token": TOKEN}})
+
+            assert request.headers["authorization"] == f"Bearer {TOKEN}"
+            return httpx.Response(200, json={"data": {"id": 1, "name": "Tennis"}})
+
+        async def scenario():
+            client = AsyncDirectusClient(
+                url="http://test.local",
+                project="_",
+                email="email@example.com",
+                password="password",
+                transport=make_transport(handler),
+            )
+            assert requests == []
+
+            item, _ = await client.get_item(collection="sports", id=1)
+            await client.get_item(collection="sports", id=1)
+            await client.close()
+
+            return item
+
+        assert run(scenario()) == {"id": 1, "name": "Tennis"}
+        assert [request.url.path for request in requests] == [
+            "/_/auth/authenticate",
+            "/_/items/sports/1",
+            "/_/items/sports/1",
+        ]
+
+    def test_items_list_params(self):
+        def handler(request):
+            assert request.url.params["fields"] == "id,name"
+            assert request.url.params["page"] == "2"
+            assert request.url.params["single"] == "0"
+            assert "offset" not in request.url.params
+            assert "status" not in request.url.params
+            return httpx.Response(200, json={"data": [{"id": 3}], "meta": {"page": 2}})
+
+        async def scenario():
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=make_transport(handler)
+            ) as client:
+                return await client.get_items_list(
+                    collection="sports", fields=["id", "name"], page=2, meta=["page"]
+                )
+
+        assert run(scenario()) == ([{"id": 3}], {"page": 2})
+
+    def test_gather_items_respects_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await sleep(0.01)
+            in_flight -= 1
+            id = int(request.url.path.split("/")[-1])
+            return httpx.Response(200, json={"data": {"id": id}})
+
+        async def scenario():
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=make_transport(handler)
+            ) as client:
+                return await client.gather_items(
+                    collection="sports", ids=range(10), concurrency=3
+                )
+
+        results = run(scenario())
+
+        assert [item["id"] for item, _ in results] == list(range(10))
+        assert max_in_flight == 3
+
+    def test_api_error(self):
+        def handler(request):
+            return httpx.Response(
+                404, json={"error": {"code": 203, "message": "Item not found"}}
+            )
+
+        async def scenario():
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=make_transport(handler)
+            ) as client:
+                await client.get_item(collection="sports", id=1)
+
+        with raises(DirectusException):
+            run(scenario())
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps, loads
+
+from responses import DELETE, PATCH, POST, add, add_callback
+from responses import activate as activate_responses
+
+from directus.directus import DirectusClient
+from directus.utils.bulk import chunked
+
+
+class TestChunked:
+    def test_chunk_size(self):
+        assert list(chunked(range(7), chunk_size=3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_max_bytes(self):
+        records = [{"name": "a" * 10}, {"name": "b" * 10}, {"name": "c" * 50}, {}]
+
+        # Each small record weights 22 bytes once serialized, the big one 62
+        assert list(chunked(records, chunk_size=10, max_bytes=50)) == [
+            records[:2],
+            [records[2]],
+            [records[3]],
+        ]
+
+
+class TestBulkItems:
+    @activate_responses
+    def test_create_items(self):
+        def callback(request):
+            payload = loads(request.body)
+            if any(item.get("name") == "invalid" for item in payload):
+                return (
+                    400,
+                    {},
+                    dumps({"error": {"code": 4, "message": "Invalid payload"}}),
+                )
+            return (
+                200,
+                {},
+                dumps(
+                    {
+                        "data": [
+                            {"id": index, **item} for index, item in enumerate(payload)
+                        ]
+                    }
+                ),
+            )
+
+        add_callback(POST, "http://test.local/_/items/sports", callback=callback)
+        client = DirectusClient(url="http://test.local", project="_")
+        items = [
+            {"name": "tennis"},
+            {"name": "invalid"},
+            {"name": "golf"},
+            {"name": "judo"},
+        ]
+
+        result = client.create_items(collection="sports", items=items, chunk_size=2)
+
+        assert len(result.chunks) == 2
+        assert [item["name"] for item in result.data] == ["golf", "judo"]
+        assert result.failed == items[:2]
+        assert result.errors[0].message.startswith("Invalid payload")
+
+    @activate_responses
+    def test_update_items_in_parallel(self):
+        def callback(request):
+            return (200, {}, dumps({"data": loads(request.body)}))
+
+        add_callback(PATCH, "http://test.local/_/items/sports", callback=callback)
+        client = DirectusClient(url="http://test.local", project="_")
+        items = [{"id": id, "name": f"sport {id}"} for id in range(10)]
+
+        result = client.update_items(
+            collection="sports", items=items, chunk_size=3, max_in_flight=3
+        )
+
+        assert result.data == items
+        assert result.failed == []
+
+    @activate_responses
+    def test_delete_items(self):
+        add(DELETE, "http://test.local/_/items/sports/1,2", status=204)
+        add(DELETE, "http://test.local/_/items/sports/3", status=204)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        result = client.delete_items(collection="sports", ids=[1, 2, 3], chunk_size=2)
+
+        assert [chunk.records for chunk in result.chunks] == [[1, 2], [3]]
+        assert result.failed == []
+        assert client.delete_item(collection="sports", id=3)
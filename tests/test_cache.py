@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps, loads
+from time import sleep, time
+from urllib.parse import parse_qs, urlparse
+
+from jwt import encode
+from pytest import raises
+from responses import DELETE, GET, PATCH, POST, add, add_callback, calls
+from responses import activate as activate_responses
+
+from directus import DirectusClient, ReadCache
+from directus.exceptions import DirectusException
+
+
+def make_client(cache):
+    return DirectusClient(url="http://test.local", project="_", cache=cache)
+
+
+class TestReadCache:
+    def test_key_normalizes_params(self):
+        assert ReadCache.key(
+            "items/sports/1", {"fields": "id,name", "meta": "total_count,result_count"}
+        ) == ReadCache.key(
+            "/items/sports/1", {"meta": "result_count,total_count", "fields": "name,id"}
+        )
+        assert ReadCache.key("items/sports/1", {"fields": "id"}) != ReadCache.key(
+            "items/sports/1", {"fields": "name"}
+        )
+
+    def test_lru_eviction(self):
+        cache = ReadCache(max_entries=2)
+        cache.set(("a", ()), b"a")
+        cache.set(("b", ()), b"b")
+        cache.get(("a", ()))
+        cache.set(("c", ()), b"c")
+
+        assert cache.get(("b", ())) is None
+        assert cache.get(("a", ())).body == b"a"
+        assert cache.stats.evictions == 1
+
+    def test_max_bytes(self):
+        cache = ReadCache(max_bytes=10)
+        cache.set(("a", ()), b"12345")
+        cache.set(("b", ()), b"12345")
+        cache.set(("c", ()), b"1")
+        cache.set(("d", ()), b"12345678901")
+
+        assert len(cache) == 2
+        assert cache.size == 6
+        assert cache.get(("d", ())) is None
+
+    def test_per_collection_ttl(self):
+        cache = ReadCache(ttl=60, ttls={"scores": 0.01})
+        cache.set(("items/sports/1", ()), b"sport")
+        cache.set(("items/scores/1", ()), b"score")
+        sleep(0.02)
+
+        assert cache.get(("items/sports/1", ())).body == b"sport"
+        assert cache.get(("items/scores/1", ())) is None
+        assert len(cache) == 1
+
+
+class TestClientCache:
+    @activate_responses
+    def test_get_item_cached(self):
+        add(GET, "http://test.local/_/items/sports/1", json={"data": {"id": 1}})
+        cache = ReadCache()
+        client = make_client(cache)
+
+        first = client.get_item(collection="sports", id=1, fields=["id", "name"])
+        # Returned items can be modified without altering the cache
+        first[0]["name"] = "changed"
+        second = client.get_item(collection="sports", id=1, fields=["name", "id"])
+
+        assert second == ({"id": 1}, {})
+        assert len(calls) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @activate_responses
+    def test_entries_scoped_by_user(self):
+        def authenticate(request):
+            user = {"admin@example.com": 1, "editor@example.com": 2}[
+                loads(request.body)["email"]
+            ]
+            token = encode({"id": user, "exp": int(time()) + 3600}, "secret").decode()
+
+            return (200, {}, dumps({"data": {"token": token}}))
+
+        def get_item(request):
+            user = 1 if request.headers["authorization"] == admin_header else 2
+
+            return (200, {}, dumps({"data": {"id": 1, "user": user}}))
+
+        add_callback(POST, "http://test.local/_/auth/authenticate", authenticate)
+        add_callback(GET, "http://test.local/_/items/sports/1", get_item)
+        cache = ReadCache()
+        admin = DirectusClient(
+            url="http://test.local",
+            project="_",
+            email="admin@example.com",
+            password="password",
+            cache=cache,
+        )
+        admin_header = admin.ApiClient.baseHeader["authorization"]
+        editor = DirectusClient(
+            url="http://test.local",
+            project="_",
+            email="editor@example.com",
+            password="password",
+            cache=cache,
+        )
+
+        assert admin.get_item(collection="sports", id=1)[0]["user"] == 1
+        assert editor.get_item(collection="sports", id=1)[0]["user"] == 2
+        assert editor.get_item(collection="sports", id=1)[0]["user"] == 2
+        assert admin.get_item(collection="sports", id=1)[0]["user"] == 1
+        assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+        # A write by one user invalidates the entries of every user
+        add(DELETE, "http://test.local/_/items/sports/1", status=204)
+        editor.delete_item(collection="sports", id=1)
+        assert len(cache) == 0
+
+    @activate_responses
+    def test_lazy_authentication(self):
+        token = encode({"id": 1, "exp": int(time()) + 3600}, "secret").decode()
+        add(
+            POST,
+            "http://test.local/_/auth/authenticate",
+            json={"data": {"token": token}},
+        )
+        add(GET, "http://test.local/_/items/sports/1", json={"data": {"id": 1}})
+        cache = ReadCache()
+        anonymous = make_client(cache)
+        client = DirectusClient(
+            url="http://test.local",
+            project="_",
+            email="admin@example.com",
+            password="password",
+            lazy_auth=True,
+            cache=cache,
+        )
+
+        client.get_item(collection="sports", id=1)
+        client.get_item(collection="sports", id=1)
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        # The entry cached for the user is not served without its token
+        anonymous.get_item(collection="sports", id=1)
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    @activate_responses
+    def test_writes_invalidate(self):
+        add(GET, "http://test.local/_/items/sports/1", json={"data": {"id": 1}})
+        add(GET, "http://test.local/_/collections/sports", json={"data": {}})
+        add(PATCH, "http://test.local/_/items/sports/1", json={"data": {"id": 1}})
+        add(PATCH, "http://test.local/_/collections/sports", json={"data": {}})
+        add(
+            PATCH,
+            "http://test.local/_/items/sports/1/revert/2",
+            json={"data": {"id": 1}},
+        )
+        add(DELETE, "http://test.local/_/items/sports/1", status=204)
+        cache = ReadCache()
+        client = make_client(cache)
+
+        writes = [
+            lambda: client.update_item(collection="sports", id=1, data={}),
+            lambda: client.revert_item_revision(collection="sports", id=1, revision=2),
+            lambda: client.delete_item(collection="sports", id=1),
+        ]
+        for write in writes:
+            client.get_item(collection="sports", id=1)
+            client.get_item(collection="sports", id=1)
+            write()
+        client.get_collection(collection="sports")
+        client.update_collection(collection="sports", data={})
+        client.get_collection(collection="sports")
+
+        gets = [call for call in calls if call.request.method == "GET"]
+        assert len(gets) == 5
+        assert cache.stats.invalidations == 4
+
+    @activate_responses
+    def test_errors_not_cached(self):
+        add(
+            GET,
+            "http://test.local/_/items/sports/1",
+            status=404,
+            body=dumps({"error": {"code": 203, "message": "Item not found"}}),
+        )
+        cache = ReadCache()
+        client = make_client(cache)
+
+        for _ in range(2):
+            with raises(DirectusException):
+                client.get_item(collection="sports", id=1)
+
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+
+class TestRevalidation:
+    def setup_method(self):
+        self.requests = []
+
+    @activate_responses
+    def test_etag_revalidation(self):
+        def callback(request):
+            self.requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return (304, {}, "")
+            return (200, {"ETag": '"v1"'}, dumps({"data": {"id": 1}}))
+
+        add_callback(GET, "http://test.local/_/items/sports/1", callback=callback)
+        cache = ReadCache(ttl=0.01)
+        client = make_client(cache)
+
+        client.get_item(collection="sports", id=1)
+        sleep(0.02)
+        item = client.get_item(collection="sports", id=1)
+        client.get_item(collection="sports", id=1)
+
+        assert item == ({"id": 1}, {})
+        assert len(self.requests) == 2
+        assert "if-none-match" not in self.requests[0].headers
+        assert cache.stats.revalidations == 1
+        assert cache.stats.hits == 1
+
+    @activate_responses
+    def test_last_modified_revalidation(self):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+        def callback(request):
+            self.requests.append(request)
+            if request.headers.get("if-modified-since") == last_modified:
+                return (304, {}, "")
+            return (200, {"Last-Modified": last_modified}, dumps({"data": {"id": 1}}))
+
+        add_callback(GET, "http://test.local/_/items/sports/1", callback=callback)
+        cache = ReadCache(ttl=0.01)
+        client = make_client(cache)
+
+        client.get_item(collection="sports", id=1)
+        sleep(0.02)
+
+        assert client.get_item(collection="sports", id=1) == ({"id": 1}, {})
+        assert len(self.requests) == 2
+
+    @activate_responses
+    def test_modified_field_fallback(self):
+        item = {"id": 1, "name": "tennis", "modified_on": "2020-01-01 10:00:00"}
+
+        def callback(request):
+            params = parse_qs(urlparse(request.url).query)
+            self.requests.append(params)
+            if params.get("fields") == ["modified_on"]:
+                return (200, {}, dumps({"data": {"modified_on": item["modified_on"]}}))
+            return (200, {}, dumps({"data": item}))
+
+        add_callback(GET, "http://test.local/_/items/sports/1", callback=callback)
+        cache = ReadCache(ttl=0.01)
+        client = make_client(cache)
+
+        client.get_item(collection="sports", id=1)
+        sleep(0.02)
+        assert client.get_item(collection="sports", id=1) == (item, {})
+        assert self.requests[1]["fields"] == ["modified_on"]
+        assert cache.stats.revalidations == 1
+
+        item = {**item, "name": "padel", "modified_on": "2020-01-02 10:00:00"}
+        sleep(0.02)
+        assert client.get_item(collection="sports", id=1) == (item, {})
+        assert [params["fields"] for params in self.requests[2:]] == [
+            ["modified_on"],
+            ["*"],
+        ]
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import gather, run, sleep
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+from time import sleep as thread_sleep
+
+import httpx
+from pytest import raises
+from responses import GET, PATCH, add, add_callback, calls
+from responses import activate as activate_responses
+
+from directus import AsyncDirectusClient, AsyncTransport, DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils import SingleFlight
+
+URL = "http://test.local/_/items/sports/1"
+
+
+class TestSingleFlight:
+    def test_share_result_and_error(self):
+        flight = SingleFlight()
+        started, release = Event(), Event()
+
+        def fetch():
+            started.set()
+            release.wait()
+            return [1]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(flight.do, "key", fetch, list)
+            started.wait()
+            followers = [
+                executor.submit(flight.do, "key", fetch, list) for _ in range(3)
+            ]
+            while flight.shared < 3:
+                thread_sleep(0.001)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert results == [[1]] * 4
+        # Each caller gets its own copy
+        assert len({id(result) for result in results}) == 4
+
+        def fail():
+            raise DirectusException("unavailable")
+
+        with raises(DirectusException):
+            flight.do("key", fail, list)
+
+
+class TestCoalescing:
+    @activate_responses
+    def test_concurrent_get_item(self):
+        barrier = Barrier(6)
+
+        def respond(request):
+            # Let the other threads join the request in flight
+            thread_sleep(0.1)
+            return (200, {}, '{"data": {"id": 1, "name": "tennis"}}')
+
+        add_callback(GET, URL, callback=respond)
+        client = DirectusClient(url="http://test.local", project="_", coalesce=True)
+
+        def get_item():
+            barrier.wait()
+            item, _ = client.get_item(collection="sports", id=1)
+            item["name"] = item["name"].upper()
+            return item
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            items = list(executor.map(lambda _: get_item(), range(6)))
+
+        assert items == [{"id": 1, "name": "TENNIS"}] * 6
+        assert len(calls) == 1
+        assert client.ApiClient.single_flight.shared == 5
+
+    def test_different_identities_are_not_shared(self):
+        client = DirectusClient(url="http://test.local", project="_", coalesce=True)
+        api = client.ApiClient
+
+        anonymous = api._flight_key("items/sports/1", {"fields": "id,name"}, {})
+        reordered = api._flight_key("items/sports/1", {"fields": "name,id"}, {})
+        api._set_token("token")
+
+        assert anonymous == reordered
+        assert api._flight_key("items/sports/1", {"fields": "id,name"}, {}) != anonymous
+
+    @activate_responses
+    def test_write_forgets_requests_in_flight(self):
+        add(PATCH, URL, json={"data": {"id": 1}})
+        client = DirectusClient(url="http://test.local", project="_", coalesce=True)
+        flight = client.ApiClient.single_flight
+        flight._calls[client.ApiClient._flight_key("items/sports/1", {}, {})] = None
+
+        client.update_item(collection="sports", id=1, data={"name": "padel"})
+
+        assert flight._calls == {}
+
+
+class TestAsyncCoalescing:
+    def test_concurrent_get_item(self):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await sleep(0.01)
+            return httpx.Response(200, json={"data": {"id": 1, "name": "tennis"}})
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport, coalesce=True
+            ) as client:
+                results = await gather(
+                    *[client.get_item(collection="sports", id=1) for _ in range(5)]
+                )
+                other = await client.get_item(collection="sports", id=1)
+                return [item for item, _ in results], other
+
+        items, (other, _) = run(scenario())
+
+        assert items == [{"id": 1, "name": "tennis"}] * 5
+        assert len({id(item) for item in items}) == 5
+        # Once the request completed, the following calls send their own
+        assert other == items[0]
+        assert len(requests) == 2
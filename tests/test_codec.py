@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+
+from pytest import raises
+from responses import GET, POST, add, add_callback
+from responses import activate as activate_responses
+
+from directus.directus import DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils.codec import JsonCodec, OrjsonCodec
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.dumped = 0
+        self.loaded = 0
+
+    def dumps(self, data):
+        self.dumped += 1
+        return super().dumps(data)
+
+    def loads(self, content):
+        self.loaded += 1
+        return super().loads(content)
+
+
+class TestCodec:
+    @activate_responses
+    def test_response_decoded_once(self):
+        add(GET, "http://test.local/_/items/sports", json={"data": [{"id": 1}]})
+        codec = CountingCodec()
+        client = DirectusClient(url="http://test.local", project="_", codec=codec)
+
+        items, _ = client.get_items_list(collection="sports")
+
+        assert items == [{"id": 1}]
+        assert codec.loaded == 1
+
+    @activate_responses
+    def test_error_decoded_once(self):
+        add(
+            GET,
+            "http://test.local/_/items/sports/1",
+            status=404,
+            json={"error": {"code": 203, "message": "Item not found"}},
+        )
+        codec = CountingCodec()
+        client = DirectusClient(url="http://test.local", project="_", codec=codec)
+
+        with raises(DirectusException):
+            client.get_item(collection="sports", id=1)
+        assert codec.loaded == 1
+
+    @activate_responses
+    def test_request_encoded_with_codec(self):
+        def callback(request):
+            assert request.headers["content-type"] == "application/json"
+            assert request.body == b'{"name":"Tennis"}'
+            return (200, {}, dumps({"data": {"id": 1, "name": "Tennis"}}))
+
+        add_callback(POST, "http://test.local/_/items/sports", callback=callback)
+        codec = CountingCodec()
+        client = DirectusClient(url="http://test.local", project="_", codec=codec)
+
+        item, _ = client.create_item(collection="sports", item={"name": "Tennis"})
+
+        assert item == {"id": 1, "name": "Tennis"}
+        assert codec.dumped == 1
+
+    def test_orjson_codec(self):
+        codec = OrjsonCodec()
+
+        assert codec.loads(codec.dumps({"data": [1, "a"]})) == {"data": [1, "a"]}
+        with raises(ValueError):
+            codec.loads(b"<html>")
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+from asyncio import run
+from json import dumps, loads
+
+import httpx
+from pytest import raises
+from responses import POST, add, add_callback, calls
+from responses import activate as activate_responses
+
+from directus import (
+    AsyncDirectusClient,
+    AsyncTransport,
+    Compression,
+    DirectusClient,
+    Hooks,
+    MetricsCollector,
+)
+from directus.exceptions import DirectusException
+
+URL = "http://test.local/_/items/sports"
+ITEMS = [{"name": f"Sport {id}", "description": "A sport " * 20} for id in range(50)]
+
+
+def created(request):
+    body = request.body
+    if request.headers.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+
+    return (200, {}, dumps({"data": loads(body)}))
+
+
+def gzipped_response(request):
+    body = gzip.compress(dumps({"data": ITEMS}).encode())
+
+    return (200, {"content-encoding": "gzip"}, body)
+
+
+def rejecting(status, message="Invalid"):
+    def callback(request):
+        if request.headers.get("content-encoding") == "gzip":
+            return (status, {}, dumps({"error": {"code": 1, "message": message}}))
+
+        return created(request)
+
+    return callback
+
+
+class TestCompression:
+    def make_client(self, **kwargs):
+        return DirectusClient(url="http://test.local", project="_", **kwargs)
+
+    def test_compression_level(self):
+        with raises(DirectusException):
+            Compression(level=0)
+
+    @activate_responses
+    def test_large_bodies_compressed(self):
+        add_callback(POST, URL, callback=created)
+        compression = Compression(min_size=1024)
+        client = self.make_client(compression=compression)
+
+        client.create_item(collection="sports", item={"name": "Tennis"})
+        result = client.create_items(collection="sports", items=ITEMS)
+
+        small, large = calls[0].request, calls[1].request
+        assert "content-encoding" not in small.headers
+        assert loads(small.body) == {"name": "Tennis"}
+        assert large.headers["content-encoding"] == "gzip"
+        assert large.headers["accept-encoding"] == compression.accept_encoding
+        assert len(large.body) < len(dumps(ITEMS)) / 5
+        assert result.data == ITEMS
+
+    @activate_responses
+    def test_fallback_when_rejected(self):
+        add_callback(POST, URL, callback=rejecting(415))
+        compression = Compression()
+        client = self.make_client(compression=compression)
+
+        assert client.create_items(collection="sports", items=ITEMS).data == ITEMS
+        assert compression.rejected
+        assert [call.request.headers.get("content-encoding") for call in calls] == [
+            "gzip",
+            None,
+        ]
+
+        client.create_items(collection="sports", items=ITEMS)
+        assert len(calls) == 3
+        assert "content-encoding" not in calls[2].request.headers
+
+    @activate_responses
+    def test_invalid_payload_does_not_disable_compression(self):
+        add(
+            POST,
+            URL,
+            status=400,
+            json={"error": {"code": 4, "message": "Invalid payload"}},
+        )
+        compression = Compression()
+        client = self.make_client(compression=compression)
+
+        with raises(DirectusException):
+            client.create_item(collection="sports", item=ITEMS[0], meta=["*"])
+        with raises(DirectusException):
+            client.create_item(collection="sports", item={"items": ITEMS}, meta=["*"])
+        assert not compression.rejected
+        # Invalid payloads are not sent again uncompressed
+        assert [call.request.headers.get("content-encoding") for call in calls] == [
+            None,
+            "gzip",
+        ]
+
+    @activate_responses
+    def test_undecodable_body_rejected(self):
+        add_callback(
+            POST, URL, callback=rejecting(400, "Request body could not be decoded")
+        )
+        compression = Compression()
+        client = self.make_client(compression=compression)
+
+        assert client.create_items(collection="sports", items=ITEMS).data == ITEMS
+        assert compression.rejected
+        assert len(calls) == 2
+
+    @activate_responses
+    def test_raw_and_wire_counters(self):
+        add_callback(POST, URL, callback=created)
+        add_callback(
+            "GET", URL, callback=gzipped_response, content_type="application/json"
+        )
+        metrics = MetricsCollector()
+        hooks = Hooks()
+        hooks.add_listener(metrics)
+        events = []
+        hooks.add("after_response", events.append)
+        client = self.make_client(compression=Compression(), hooks=hooks)
+
+        client.create_items(collection="sports", items=ITEMS)
+        items, _ = client.get_items_list(collection="sports", limit=-1)
+
+        assert items == ITEMS
+        sent, received = events
+        assert sent.wire_bytes_sent == len(calls[0].request.body)
+        assert sent.wire_bytes_sent < sent.bytes_sent / 5
+        assert received.bytes_received == len(dumps({"data": ITEMS}))
+        assert received.wire_bytes_received < received.bytes_received / 5
+        snapshot = metrics.snapshot()["POST items/{collection}"]
+        assert snapshot["wire_bytes_sent"] == sent.wire_bytes_sent
+        assert snapshot["bytes_sent"] == sent.bytes_sent
+
+
+class TestAsyncCompression:
+    def test_compressed_request_and_response(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            items = loads(gzip.decompress(request.content))
+            return httpx.Response(
+                200,
+                headers={"content-encoding": "gzip"},
+                content=gzip.compress(dumps({"data": items}).encode()),
+            )
+
+        events = []
+        hooks = Hooks()
+        hooks.add("after_response", events.append)
+
+        async def main():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local",
+                project="_",
+                transport=transport,
+                compression=Compression(),
+                hooks=hooks,
+            ) as client:
+                return await client.create_item(
+                    collection="sports", item={"name": "Sports", "items": ITEMS}
+                )
+
+        item, _ = run(main())
+        assert item == {"name": "Sports", "items": ITEMS}
+        assert requests[0].headers["content-encoding"] == "gzip"
+        assert events[0].wire_bytes_sent < events[0].bytes_sent / 5
+        assert events[0].wire_bytes_received < events[0].bytes_received / 5
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+from io import BytesIO
+from json import dumps
+from threading import Lock
+from urllib.parse import parse_qs, urlparse
+
+from pytest import raises
+from requests import Response
+from responses import GET, add_callback
+from responses import activate as activate_responses
+
+from directus import DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils.download import download_stream
+
+CONTENT = bytes(range(256)) * 100
+ASSET_URL = "http://test.local/uploads/_/originals/abc.bin"
+
+
+def file_of(id, size=len(CONTENT)):
+    return {
+        "id": id,
+        "filename_disk": f"file{id}.bin",
+        "filesize": size,
+        "data": {"full_url": ASSET_URL},
+    }
+
+
+class TestDownload:
+    def setup_method(self):
+        self.lock = Lock()
+        self.ranges = []
+        self.support_ranges = True
+
+    def asset(self, request):
+        byte_range = request.headers.get("range")
+        with self.lock:
+            self.ranges.append(byte_range)
+        if byte_range is None or not self.support_ranges:
+            return (200, {}, CONTENT)
+
+        start, end = byte_range[len("bytes=") :].split("-")
+        end = int(end) if end else len(CONTENT) - 1
+        return (206, {}, CONTENT[int(start) : end + 1])
+
+    def add_callbacks(self):
+        add_callback(
+            GET,
+            "http://test.local/_/files/1",
+            callback=lambda request: (200, {}, dumps({"data": file_of(1)})),
+        )
+        add_callback(GET, ASSET_URL, callback=self.asset)
+
+    def make_client(self):
+        return DirectusClient(url="http://test.local", project="_")
+
+    @activate_responses
+    def test_download_file(self, tmp_path):
+        self.add_callbacks()
+        progress = []
+
+        path = self.make_client().download_file(
+            id=1,
+            dest=tmp_path / "file.bin",
+            chunk_size=4096,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert open(path, "rb").read() == CONTENT
+        assert self.ranges == [None]
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+        assert not (tmp_path / "file.bin.part").exists()
+
+    @activate_responses
+    def test_download_file_in_ranges(self, tmp_path):
+        self.add_callbacks()
+
+        path = self.make_client().download_file(
+            id=1, dest=tmp_path / "file.bin", part_size=10000, max_in_flight=3
+        )
+
+        assert open(path, "rb").read() == CONTENT
+        assert sorted(self.ranges) == [
+            "bytes=0-9999",
+            "bytes=10000-19999",
+            "bytes=20000-25599",
+        ]
+        assert not (tmp_path / "file.bin.part.ranges").exists()
+
+    @activate_responses
+    def test_resume_download(self, tmp_path):
+        self.add_callbacks()
+        (tmp_path / "file.bin.part").write_bytes(CONTENT[:1000])
+
+        path = self.make_client().download_file(
+            id=1, dest=tmp_path / "file.bin", max_in_flight=1
+        )
+
+        assert open(path, "rb").read() == CONTENT
+        assert self.ranges == ["bytes=1000-"]
+
+    @activate_responses
+    def test_resume_download_in_ranges(self, tmp_path):
+        self.add_callbacks()
+        (tmp_path / "file.bin.part").write_bytes(
+            CONTENT[:10000] + bytes(len(CONTENT) - 10000)
+        )
+        (tmp_path / "file.bin.part.ranges").write_text("0-9999\n")
+
+        path = self.make_client().download_file(
+            id=1, dest=tmp_path / "file.bin", part_size=10000
+        )
+
+        assert open(path, "rb").read() == CONTENT
+        assert sorted(self.ranges) == ["bytes=10000-19999", "bytes=20000-25599"]
+
+    @activate_responses
+    def test_resume_failed_ranged_download(self, tmp_path):
+        failing = ["bytes=10000-19999"]
+        asset = self.asset
+
+        def truncated(request):
+            status, headers, body = asset(request)
+            if request.headers.get("range") in failing:
+                body = body[:100]
+            return (status, headers, body)
+
+        self.asset = truncated
+        self.add_callbacks()
+        with raises(DirectusException):
+            self.make_client().download_file(
+                id=1, dest=tmp_path / "file.bin", part_size=10000, max_in_flight=2
+            )
+        assert (tmp_path / "file.bin.part").stat().st_size == len(CONTENT)
+
+        failing.clear()
+        self.ranges.clear()
+        path = self.make_client().download_file(
+            id=1, dest=tmp_path / "file.bin", part_size=10000, max_in_flight=1
+        )
+
+        assert open(path, "rb").read() == CONTENT
+        assert self.ranges == ["bytes=10000-19999"]
+        assert not (tmp_path / "file.bin.part.ranges").exists()
+
+    def test_stream_discards_a_ranged_partial(self, tmp_path):
+        partial = str(tmp_path / "file.bin.part")
+        with open(partial, "wb") as file:
+            file.write(CONTENT[:10000] + bytes(len(CONTENT) - 10000))
+        with open(partial + ".ranges", "w") as file:
+            file.write("0-9999\n")
+        requested = []
+
+        def open_range(byte_range):
+            requested.append(byte_range)
+            response = Response()
+            response.status_code = 200
+            response.raw = BytesIO(CONTENT)
+            return response
+
+        download_stream(open_range, partial, len(CONTENT))
+
+        assert open(partial, "rb").read() == CONTENT
+        assert requested == [None]
+        assert not (tmp_path / "file.bin.part.ranges").exists()
+
+    @activate_responses
+    def test_ranges_not_supported(self, tmp_path):
+        self.add_callbacks()
+        self.support_ranges = False
+
+        path = self.make_client().download_file(
+            id=1, dest=tmp_path / "file.bin", part_size=10000, max_in_flight=2
+        )
+
+        assert open(path, "rb").read() == CONTENT
+        assert self.ranges[-1] is None
+        assert not (tmp_path / "file.bin.part.ranges").exists()
+
+    @activate_responses
+    def test_download_files(self, tmp_path):
+        def files(request):
+            params = parse_qs(urlparse(request.url).query)
+            assert params["filter[type][eq]"] == ["application/octet-stream"]
+            offset = int(params.get("offset", ["0"])[0])
+            data = [file_of(id) for id in range(1, 6)][offset : offset + 2]
+            return (200, {}, dumps({"data": data}))
+
+        add_callback(GET, "http://test.local/_/files", callback=files)
+        add_callback(GET, ASSET_URL, callback=self.asset)
+        (tmp_path / "file2.bin").write_bytes(CONTENT)
+
+        result = self.make_client().download_files(
+            dest=tmp_path,
+            filter={"type": "application/octet-stream"},
+            limit=2,
+            max_in_flight=2,
+        )
+
+        assert result.data == [str(tmp_path / f"file{id}.bin") for id in range(1, 6)]
+        assert result.failed == []
+        assert len(self.ranges) == 4
+        assert (tmp_path / "file5.bin").read_bytes() == CONTENT
+
+    @activate_responses
+    def test_token_only_sent_to_the_server(self, tmp_path):
+        headers = {}
+
+        def asset(name):
+            def callback(request):
+                headers[name] = request.headers.get("authorization")
+                return (200, {}, CONTENT)
+
+            return callback
+
+        add_callback(GET, ASSET_URL, callback=asset("server"))
+        add_callback(GET, "https://cdn.example.com/abc.bin", callback=asset("cdn"))
+        add_callback(
+            GET, "http://test.local.example.com/abc.bin", callback=asset("lookalike")
+        )
+        client = self.make_client()
+        client.ApiClient._set_token("token")
+
+        for url in (
+            ASSET_URL,
+            "https://cdn.example.com/abc.bin",
+            "http://test.local.example.com/abc.bin",
+        ):
+            client.ApiClient.do_stream(url).close()
+
+        assert headers == {"server": "Bearer token", "cdn": None, "lookalike": None}
+
+    @activate_responses
+    def test_download_files_failures(self, tmp_path):
+        def files(request):
+            data = [file_of(id) for id in range(1, 5)]
+            data[1]["data"] = None
+            return (200, {}, dumps({"data": data}))
+
+        add_callback(GET, "http://test.local/_/files", callback=files)
+        add_callback(GET, ASSET_URL, callback=self.asset)
+        # The downloaded file cannot replace a directory
+        (tmp_path / "file3.bin").mkdir()
+
+        result = self.make_client().download_files(dest=tmp_path, max_in_flight=2)
+
+        assert result.data == [str(tmp_path / f"file{id}.bin") for id in (1, 4)]
+        assert [file["id"] for file in result.failed] == [2, 3]
+        assert (tmp_path / "file4.bin").read_bytes() == CONTENT
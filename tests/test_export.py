@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from csv import DictReader
+from io import BytesIO, StringIO
+from json import dumps, loads
+from urllib.parse import parse_qs, urlparse
+
+from pytest import importorskip, raises
+from responses import GET, add, add_callback
+from responses import activate as activate_responses
+
+from directus import DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils.export import ArrowWriter, schema_columns
+
+ITEMS = [
+    {
+        "id": id,
+        "name": f"sport {id}",
+        "score": str(id / 2),
+        "active": id % 2 == 0,
+        "tags": ["a", "b"],
+    }
+    for id in range(1, 12)
+]
+SCHEMA = {
+    "id": {"field": "id", "type": "integer"},
+    "name": {"field": "name", "type": "string"},
+    "score": {"field": "score", "type": "decimal"},
+    "active": {"field": "active", "type": "boolean"},
+    "tags": {"field": "tags", "type": "array"},
+    "teams": {"field": "teams", "type": "o2m"},
+}
+
+
+class TestExport:
+    def setup_method(self):
+        self.pages = []
+
+    def add_callbacks(self):
+        def items(request):
+            params = {
+                key: values[0]
+                for key, values in parse_qs(urlparse(request.url).query).items()
+            }
+            page, limit = int(params["page"]), int(params["limit"])
+            self.pages.append(page)
+            data = ITEMS[(page - 1) * limit : page * limit]
+            return (200, {}, dumps({"data": data}))
+
+        add_callback(GET, "http://test.local/_/items/sports", callback=items)
+        add(
+            GET,
+            "http://test.local/_/collections/sports",
+            json={"data": {"collection": "sports", "fields": SCHEMA}},
+        )
+
+    def export(self, format, **kwargs):
+        client = DirectusClient(url="http://test.local", project="_")
+        output = BytesIO()
+        stats = client.export_items(
+            collection="sports", dest=output, format=format, limit=5, **kwargs
+        )
+        return output.getvalue(), stats
+
+    def test_schema_columns(self):
+        assert schema_columns(SCHEMA) == {
+            "id": "integer",
+            "name": "string",
+            "score": "decimal",
+            "active": "boolean",
+            "tags": "array",
+        }
+        assert schema_columns(list(SCHEMA.values()), ["id", "teams.*", "other"]) == {
+            "id": "integer",
+            "teams": "o2m",
+            "other": "string",
+        }
+
+    @activate_responses
+    def test_export_ndjson(self):
+        self.add_callbacks()
+
+        content, stats = self.export("ndjson")
+
+        assert [loads(line) for line in content.splitlines()] == ITEMS
+        assert (stats.rows, stats.pages, stats.bytes) == (11, 3, len(content))
+        assert stats.rows_per_second > 0
+        assert self.pages == [1, 2, 3]
+
+    @activate_responses
+    def test_export_csv(self, tmp_path):
+        self.add_callbacks()
+
+        content, stats = self.export("csv")
+
+        rows = list(DictReader(StringIO(content.decode())))
+        assert list(rows[0]) == ["id", "name", "score", "active", "tags"]
+        assert rows[1] == {
+            "id": "2",
+            "name": "sport 2",
+            "score": "1.0",
+            "active": "True",
+            "tags": '["a","b"]',
+        }
+        assert stats.rows == len(rows)
+
+    @activate_responses
+    def test_export_parquet(self, tmp_path):
+        pyarrow = importorskip("pyarrow")
+        parquet = importorskip("pyarrow.parquet")
+        self.add_callbacks()
+        client = DirectusClient(url="http://test.local", project="_")
+
+        stats = client.export_items(
+            collection="sports", dest=tmp_path / "sports.parquet", format="parquet"
+        )
+
+        table = parquet.read_table(tmp_path / "sports.parquet")
+        assert table.schema.types == [
+            pyarrow.int64(),
+            pyarrow.string(),
+            pyarrow.float64(),
+            pyarrow.bool_(),
+            pyarrow.string(),
+        ]
+        assert table.column("score").to_pylist() == [id / 2 for id in range(1, 12)]
+        assert table.column("tags")[0].as_py() == '["a","b"]'
+        assert stats.bytes == (tmp_path / "sports.parquet").stat().st_size
+
+    @activate_responses
+    def test_export_arrow_without_schema(self):
+        pyarrow = importorskip("pyarrow")
+        self.add_callbacks()
+
+        content, stats = self.export("arrow", schema=False)
+
+        table = pyarrow.ipc.open_file(pyarrow.BufferReader(content)).read_all()
+        assert table.num_rows == 11
+        assert table.column("tags")[0].as_py() == ["a", "b"]
+
+    def test_unknown_format(self):
+        client = DirectusClient(url="http://test.local", project="_")
+
+        with raises(DirectusException):
+            client.export_items(collection="sports", dest=BytesIO(), format="xml")
+
+    def test_arrow_without_pyarrow(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with raises(DirectusException):
+            ArrowWriter(BytesIO())
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run
+from time import time
+
+import httpx
+from jwt import encode
+from pytest import importorskip, raises
+from requests import ConnectionError
+from responses import GET, POST, add
+from responses import activate as activate_responses
+
+from directus import (
+    AsyncDirectusClient,
+    AsyncTransport,
+    DirectusClient,
+    Hooks,
+    MetricsCollector,
+    RetryPolicy,
+)
+from directus.exceptions import DirectusException
+from directus.utils.hooks import templated_path
+
+URL = "http://test.local/_/items/sports/1"
+
+
+def record(hooks):
+    events = []
+    for event in (
+        "before_request",
+        "after_response",
+        "on_error",
+        "on_retry",
+        "on_token_refresh",
+    ):
+        hooks.add(event, lambda payload, event=event: events.append((event, payload)))
+    return events
+
+
+class TestTemplatedPath:
+    def test_templates(self):
+        assert templated_path("items/sports/1") == "items/{collection}/{id}"
+        assert templated_path("items/sports") == "items/{collection}"
+        assert (
+            templated_path("items/sports/1/revisions/2")
+            == "items/{collection}/{id}/revisions/{id}"
+        )
+        assert templated_path("collections/sports") == "collections/{collection}"
+        assert templated_path("files/12") == "files/{id}"
+        assert templated_path("auth/refresh") == "auth/refresh"
+
+    def test_unknown_event(self):
+        with raises(DirectusException):
+            Hooks().add("after_request", print)
+
+
+class TestHooks:
+    def make_client(self, hooks, **kwargs):
+        return DirectusClient(
+            url="http://test.local", project="_", hooks=hooks, **kwargs
+        )
+
+    @activate_responses
+    def test_events(self, monkeypatch):
+        monkeypatch.setattr("directus.utils.apiclient.sleep", lambda delay: None)
+        add(GET, URL, status=503)
+        add(GET, URL, json={"data": {"id": 1, "name": "tennis"}})
+        hooks = Hooks()
+        events = record(hooks)
+        client = self.make_client(hooks, retry=RetryPolicy(jitter=False))
+
+        client.get_item(collection="sports", id=1)
+
+        assert [name for name, _ in events] == [
+            "before_request",
+            "on_retry",
+            "before_request",
+            "after_response",
+        ]
+        retried, response = events[1][1], events[3][1]
+        assert (retried.status, retried.attempt, retried.retry_delay) == (503, 1, 0.1)
+        assert (response.method, response.path, response.url) == (
+            "GET",
+            "items/{collection}/{id}",
+            URL,
+        )
+        assert (response.status, response.attempt) == (200, 2)
+        assert response.bytes_received == len(b'{"data": {"id": 1, "name": "tennis"}}')
+        assert set(response.timings) == {"queue", "http", "ttfb", "download", "decode"}
+        assert response.duration >= response.timings["http"]
+
+    @activate_responses
+    def test_errors(self):
+        add(
+            POST,
+            "http://test.local/_/items/sports",
+            status=400,
+            json={"error": {"code": 4, "message": "Invalid payload"}},
+        )
+        add(GET, URL, body=ConnectionError("Connection refused"))
+        hooks = Hooks()
+        events = record(hooks)
+        client = self.make_client(hooks)
+
+        with raises(DirectusException):
+            client.create_item(collection="sports", item={"name": "tennis"})
+        with raises(ConnectionError):
+            client.get_item(collection="sports", id=1)
+
+        assert [name for name, _ in events] == [
+            "before_request",
+            "after_response",
+            "on_error",
+            "before_request",
+            "on_error",
+        ]
+        created, failed = events[2][1], events[4][1]
+        body = client.ApiClient.codec.dumps({"name": "tennis"})
+        assert (created.status, created.bytes_sent) == (400, len(body))
+        assert isinstance(created.error, DirectusException)
+        assert failed.status is None and isinstance(failed.error, ConnectionError)
+
+    @activate_responses
+    def test_token_refresh(self):
+        expiring = encode({"exp": int(time()) + 10}, "secret").decode()
+        refreshed = encode({"exp": int(time()) + 3600}, "secret").decode()
+        add(
+            POST,
+            "http://test.local/_/auth/authenticate",
+            json={"data": {"token": expiring}},
+        )
+        add(
+            POST,
+            "http://test.local/_/auth/refresh",
+            json={"data": {"token": refreshed}},
+        )
+        add(GET, URL, json={"data": {"id": 1}})
+        hooks = Hooks()
+        events = record(hooks)
+        client = self.make_client(hooks, email="email@example.com", password="password")
+
+        client.get_item(collection="sports", id=1)
+
+        refreshes = [payload for name, payload in events if name == "on_token_refresh"]
+        assert len(refreshes) == 1
+        assert refreshes[0].expires_at > time() + 3000
+
+    @activate_responses
+    def test_metrics_collector(self, monkeypatch):
+        monkeypatch.setattr("directus.utils.apiclient.sleep", lambda delay: None)
+        add(GET, URL, status=503)
+        add(GET, URL, json={"data": {"id": 1}})
+        add(GET, "http://test.local/_/items/sports/2", json={"data": {"id": 2}})
+        metrics = MetricsCollector()
+        hooks = Hooks()
+        hooks.add_listener(metrics)
+        client = self.make_client(hooks, retry=RetryPolicy())
+
+        client.get_item(collection="sports", id=1)
+        client.get_item(collection="sports", id=2)
+
+        snapshot = metrics.snapshot()["GET items/{collection}/{id}"]
+        assert (snapshot["requests"], snapshot["errors"], snapshot["retries"]) == (
+            2,
+            0,
+            1,
+        )
+        assert snapshot["statuses"] == {200: 2}
+        assert snapshot["bytes_received"] == 2 * len(b'{"data": {"id": 1}}')
+        assert snapshot["latency_p50"] == 0.005
+        assert set(snapshot["phases"]) >= {"queue", "http", "decode"}
+
+    def test_disabled_hooks_build_no_event(self):
+        client = self.make_client(Hooks())
+
+        assert client.ApiClient._request_event("GET", URL, {}, None, 1) is None
+
+
+class TestAsyncHooks:
+    def test_events(self):
+        def handler(request):
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        hooks = Hooks()
+        events = record(hooks)
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport, hooks=hooks
+            ) as client:
+                await client.get_item(collection="sports", id=1)
+
+        run(scenario())
+
+        assert [name for name, _ in events] == ["before_request", "after_response"]
+        event = events[1][1]
+        assert (event.path, event.status) == ("items/{collection}/{id}", 200)
+        assert set(event.timings) == {"queue", "http", "decode"}
+
+
+class TestOpenTelemetryAdapter:
+    @activate_responses
+    def test_spans_and_metrics(self):
+        importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        from directus.utils import OpenTelemetryAdapter
+
+        exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        reader = InMemoryMetricReader()
+        hooks = Hooks()
+        hooks.add_listener(
+            OpenTelemetryAdapter(
+                tracer_provider=tracer_provider,
+                meter_provider=MeterProvider(metric_readers=[reader]),
+            )
+        )
+        add(GET, URL, json={"data": {"id": 1}})
+        add(
+            GET,
+            "http://test.local/_/items/sports/2",
+            status=404,
+            json={"error": {"code": 203, "message": "Item not found"}},
+        )
+        client = DirectusClient(url="http://test.local", project="_", hooks=hooks)
+
+        client.get_item(collection="sports", id=1)
+        with raises(DirectusException):
+            client.get_item(collection="sports", id=2)
+
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ["GET items/{collection}/{id}"] * 2
+        assert spans[0].attributes["http.response.status_code"] == 200
+        assert spans[0].status.status_code.name == "UNSET"
+        assert spans[1].status.status_code.name == "ERROR"
+        names = [
+            metric.name
+            for resource in reader.get_metrics_data().resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        ]
+        assert "http.client.request.duration" in names
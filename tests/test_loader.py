@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import gather, run, sleep
+from json import dumps
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+from pytest import raises
+from responses import GET, add_callback
+from responses import activate as activate_responses
+
+from directus import AsyncDirectusClient, AsyncTransport, DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils.loader import ItemLoader, id_batches
+
+TEAMS = {id: {"id": id, "name": f"team {id}"} for id in range(1, 6)}
+PLAYERS = [
+    {"id": id, "name": f"player {id}", "team": id % 3 + 1} for id in range(1, 10)
+]
+
+
+def query(url):
+    return {key: values[0] for key, values in parse_qs(urlparse(url).query).items()}
+
+
+def respond(path, params):
+    """
+    The data of the items endpoints, the `in` filter on the teams primary key
+    and the page of the players being honored
+    """
+    if path.endswith("/teams"):
+        ids = params["filter[id][in]"].split(",")
+        return [TEAMS[int(id)] for id in ids if int(id) in TEAMS]
+
+    page, limit = int(params.get("page", 1)), int(params["limit"])
+    return [dict(player) for player in PLAYERS[(page - 1) * limit : page * limit]]
+
+
+class TestIdBatches:
+    def test_batch_size(self):
+        assert list(id_batches(range(5), max_batch_size=2)) == [[0, 1], [2, 3], [4]]
+
+    def test_url_length(self):
+        ids = [f"{index:08d}" for index in range(10)]
+
+        batches = list(id_batches(ids, max_url_length=40))
+
+        assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+        assert sum(batches, []) == ids
+
+
+class TestItemLoader:
+    def test_batch_and_deduplicate(self):
+        calls = []
+
+        def fetch(collection, ids):
+            calls.append((collection, ids))
+            return [TEAMS[id] for id in ids if id in TEAMS]
+
+        with ItemLoader(fetch) as loader:
+            pending = [loader.load("teams", id) for id in (1, 2, 1, 9)]
+
+        assert [item.result() for item in pending] == [
+            TEAMS[1],
+            TEAMS[2],
+            TEAMS[1],
+            None,
+        ]
+        assert loader.load_many("teams", [2, 3]) == [TEAMS[2], TEAMS[3]]
+        assert calls == [("teams", [1, 2, 9]), ("teams", [3])]
+
+    def test_prime(self):
+        loader = ItemLoader(lambda collection, ids: [])
+        loader.prime("teams", TEAMS[4])
+
+        assert loader.load("teams", 4).result() == TEAMS[4]
+
+    def test_failed_batch_is_retried(self):
+        calls = []
+
+        def fetch(collection, ids):
+            calls.append(ids)
+            if len(calls) == 1:
+                raise DirectusException("unavailable")
+            return [TEAMS[id] for id in ids]
+
+        loader = ItemLoader(fetch)
+        pending = loader.load("teams", 1)
+
+        with raises(DirectusException):
+            pending.result()
+        assert pending.result() == TEAMS[1]
+        assert calls == [[1], [1]]
+
+
+class TestPrefetch:
+    def setup_method(self):
+        self.requests = []
+
+    def items(self, request):
+        path = urlparse(request.url).path
+        params = query(request.url)
+        self.requests.append((path, params))
+        return (200, {}, dumps({"data": respond(path, params)}))
+
+    def make_client(self):
+        for collection in ("players", "teams"):
+            add_callback(
+                GET, f"http://test.local/_/items/{collection}", callback=self.items
+            )
+        return DirectusClient(url="http://test.local", project="_")
+
+    @activate_responses
+    def test_get_items_list(self):
+        client = self.make_client()
+
+        players, _ = client.get_items_list(
+            collection="players", limit=5, prefetch={"team": "teams"}
+        )
+
+        assert [player["team"] for player in players] == [
+            TEAMS[2],
+            TEAMS[3],
+            TEAMS[1],
+            TEAMS[2],
+            TEAMS[3],
+        ]
+        assert len(self.requests) == 2
+        path, params = self.requests[1]
+        assert path == "/_/items/teams"
+        assert (params["filter[id][in]"], params["limit"]) == ("2,3,1", "3")
+
+    @activate_responses
+    def test_iter_items(self, monkeypatch):
+        loaders = []
+
+        class RecordedLoader(ItemLoader):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                loaders.append(self)
+
+        monkeypatch.setattr("directus.directus.ItemLoader", RecordedLoader)
+        client = self.make_client()
+
+        players = list(
+            client.iter_items(
+                collection="players",
+                limit=3,
+                read_ahead=False,
+                prefetch={"team": "teams"},
+            )
+        )
+
+        assert [player["team"]["id"] for player in players] == [
+            player["team"] for player in PLAYERS
+        ]
+        # The teams are fetched once per page, and forgotten once it is yielded
+        team_requests = [
+            params for path, params in self.requests if path == "/_/items/teams"
+        ]
+        assert [params["filter[id][in]"] for params in team_requests] == ["2,3,1"] * 3
+        assert loaders[0]._loaded == {}
+
+    @activate_responses
+    def test_loader(self):
+        client = self.make_client()
+        loader = client.loader(fields=["name"])
+
+        assert loader.load_many("teams", [5, 4]) == [TEAMS[5], TEAMS[4]]
+        _, params = self.requests[0]
+        assert (params["fields"], params["sort"]) == ("name,id", "id")
+
+
+class TestAsyncLoader:
+    def test_event_loop_tick_batching(self):
+        requests = []
+
+        def handler(request):
+            params = query(str(request.url))
+            requests.append((request.url.path, params))
+            return httpx.Response(200, json={"data": respond(request.url.path, params)})
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport
+            ) as client:
+                loader = client.loader()
+
+                async def team_name(id):
+                    await sleep(0)
+                    team = await loader.load("teams", id)
+                    return team and team["name"]
+
+                names = await gather(*[team_name(id) for id in (3, 1, 3, 8)])
+                players, _ = await client.get_items_list(
+                    collection="players", limit=4, prefetch={"team": "teams"}
+                )
+                return names, players
+
+        names, players = run(scenario())
+
+        assert names == ["team 3", "team 1", "team 3", None]
+        assert [player["team"] for player in players] == [
+            TEAMS[2],
+            TEAMS[3],
+            TEAMS[1],
+            TEAMS[2],
+        ]
+        assert [params.get("filter[id][in]") for _, params in requests] == [
+            "3,1,8",
+            None,
+            "2,3,1",
+        ]
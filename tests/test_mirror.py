@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from operator import eq, ge, gt
+from threading import Thread
+from urllib.parse import parse_qs, urlparse
+
+from pytest import raises
+from responses import GET, add, add_callback
+from responses import activate as activate_responses
+
+from directus import DirectusClient, SqliteMirror
+from directus.exceptions import DirectusException
+
+SCHEMA = {
+    "id": {"field": "id", "type": "integer", "primary_key": True},
+    "name": {"field": "name", "type": "string"},
+    "active": {"field": "active", "type": "boolean"},
+    "tags": {"field": "tags", "type": "array"},
+    "modified_on": {"field": "modified_on", "type": "datetime_updated"},
+}
+
+OPERATORS = {"eq": eq, "gt": gt, "gte": ge}
+
+
+def sport(id, name=None, modified_on="2020-01-01 10:00:00"):
+    return {
+        "id": id,
+        "name": name or f"sport {id}",
+        "active": id % 2 == 0,
+        "tags": ["team"],
+        "modified_on": modified_on,
+    }
+
+
+class TestSqliteMirror:
+    def setup_method(self):
+        self.rows = {id: sport(id) for id in range(1, 8)}
+        self.requests = []
+        self.on_request = None
+
+    def items(self, request):
+        params = {
+            key: values[0]
+            for key, values in parse_qs(urlparse(request.url).query).items()
+        }
+        self.requests.append(params)
+        if self.on_request is not None:
+            self.on_request(params)
+
+        sort = params["sort"].split(",")
+        rows = sorted(self.rows.values(), key=lambda row: [row[key] for key in sort])
+        for key, value in params.items():
+            if not key.startswith("filter["):
+                continue
+            field, operator = key[len("filter[") : -1].split("][")
+            compare = OPERATORS[operator]
+            rows = [row for row in rows if compare(row[field], type(row[field])(value))]
+        if params["fields"] != "*":
+            rows = [
+                {field: row[field] for field in params["fields"].split(",")}
+                for row in rows
+            ]
+        assert "page" not in params
+        return (200, {}, dumps({"data": rows[: int(params["limit"])]}))
+
+    def make_mirror(self, **kwargs):
+        add_callback(GET, "http://test.local/_/items/sports", callback=self.items)
+        add(
+            GET,
+            "http://test.local/_/collections/sports",
+            json={"data": {"collection": "sports", "fields": SCHEMA}},
+        )
+        client = DirectusClient(url="http://test.local", project="_")
+        return SqliteMirror(client, limit=3, indexes={"sports": ["name"]}, **kwargs)
+
+    @activate_responses
+    def test_full_sync(self):
+        mirror = self.make_mirror()
+
+        result = mirror.sync("sports")
+
+        assert (result.full, result.upserted, result.deleted) == (True, 7, 0)
+        assert mirror.get_item("sports", 2) == sport(2)
+        assert mirror.get_items_list("sports", filter={"name": "sport 5"}) == [sport(5)]
+        assert [
+            item["id"]
+            for item in mirror.get_items_list(
+                "sports", filter={"active": True}, sort=["-id"], limit=2
+            )
+        ] == [6, 4]
+
+    @activate_responses
+    def test_incremental_sync(self):
+        mirror = self.make_mirror()
+        mirror.sync("sports")
+        self.requests.clear()
+
+        self.rows[3] = sport(3, name="padel", modified_on="2020-01-02 10:00:00")
+        self.rows[8] = sport(8, modified_on="2020-01-02 11:00:00")
+        del self.rows[5]
+        result = mirror.sync("sports")
+
+        assert (result.full, result.upserted, result.deleted) == (False, 7, 1)
+        assert mirror.get_item("sports", 3)["name"] == "padel"
+        assert mirror.get_item("sports", 5) is None
+        assert mirror.get_item("sports", 8) == self.rows[8]
+        assert self.requests[0]["filter[modified_on][gte]"] == "2020-01-01 10:00:00"
+
+        self.requests.clear()
+        result = mirror.sync("sports")
+
+        assert result.upserted == 1
+        assert self.requests[0]["filter[modified_on][gte]"] == "2020-01-02 11:00:00"
+        assert {params["fields"] for params in self.requests[1:]} == {"id"}
+
+    @activate_responses
+    def test_rows_deleted_during_a_scan_shift_no_page(self):
+        mirror = self.make_mirror()
+
+        def delete_first_row(params):
+            self.rows.pop(1, None)
+
+        self.on_request = delete_first_row
+        result = mirror.sync("sports")
+
+        assert result.upserted == 6
+        assert [item["id"] for item in mirror.get_items_list("sports")] == [
+            2,
+            3,
+            4,
+            5,
+            6,
+            7,
+        ]
+        # The second page starts after the last row of the first one
+        assert self.requests[1]["filter[id][gt]"] == "4"
+
+    @activate_responses
+    def test_local_reads_during_a_sync(self):
+        mirror = self.make_mirror()
+        mirror.sync("sports")
+        reads = []
+
+        def read_locally(params):
+            reader = Thread(target=lambda: reads.append(mirror.get_item("sports", 7)))
+            reader.start()
+            reader.join(timeout=2)
+
+        self.requests.clear()
+        self.on_request = read_locally
+        mirror.sync("sports", full=True)
+
+        # Each fetch of the sync saw the local read complete
+        assert len(reads) == len(self.requests) == 3
+        assert all(read == sport(7) for read in reads)
+
+    @activate_responses
+    def test_persistent_mirror(self, tmp_path):
+        with self.make_mirror(path=tmp_path / "mirror.db") as mirror:
+            mirror.sync("sports")
+
+        client = DirectusClient(url="http://test.local", project="_")
+        with SqliteMirror(client, path=tmp_path / "mirror.db") as mirror:
+            assert mirror.get_item("sports", 1) == sport(1)
+            assert mirror.sync("sports").full is False
+
+    def test_read_before_sync(self):
+        client = DirectusClient(url="http://test.local", project="_")
+
+        with raises(DirectusException):
+            SqliteMirror(client).get_items_list("sports")
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run, sleep as async_sleep
+from json import dumps
+from threading import Lock
+from time import sleep
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+from pytest import raises
+from responses import GET, add_callback
+from responses import activate as activate_responses
+
+from directus import AsyncDirectusClient, AsyncTransport, DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils.pagination import iter_pages_parallel, keyset_filters
+from directus.utils.params import filter_params
+
+ITEMS = [{"id": id} for id in range(1, 26)]
+
+
+def page_of(params):
+    page = int(params["page"])
+    limit = int(params["limit"])
+    data = ITEMS[(page - 1) * limit : page * limit]
+    page_count = (len(ITEMS) + limit - 1) // limit
+    return {"data": data, "meta": {"page": page, "page_count": page_count}}
+
+
+class TestIterItems:
+    def setup_method(self):
+        self.pages = []
+
+    def callback(self, request):
+        params = {
+            key: values[0]
+            for key, values in parse_qs(urlparse(request.url).query).items()
+        }
+        self.pages.append(int(params["page"]))
+        return (200, {}, dumps(page_of(params)))
+
+    @activate_responses
+    def test_iter_items(self):
+        add_callback(GET, "http://test.local/_/items/sports", callback=self.callback)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        items = client.iter_items(collection="sports", limit=10)
+
+        assert next(items) == {"id": 1}
+        assert list(items) == ITEMS[1:]
+        assert self.pages == [1, 2, 3]
+
+    @activate_responses
+    def test_iter_items_pages_without_read_ahead(self):
+        add_callback(GET, "http://test.local/_/items/sports", callback=self.callback)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        pages = client.iter_items(
+            collection="sports", limit=10, pages=True, read_ahead=False
+        )
+
+        assert next(pages) == ITEMS[:10]
+        assert self.pages == [1]
+        assert [len(page) for page in pages] == [10, 5]
+
+    @activate_responses
+    def test_get_all_items_list(self):
+        add_callback(GET, "http://test.local/_/items/sports", callback=self.callback)
+        client = DirectusClient(url="http://test.local", project="_")
+        meta = []
+
+        items, response_meta = client.get_all_items_list(collection="sports", meta=meta)
+
+        assert items == ITEMS
+        assert response_meta == {"page": 1, "page_count": 1}
+        assert meta == []
+
+    def test_async_iter_items(self):
+        def handler(request):
+            params = dict(request.url.params)
+            return httpx.Response(200, json=page_of(params))
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport
+            ) as client:
+                return [item async for item in client.iter_items("sports", limit=10)]
+
+        assert run(scenario()) == ITEMS
+
+
+class TestParallelPages:
+    def setup_method(self):
+        self.lock = Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fetch(self, page):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later pages answer faster, to check the output order
+        sleep(0.001 * (20 - page))
+        with self.lock:
+            self.in_flight -= 1
+        data = page_of({"page": page, "limit": 2})
+        return data["data"], data["meta"]
+
+    def test_ordered_pages(self):
+        pages = list(iter_pages_parallel(self.fetch, limit=2, max_in_flight=3))
+
+        assert [item for data, _ in pages for item in data] == ITEMS
+        assert self.max_in_flight == 3
+
+    def test_unordered_pages(self):
+        pages = list(
+            iter_pages_parallel(self.fetch, limit=2, max_in_flight=4, ordered=False)
+        )
+
+        items = [item for data, _ in pages for item in data]
+        assert sorted(items, key=lambda item: item["id"]) == ITEMS
+        assert items != ITEMS
+
+    @activate_responses
+    def test_get_all_items_list_in_parallel(self):
+        def callback(request):
+            params = {
+                key: values[0]
+                for key, values in parse_qs(urlparse(request.url).query).items()
+            }
+            return (200, {}, dumps(page_of({**params, "limit": 3})))
+
+        add_callback(GET, "http://test.local/_/items/sports", callback=callback)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        items, _ = client.get_all_items_list(collection="sports", max_in_flight=4)
+
+        assert items == ITEMS
+
+    def test_async_parallel_iter_items(self):
+        async def handler(request):
+            params = dict(request.url.params)
+            await async_sleep(0.001 * (20 - int(params["page"])))
+            return httpx.Response(200, json=page_of(params))
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport
+            ) as client:
+                return [
+                    item
+                    async for item in client.iter_items(
+                        "sports", limit=4, max_in_flight=3
+                    )
+                ]
+
+        assert run(scenario()) == ITEMS
+
+
+class TestKeysetPagination:
+    def test_filter_params(self):
+        assert filter_params(
+            {"status": "published", "id": {"gt": 3, "in": [4, 5]}}
+        ) == {
+            "filter[status][eq]": "published",
+            "filter[id][gt]": 3,
+            "filter[id][in]": "4,5",
+        }
+
+    def test_keyset_filters(self):
+        assert keyset_filters(["id"], {"id": 10}) == [{"id": {"gt": 10}}]
+        assert keyset_filters(
+            ["year", "-score", "id"], {"year": 2020, "score": 3, "id": 7}
+        ) == [
+            {"year": {"eq": 2020}, "score": {"eq": 3}, "id": {"gt": 7}},
+            {"year": {"eq": 2020}, "score": {"lt": 3}},
+            {"year": {"gt": 2020}},
+        ]
+
+    def test_keyset_filters_require_sort_fields(self):
+        with raises(DirectusException):
+            keyset_filters(["year", "id"], {"id": 7})
+
+    @activate_responses
+    def test_iter_items_with_keyset(self):
+        rows = [{"id": id, "year": 2000 + id % 3} for id in range(1, 26)]
+        requests = []
+
+        def callback(request):
+            params = {
+                key: values[0]
+                for key, values in parse_qs(urlparse(request.url).query).items()
+            }
+            requests.append(params)
+            assert "offset" not in params or params["offset"] == "0"
+
+            def matches(row):
+                for key, value in params.items():
+                    if not key.startswith("filter["):
+                        continue
+                    field, operator = key[len("filter[") : -1].split("][")
+                    if operator == "eq" and not row[field] == int(value):
+                        return False
+                    if operator == "gt" and not row[field] > int(value):
+                        return False
+                return True
+
+            data = sorted(
+                filter(matches, rows), key=lambda row: (row["year"], row["id"])
+            )
+            return (200, {}, dumps({"data": data[: int(params["limit"])]}))
+
+        add_callback(GET, "http://test.local/_/items/sports", callback=callback)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        items = list(
+            client.iter_items(
+                collection="sports", sort=["year", "id"], limit=4, keyset=True
+            )
+        )
+
+        assert items == sorted(rows, key=lambda row: (row["year"], row["id"]))
+        # Rows of year 2000 are 3, 6, 9, 12..., the second page starts after id 12
+        assert "offset" not in requests[1]
+        assert requests[1]["filter[year][eq]"] == "2000"
+        assert requests[1]["filter[id][gt]"] == "12"
+
+    def test_keyset_with_or_filter(self):
+        client = DirectusClient(url="http://test.local", project="_")
+        filter = {"or": [{"year": 2000}, {"name": {"like": "ball"}}]}
+
+        # Keyset conditions would only apply to the last branch of the or group
+        with raises(DirectusException):
+            next(client.iter_items(collection="sports", filter=filter, keyset=True))
+        with raises(DirectusException):
+            client.get_items_list(collection="sports", filter=filter, after={"id": 1})
+        with raises(DirectusException):
+            next(
+                client.iter_item_revisions(
+                    collection="sports", id=1, filter=filter, keyset=True
+                )
+            )
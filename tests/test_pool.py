@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run
+from json import dumps, loads
+from time import time
+
+import httpx
+from jwt import decode, encode
+from pytest import raises
+from responses import GET, POST, add_callback, calls
+from responses import activate as activate_responses
+
+from directus import (
+    AsyncDirectusClientPool,
+    AsyncTransport,
+    DirectusClientPool,
+    Transport,
+)
+from directus.exceptions import DirectusException
+from directus.utils import ReadCache
+
+
+def make_token(project, email):
+    return encode(
+        {"exp": int(time()) + 3600, "project": project, "email": email}, "secret"
+    ).decode()
+
+
+def authenticate(request):
+    project = request.url.split("/")[3]
+    email = loads(request.body)["email"]
+
+    return (200, {}, dumps({"data": {"token": make_token(project, email)}}))
+
+
+def get_item(request):
+    project = request.url.split("/")[3]
+    token = request.headers["authorization"][len("Bearer ") :]
+    assert decode(token, verify=False)["project"] == project
+
+    return (200, {}, dumps({"data": {"id": 1, "project": project}}))
+
+
+class TestDirectusClientPool:
+    def make_pool(self, **kwargs):
+        return DirectusClientPool(
+            url="http://test.local",
+            email="admin@example.com",
+            password="password",
+            **kwargs,
+        )
+
+    def add_callbacks(self):
+        for project in ("a", "b", "c"):
+            add_callback(
+                POST,
+                f"http://test.local/{project}/auth/authenticate",
+                callback=authenticate,
+            )
+            add_callback(
+                GET, f"http://test.local/{project}/items/sports/1", callback=get_item
+            )
+
+    def test_pool_options(self):
+        with raises(DirectusException):
+            DirectusClientPool(project="_")
+        with raises(DirectusException):
+            self.make_pool(max_projects=0)
+        with self.make_pool() as pool:
+            with raises(DirectusException):
+                pool.client("")
+
+    @activate_responses
+    def test_lazy_authentication_per_project(self):
+        self.add_callbacks()
+        with self.make_pool() as pool:
+            client_a = pool.client("a")
+            assert len(calls) == 0
+
+            item, _ = client_a.get_item(collection="sports", id=1)
+            assert item["project"] == "a"
+            item, _ = pool.client("b").get_item(collection="sports", id=1)
+            assert item["project"] == "b"
+            for _ in range(3):
+                assert pool.client("a") is client_a
+                client_a.get_item(collection="sports", id=1)
+
+            authentications = [
+                call.request.url for call in calls if "auth" in call.request.url
+            ]
+            assert authentications == [
+                "http://test.local/a/auth/authenticate",
+                "http://test.local/b/auth/authenticate",
+            ]
+            assert pool.client("a").ApiClient.transport is pool.transport
+            assert pool.client("b").ApiClient.transport is pool.transport
+
+    @activate_responses
+    def test_identities(self):
+        self.add_callbacks()
+        with self.make_pool() as pool:
+            admin = pool.client("a")
+            editor = pool.client("a", email="editor@example.com", password="secret")
+            assert editor is not admin
+            assert pool.client("a", "editor@example.com", "secret") is editor
+            assert pool.client("a", "editor@example.com", "changed") is not editor
+
+            editor.get_item(collection="sports", id=1)
+            assert loads(calls[0].request.body) == {
+                "email": "editor@example.com",
+                "password": "secret",
+            }
+            assert editor.ApiClient.baseHeader["authorization"] == (
+                f"Bearer {make_token('a', 'editor@example.com')}"
+            )
+
+    @activate_responses
+    def test_shared_cache(self):
+        self.add_callbacks()
+        cache = ReadCache()
+        with self.make_pool(cache=cache) as pool:
+            for _ in range(2):
+                for project in ("a", "b"):
+                    item, _ = pool.client(project).get_item(collection="sports", id=1)
+                    assert item["project"] == project
+
+        assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+    @activate_responses
+    def test_lru_eviction(self):
+        self.add_callbacks()
+        pool = self.make_pool(max_projects=2)
+        client_a = pool.client("a")
+        pool.client("b")
+        assert pool.client("a") is client_a
+        pool.client("c")
+
+        assert len(pool) == 2
+        assert pool.client("a") is client_a
+        client_b = pool.client("b")
+        assert len(pool) == 2
+        pool.evict("b")
+        assert pool.client("b") is not client_b
+
+        pool.close()
+        assert pool.transport.closed
+        assert len(pool) == 0
+
+    def test_shared_transport_left_open(self):
+        transport = Transport()
+        with DirectusClientPool(url="http://test.local", transport=transport) as pool:
+            pool.client("a")
+        assert not transport.closed
+        transport.close()
+
+
+class TestAsyncDirectusClientPool:
+    def test_lazy_authentication_per_project(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            project = request.url.path.split("/")[1]
+            if request.url.path.endswith("/auth/authenticate"):
+                return httpx.Response(
+                    200, json={"data": {"token": make_token(project, "admin")}}
+                )
+
+            return httpx.Response(200, json={"data": {"id": 1, "project": project}})
+
+        async def main():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClientPool(
+                url="http://test.local",
+                email="admin@example.com",
+                password="password",
+                transport=transport,
+                max_projects=1,
+            ) as pool:
+                for project in ("a", "a", "b", "a"):
+                    item, _ = await pool.client(project).get_item(
+                        collection="sports", id=1
+                    )
+                    assert item["project"] == project
+                assert len(pool) == 1
+            assert not transport.closed
+            await transport.close()
+
+        run(main())
+        assert requests == [
+            "/a/auth/authenticate",
+            "/a/items/sports/1",
+            "/a/items/sports/1",
+            "/b/auth/authenticate",
+            "/b/items/sports/1",
+            "/a/auth/authenticate",
+            "/a/items/sports/1",
+        ]
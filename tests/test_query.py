@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from json import dumps
+from urllib.parse import parse_qs, urlparse
+
+from pytest import raises
+from responses import GET, add_callback
+from responses import activate as activate_responses
+
+from directus import DirectusClient, Query
+from directus.exceptions import DirectusException
+from directus.utils.params import filter_params
+from directus.utils.query import compile_query
+
+ITEMS = [{"id": id, "year": 2000 + id % 2} for id in range(1, 6)]
+
+
+class TestQuery:
+    def test_params(self):
+        query = (
+            Query()
+            .select("id", "title", author=["name", {"company": ["name"]}], tags="*")
+            .where(status="published", score={"gt": 3, "lte": 9})
+            .where(published_on={"gte": datetime(2020, 1, 2, 10, 30)})
+            .or_where(featured=True, category={"in": [1, 2]})
+            .or_where(deleted_on=None)
+            .order_by("-published_on", "id")
+            .with_status("published", "draft")
+            .search("tennis")
+        )
+
+        assert list(query.params().items()) == [
+            ("fields", "id,title,author.name,author.company.name,tags.*"),
+            ("sort", "-published_on,id"),
+            ("status", "published,draft"),
+            ("q", "tennis"),
+            ("filter[status][eq]", "published"),
+            ("filter[score][gt]", 3),
+            ("filter[score][lte]", 9),
+            ("filter[published_on][gte]", "2020-01-02 10:30:00"),
+            ("filter[featured][logical]", "or"),
+            ("filter[featured][eq]", 1),
+            ("filter[category][in]", "1,2"),
+            ("filter[deleted_on][logical]", "or"),
+            ("filter[deleted_on][null]", ""),
+        ]
+
+    def test_branch_led_by_a_single_condition(self):
+        query = Query().where(a=1).or_where(b={"gt": 1, "lt": 5}, c=2)
+
+        assert list(query.params())[-4:] == [
+            "filter[c][logical]",
+            "filter[c][eq]",
+            "filter[b][gt]",
+            "filter[b][lt]",
+        ]
+
+    def test_compiled_once(self):
+        compile_query.cache_clear()
+        query = Query().where(status="published")
+
+        query.params()
+        Query().where(status="published").params()
+
+        assert compile_query.cache_info().hits == 1
+        # Each call gets its own dict
+        assert query.params() is not query.params()
+
+    def test_unsupported_filters(self):
+        with raises(DirectusException):
+            Query().where(status={"equals": "published"})
+        with raises(DirectusException):
+            Query().where(status="draft").or_where(status="published").params()
+        with raises(DirectusException):
+            Query().where(a=1).or_where(b={"gt": 1, "lt": 5}).params()
+        with raises(DirectusException):
+            filter_params({"a": 1, "or": [{"b": 1}, {"c": 1}]})
+
+    def test_filter_params_or_group(self):
+        assert filter_params({"or": [{"a": 1}, {"b": True}]}) == {
+            "filter[a][eq]": 1,
+            "filter[b][logical]": "or",
+            "filter[b][eq]": 1,
+        }
+
+
+class TestClientQuery:
+    def setup_method(self):
+        self.requests = []
+
+        def items(request):
+            params = {
+                key: values[0]
+                for key, values in parse_qs(urlparse(request.url).query).items()
+            }
+            self.requests.append(params)
+            page, limit = int(params.get("page", 1)), int(params["limit"])
+            data = ITEMS[(page - 1) * limit : page * limit]
+            return (200, {}, dumps({"data": data}))
+
+        add_callback(GET, "http://test.local/_/items/sports", callback=items)
+
+    @activate_responses
+    def test_query_reused_across_pages(self):
+        client = DirectusClient(url="http://test.local", project="_")
+        query = Query().select("id", "year").where(year={"gte": 2000})
+
+        items = list(
+            client.iter_items(
+                collection="sports", limit=2, query=query, filter={"ignored": 1}
+            )
+        )
+
+        assert items == ITEMS
+        assert [params["page"] for params in self.requests] == ["1", "2", "3"]
+        for params in self.requests:
+            assert params["fields"] == "id,year"
+            assert params["filter[year][gte]"] == "2000"
+            assert "filter[ignored][eq]" not in params
+
+    @activate_responses
+    def test_keyset_uses_query_sort(self):
+        client = DirectusClient(url="http://test.local", project="_")
+        query = Query().order_by("year", "id")
+
+        client.get_items_list(
+            collection="sports", query=query, after={"year": 2000, "id": 4}
+        )
+
+        assert self.requests[0]["filter[year][eq]"] == "2000"
+        assert self.requests[0]["filter[id][gt]"] == "4"
+        assert self.requests[0]["sort"] == "year,id"
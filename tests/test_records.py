@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run
+from json import dumps, loads
+from pickle import dumps as pickle_dumps
+from pickle import loads as pickle_loads
+from sys import getsizeof
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+from pytest import raises
+from responses import GET, PATCH, add, add_callback, calls
+from responses import activate as activate_responses
+
+from directus import AsyncDirectusClient, AsyncTransport, DirectusClient
+from directus.utils import Record, record_class
+
+FIELDS = ["id", "name", "items", "1st", "class", "owner"]
+ITEMS = [{"id": id, "name": f"sport {id}", "owner": 1} for id in range(1, 6)]
+COLLECTION = {
+    "data": {
+        "collection": "sports",
+        "fields": {field: {"field": field} for field in ["id", "name", "owner"]},
+    }
+}
+
+
+class TestRecord:
+    def test_access(self):
+        Sport = record_class("sports", FIELDS)
+        sport = Sport(
+            {"id": 1, "name": "tennis", "items": 2, "1st": 3, "class": 4, "extra": 5}
+        )
+
+        assert Sport.__name__ == "SportsRecord"
+        assert isinstance(sport, Record)
+        assert (sport.id, sport.name, sport["name"]) == (1, "tennis", "tennis")
+        # Fields clashing with the mapping methods or keywords are mapping keys only
+        assert (sport["items"], sport["1st"], sport["class"]) == (2, 3, 4)
+        assert callable(sport.items)
+        assert sport["extra"] == 5
+        assert "owner" not in sport and sport.get("owner") is None
+        with raises(KeyError):
+            sport["owner"]
+        assert list(sport) == ["id", "name", "items", "1st", "class", "extra"]
+
+        sport["owner"] = {"id": 1}
+        sport.name = "padel"
+        assert sport.owner == {"id": 1}
+        assert sport == {
+            "id": 1,
+            "name": "padel",
+            "items": 2,
+            "1st": 3,
+            "class": 4,
+            "owner": {"id": 1},
+            "extra": 5,
+        }
+        assert loads(dumps(sport.to_dict()))["name"] == "padel"
+
+    def test_classes_are_cached_and_picklable(self):
+        Sport = record_class("sports", FIELDS)
+        sport = Sport({"id": 1, "name": "tennis"})
+
+        assert record_class("sports", list(FIELDS)) is Sport
+        assert record_class("sports", FIELDS[:2]) is not Sport
+        copy = pickle_loads(pickle_dumps(sport))
+        assert type(copy) is Sport and copy == sport
+
+    def test_smaller_than_dicts(self):
+        fields = [f"field_{index}" for index in range(10)]
+        item = loads(dumps({field: None for field in fields}))
+
+        assert getsizeof(record_class("wide", fields)(item)) * 2 < getsizeof(item)
+
+
+class TestRecords:
+    @activate_responses
+    def test_items_as_records(self):
+        def items(request):
+            params = parse_qs(urlparse(request.url).query)
+            page, limit = int(params["page"][0]), int(params["limit"][0])
+            data = ITEMS[(page - 1) * limit : page * limit]
+            return (200, {}, dumps({"data": data, "meta": {"page_count": 3}}))
+
+        add_callback(GET, "http://test.local/_/items/sports", callback=items)
+        add(GET, "http://test.local/_/items/sports/1", json={"data": ITEMS[0]})
+        add(GET, "http://test.local/_/collections/sports", json=COLLECTION)
+        add(PATCH, "http://test.local/_/collections/sports", json=COLLECTION)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        sports = list(client.iter_items(collection="sports", limit=2, records=True))
+        sport, _ = client.get_item(collection="sports", id=1, records=True)
+
+        assert sports == ITEMS
+        assert [type(sport).__name__ for sport in sports] == ["SportsRecord"] * 5
+        assert sport.name == "sport 1" and type(sport) is type(sports[0])
+        schema_requests = [call for call in calls if "collections" in call.request.url]
+        assert len(schema_requests) == 1
+
+        client.update_collection(collection="sports", data={"note": "updated"})
+        client.get_item(collection="sports", id=1, records=True)
+
+        schema_requests = [call for call in calls if "collections" in call.request.url]
+        assert len(schema_requests) == 3
+
+    def test_async_items_as_records(self):
+        def handler(request):
+            if request.url.path == "/_/collections/sports":
+                return httpx.Response(200, json=COLLECTION)
+            return httpx.Response(200, json={"data": ITEMS})
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport
+            ) as client:
+                sports, _ = await client.get_items_list(
+                    collection="sports", records=True
+                )
+                return sports
+
+        sports = run(scenario())
+
+        assert sports == ITEMS
+        assert all(isinstance(sport, Record) for sport in sports)
+        assert sports[0].owner == 1
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run
+from email.utils import formatdate
+from time import time
+
+import httpx
+from pytest import approx, fixture, raises
+from requests import ConnectionError
+from responses import GET, POST, add, calls
+from responses import activate as activate_responses
+
+from directus import (
+    AsyncDirectusClient,
+    AsyncTransport,
+    CircuitBreaker,
+    DirectusClient,
+    RetryPolicy,
+)
+from directus.utils import CircuitOpen
+from directus.utils.retry import parse_retry_after
+
+URL = "http://test.local/_/items/sports/1"
+
+
+@fixture
+def delays(monkeypatch):
+    delays = []
+    monkeypatch.setattr("directus.utils.apiclient.sleep", delays.append)
+    return delays
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(backoff=0.1, max_backoff=0.3, jitter=False)
+
+        assert [policy.delay(attempt) for attempt in (1, 2, 3)] == approx(
+            [0.1, 0.2, 0.3]
+        )
+
+    def test_full_jitter(self):
+        policy = RetryPolicy(backoff=1)
+
+        assert all(0 <= policy.delay(3) <= 4 for _ in range(20))
+
+    def test_retry_after(self):
+        policy = RetryPolicy(max_retry_after=10)
+
+        assert policy.delay(1, "3") == 3
+        assert policy.delay(1, "120") == 10
+        assert parse_retry_after(formatdate(time() + 30, usegmt=True)) == approx(
+            30, abs=2
+        )
+        assert parse_retry_after("soon") is None
+
+    def test_idempotency(self):
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.allows("GET", 1, None)
+        assert not policy.allows("GET", 2, None)
+        assert not policy.allows("POST", 1, None)
+        assert policy.allows("POST", 1, True)
+
+
+class TestRetry:
+    def make_client(self, **kwargs):
+        return DirectusClient(
+            url="http://test.local",
+            project="_",
+            retry=RetryPolicy(jitter=False, **kwargs),
+        )
+
+    @activate_responses
+    def test_retry_transient_status(self, delays):
+        add(GET, URL, status=503, headers={"retry-after": "2"})
+        add(GET, URL, status=502)
+        add(GET, URL, json={"data": {"id": 1}})
+
+        item, _ = self.make_client().get_item(collection="sports", id=1)
+
+        assert item == {"id": 1}
+        assert len(calls) == 3
+        assert delays == approx([2, 0.2])
+
+    @activate_responses
+    def test_retry_connection_error(self, delays):
+        add(GET, URL, body=ConnectionError("Connection reset by peer"))
+
+        with raises(ConnectionError):
+            self.make_client(max_attempts=3).get_item(collection="sports", id=1)
+        assert len(calls) == 3
+
+    @activate_responses
+    def test_post_is_not_retried(self, delays):
+        add(POST, "http://test.local/_/items/sports", status=503)
+
+        self.make_client().create_item(collection="sports", item={"name": "tennis"})
+
+        assert len(calls) == 1
+
+    @activate_responses
+    def test_idempotent_post_is_retried(self, delays):
+        add(POST, "http://test.local/_/items/sports", status=503)
+        add(POST, "http://test.local/_/items/sports", json={"data": {"id": 1}})
+
+        client = self.make_client()
+        item, _ = client.ApiClient.do_post(
+            "items/sports", data={"id": 1}, idempotent=True
+        )
+
+        assert item == {"id": 1}
+        assert len(calls) == 2
+
+
+class TestCircuitBreaker:
+    @activate_responses
+    def test_open_then_recover(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("directus.utils.retry.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=10)
+        client = DirectusClient(
+            url="http://test.local", project="_", circuit_breaker=breaker
+        )
+        add(GET, URL, status=500)
+
+        for _ in range(2):
+            client.get_item(collection="sports", id=1)
+
+        assert breaker.state(URL) == "open"
+        with raises(CircuitOpen):
+            client.get_item(collection="sports", id=1)
+        assert len(calls) == 2
+
+        # After the recovery time a single failing probe opens the circuit again
+        now[0] += 10
+        client.get_item(collection="sports", id=1)
+        assert breaker.state(URL) == "open"
+        with raises(CircuitOpen):
+            client.get_item(collection="sports", id=1)
+
+        now[0] += 10
+        add(GET, URL, json={"data": {"id": 1}})
+        assert client.get_item(collection="sports", id=1)[0] == {"id": 1}
+        assert breaker.state(URL) == "closed"
+
+    def test_half_open_lets_a_single_probe_through(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("directus.utils.retry.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=5)
+        breaker.record_failure(URL)
+
+        now[0] = 5
+        breaker.before_request(URL)
+        assert breaker.state(URL) == "half-open"
+        with raises(CircuitOpen):
+            breaker.before_request(URL)
+        # Other hosts are not affected
+        breaker.before_request("http://other.local/_/items/sports")
+
+
+class TestAsyncRetry:
+    def test_retry_connection_error(self, monkeypatch):
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr("directus.utils.asyncapiclient.sleep", sleep)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) == 1:
+                raise httpx.ConnectError("Connection refused", request=request)
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local",
+                project="_",
+                transport=transport,
+                retry=RetryPolicy(backoff=0.5, jitter=False),
+            ) as client:
+                return await client.get_item(collection="sports", id=1)
+
+        item, _ = run(scenario())
+
+        assert item == {"id": 1}
+        assert len(requests) == 2
+        assert delays == [0.5]
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import CancelledError, create_task, gather, run, sleep
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep as thread_sleep
+
+from pytest import approx, raises
+from responses import GET, add_callback
+from responses import activate as activate_responses
+
+from directus import DirectusClient, Throttle
+from directus.utils import ConcurrencyGovernor, TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("directus.utils.throttle.monotonic", lambda: now[0])
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert [bucket.reserve() for _ in range(4)] == approx([0, 0, 0.1, 0.2])
+
+        # Tokens are added back at the rate, without exceeding the burst
+        now[0] = 10
+        assert [bucket.reserve() for _ in range(3)] == approx([0, 0, 0.1])
+
+
+class TestConcurrencyGovernor:
+    def test_adaptive_limit(self):
+        governor = ConcurrencyGovernor(max_in_flight=8, adaptive=True)
+
+        def complete(status, count=1, latency=0.01):
+            for _ in range(count):
+                governor.acquire()
+                governor.release(latency, status)
+
+        # Errors of the same round only shrink the limit once
+        complete(503, count=3)
+        assert governor.limit == 4
+        complete(429)
+        assert governor.limit == 4
+        complete(429)
+        assert governor.limit == 2
+        complete(None)
+        assert governor.limit == 2
+        complete(None)
+        assert governor.limit == 1
+        complete(200, count=1)
+        assert governor.limit == 2
+        complete(200, count=2)
+        assert governor.limit == 3
+
+    def test_overload_before_the_end_of_a_round(self):
+        governor = ConcurrencyGovernor(max_in_flight=8, adaptive=True)
+
+        def complete(*statuses):
+            for status in statuses:
+                governor.acquire()
+                governor.release(0.01, status)
+
+        # The round ends with a success, but holds an overload: no growth
+        complete(503, 200, 200, 200)
+        assert governor.limit == 4
+        complete(200, 200, 503, 200)
+        assert governor.limit == 2
+        complete(200, 200)
+        assert governor.limit == 3
+
+        # Mostly overloaded traffic keeps the limit down
+        limits = []
+        for _ in range(4):
+            complete(503, 503, 503, 200)
+            limits.append(governor.limit)
+        assert max(limits) <= 2
+
+    def test_latency_target(self):
+        governor = ConcurrencyGovernor(
+            max_in_flight=4, adaptive=True, latency_target=0.5
+        )
+
+        governor.acquire()
+        governor.release(latency=2, status=200)
+
+        assert governor.limit == 2
+
+    def test_async_tasks(self):
+        governor = ConcurrencyGovernor(max_in_flight=2)
+        peak = []
+
+        async def request():
+            await governor.acquire_async()
+            peak.append(governor.in_flight)
+            await sleep(0.01)
+            governor.release(0.01, 200)
+
+        async def scenario():
+            await gather(*[request() for _ in range(6)])
+
+            # A task cancelled while waiting for a slot does not keep it
+            await governor.acquire_async()
+            await governor.acquire_async()
+            waiting = create_task(Throttle(max_in_flight=1).acquire_async())
+            blocked = create_task(governor.acquire_async())
+            await sleep(0)
+            blocked.cancel()
+            with raises(CancelledError):
+                await blocked
+            await waiting
+
+        run(scenario())
+
+        assert len(peak) == 6 and max(peak) == 2
+        assert governor.in_flight == 2
+
+
+class TestThrottle:
+    def setup_method(self):
+        self.lock = Lock()
+        self.in_flight = {"items": 0, "files": 0}
+        self.peak = {"items": 0, "files": 0, "all": 0}
+
+    def respond(self, request):
+        group = request.url.split("/")[4]
+        with self.lock:
+            self.in_flight[group] += 1
+            self.peak[group] = max(self.peak[group], self.in_flight[group])
+            self.peak["all"] = max(self.peak["all"], sum(self.in_flight.values()))
+        thread_sleep(0.02)
+        with self.lock:
+            self.in_flight[group] -= 1
+        return (200, {}, '{"data": {"id": 1}}')
+
+    @activate_responses
+    def test_client_and_group_limits(self):
+        for path in ("items/sports/1", "files/1"):
+            add_callback(GET, f"http://test.local/_/{path}", callback=self.respond)
+        throttle = Throttle(
+            max_in_flight=3, groups={"files": Throttle(max_in_flight=1)}
+        )
+        client = DirectusClient(url="http://test.local", project="_", throttle=throttle)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(client.get_item, collection="sports", id=1)
+                for _ in range(8)
+            ] + [executor.submit(client.get_file, id=1) for _ in range(4)]
+            for future in futures:
+                future.result()
+
+        assert self.peak["files"] == 1
+        assert self.peak["all"] <= 3
+        assert throttle.governor.in_flight == 0
+        assert throttle.groups["files"].governor.in_flight == 0
+
+    def test_endpoint_group(self):
+        client = DirectusClient(url="http://test.local", project="_")
+
+        assert (
+            client.ApiClient._endpoint_group("http://test.local/_/files/1") == "files"
+        )
+        assert client.ApiClient._endpoint_group("http://cdn.local/file.png") is None
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from threading import Lock
+from time import sleep, time
+
+from jwt import encode
+from responses import GET, POST, add_callback
+from responses import activate as activate_responses
+
+import directus.utils.apiclient
+from directus.directus import DirectusClient
+
+
+def make_token(expires_in, key="initial"):
+    return encode({"exp": int(time()) + expires_in, "key": key}, "secret").decode()
+
+
+class TestToken:
+    def setup_method(self):
+        self.lock = Lock()
+        self.refreshes = 0
+        self.token = make_token(30)
+        self.refreshed_token = make_token(3600, key="refreshed")
+
+    def authenticate(self, request):
+        return (200, {}, dumps({"data": {"token": self.token}}))
+
+    def refresh(self, request):
+        assert loads(request.body) == {"token": self.token}
+        with self.lock:
+            self.refreshes += 1
+        sleep(0.05)
+        return (200, {}, dumps({"data": {"token": self.refreshed_token}}))
+
+    def get_item(self, request):
+        assert request.headers["authorization"] == f"Bearer {self.refreshed_token}"
+        return (200, {}, dumps({"data": {"id": 1}}))
+
+    def add_callbacks(self):
+        add_callback(
+            POST, "http://test.local/_/auth/authenticate", callback=self.authenticate
+        )
+        add_callback(POST, "http://test.local/_/auth/refresh", callback=self.refresh)
+        add_callback(GET, "http://test.local/_/items/sports/1", callback=self.get_item)
+
+    def make_client(self, **kwargs):
+        return DirectusClient(
+            url="http://test.local",
+            project="_",
+            email="email@example.com",
+            password="password",
+            **kwargs,
+        )
+
+    @activate_responses
+    def test_expiry_decoded_once(self, monkeypatch):
+        self.add_callbacks()
+        decodes = []
+        decode = directus.utils.apiclient.decode
+        monkeypatch.setattr(
+            directus.utils.apiclient,
+            "decode",
+            lambda *args, **kwargs: decodes.append(args) or decode(*args, **kwargs),
+        )
+
+        client = self.make_client()
+        for _ in range(5):
+            client.get_item(collection="sports", id=1)
+
+        # Once for the issued token, once for the refreshed one
+        assert len(decodes) == 2
+        assert client.ApiClient.token == self.refreshed_token
+
+    @activate_responses
+    def test_single_flight_refresh(self):
+        self.add_callbacks()
+        client = self.make_client()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            items = list(
+                executor.map(
+                    lambda _: client.get_item(collection="sports", id=1), range(8)
+                )
+            )
+
+        assert items == [({"id": 1}, {})] * 8
+        assert self.refreshes == 1
+
+    @activate_responses
+    def test_background_refresh(self):
+        self.token = make_token(150)
+        self.add_callbacks()
+
+        with self.make_client(background_refresh=True, refresh_margin=100) as client:
+            for _ in range(100):
+                if client.ApiClient.token == self.refreshed_token:
+                    break
+                sleep(0.01)
+
+            assert self.refreshes == 1
+            client.get_item(collection="sports", id=1)
+
+        assert client.ApiClient._refresher is None
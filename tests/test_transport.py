@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+from pytest import raises
+from responses import GET, add
+from responses import activate as activate_responses
+
+from directus.directus import DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils import Transport
+
+
+class TestTransport:
+    def test_transport_pool_configuration(self):
+        transport = Transport(pool_connections=2, pool_maxsize=20, pool_block=True)
+        adapter = transport.session.get_adapter("http://test.local")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 20
+        assert adapter._pool_block is True
+
+    def test_closed_transport_refuses_requests(self):
+        transport = Transport()
+        transport.close()
+
+        with raises(DirectusException):
+            transport.request("GET", "http://test.local/_/collections")
+
+    @activate_responses
+    def test_shared_transport_is_left_open(self):
+        add(GET, "http://test.local/_/items/sports/1", json={"data": {"id": 1}})
+
+        with Transport() as transport:
+            with DirectusClient(
+                url="http://test.local", project="_", transport=transport
+            ) as client:
+                item, _ = client.get_item(collection="sports", id=1)
+
+            assert item == {"id": 1}
+            assert not transport.closed
+
+            other_client = DirectusClient(
+                url="http://test.local", project="_", transport=transport
+            )
+            other_item, _ = other_client.get_item(collection="sports", id=1)
+            assert other_item == {"id": 1}
+
+        assert transport.closed
+
+    def test_owned_transport_is_closed_with_client(self):
+        with DirectusClient(url="http://test.local", project="_") as client:
+            transport = client.ApiClient.transport
+
+        assert transport.closed
+
+    @activate_responses
+    def test_idle_connections_are_dropped(self):
+        add(GET, "http://test.local/_/items/sports/1", json={"data": {"id": 1}})
+
+        transport = Transport(keepalive_timeout=0)
+        adapter = transport.session.get_adapter("http://test.local")
+        adapter.poolmanager.connection_from_url("http://test.local")
+        transport._last_used -= 1
+
+        transport.request("GET", "http://test.local/_/items/sports/1")
+
+        assert len(adapter.poolmanager.pools) == 0
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import run
+from email.parser import BytesParser
+from io import BytesIO
+from json import dumps
+from threading import current_thread
+
+import httpx
+from responses import POST, add_callback
+from responses import activate as activate_responses
+
+from directus import AsyncDirectusClient, AsyncTransport, DirectusClient
+from directus.utils.multipart import MultipartBody
+
+CONTENT = bytes(range(256)) * 40
+
+
+def parse_form(content_type, body):
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.get_payload()
+    }
+
+
+class TestUpload:
+    def setup_method(self):
+        self.requests = []
+        self.progress = []
+
+    def callback(self, request):
+        chunks = list(request.body)
+        self.requests.append((request.headers, chunks))
+        form = parse_form(request.headers["content-type"], b"".join(chunks))
+        assert form["data"].get_payload(decode=True) == CONTENT
+        data = {
+            "id": 1,
+            "filename_download": form["data"].get_filename(),
+            "type": form["data"].get_content_type(),
+            "title": form["title"].get_payload(),
+        }
+        return (200, {}, dumps({"data": data}))
+
+    def upload(self, file, **kwargs):
+        add_callback(POST, "http://test.local/_/files", callback=self.callback)
+        client = DirectusClient(url="http://test.local", project="_")
+
+        return client.upload_file(
+            file,
+            title="Logo",
+            chunk_size=1000,
+            progress=lambda sent, total: self.progress.append((sent, total)),
+            **kwargs,
+        )
+
+    @activate_responses
+    def test_upload_path(self, tmp_path):
+        path = tmp_path / "logo.png"
+        path.write_bytes(CONTENT)
+
+        file, _ = self.upload(path)
+
+        assert file == {
+            "id": 1,
+            "filename_download": "logo.png",
+            "type": "image/png",
+            "title": "Logo",
+        }
+        headers, chunks = self.requests[0]
+        assert int(headers["content-length"]) == sum(len(chunk) for chunk in chunks)
+        assert max(len(chunk) for chunk in chunks[1:-1]) == 1000
+        assert self.progress[-1] == (len(CONTENT), len(CONTENT))
+        assert len(self.progress) == 11
+
+    @activate_responses
+    def test_upload_file_object(self):
+        file, _ = self.upload(BytesIO(CONTENT), filename="logo.bin")
+
+        assert file["filename_download"] == "logo.bin"
+        assert file["type"] == "application/octet-stream"
+        assert self.progress[-1] == (len(CONTENT), len(CONTENT))
+
+    @activate_responses
+    def test_upload_iterable(self):
+        chunks = (CONTENT[start : start + 4096] for start in range(0, 10240, 4096))
+
+        file, _ = self.upload(chunks, filename="logo.gif")
+
+        headers, _ = self.requests[0]
+        assert "content-length" not in headers
+        assert headers["transfer-encoding"] == "chunked"
+        assert self.progress == [(4096, None), (8192, None), (10240, None)]
+
+    def test_multipart_body_is_streamed(self, tmp_path):
+        path = tmp_path / "logo.png"
+        path.write_bytes(CONTENT)
+
+        body = MultipartBody(fields={"title": "Logo"}, file=path, chunk_size=512)
+
+        # A body read from a path can be sent again, e.g. on a retry
+        assert b"".join(body) == b"".join(body)
+        assert body.len == len(b"".join(body))
+        assert max(len(chunk) for chunk in list(body)[1:-1]) == 512
+
+    def test_async_upload(self):
+        async def handler(request):
+            body = await request.aread()
+            form = parse_form(request.headers["content-type"], body)
+            assert int(request.headers["content-length"]) == len(body)
+            assert form["data"].get_payload(decode=True) == CONTENT
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        async def scenario():
+            transport = AsyncTransport(
+                client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with AsyncDirectusClient(
+                url="http://test.local", project="_", transport=transport
+            ) as client:
+                return await client.upload_file(BytesIO(CONTENT), chunk_size=1000)
+
+        assert run(scenario()) == ({"id": 1}, {})
+
+    def test_async_body_read_off_the_event_loop(self):
+        class File(BytesIO):
+            def read(self, size=-1):
+                threads.add(current_thread())
+                return super().read(size)
+
+        async def read_body():
+            body = MultipartBody(fields={}, file=File(CONTENT), chunk_size=1000)
+            return b"".join([chunk async for chunk in body])
+
+        threads = set()
+        body = run(read_body())
+
+        assert CONTENT in body
+        assert current_thread() not in threads
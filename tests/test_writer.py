@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+from json import loads
+from threading import Event, Thread
+from time import monotonic, sleep
+
+from pytest import raises
+from responses import DELETE, PATCH, POST, add, calls
+from responses import activate as activate_responses
+
+from directus import DirectusClient
+from directus.exceptions import DirectusException
+from directus.utils import BufferedWriter
+from directus.utils.bulk import BulkChunkResult, BulkResult
+
+URL = "http://test.local/_/items/sports"
+
+
+def recorder(sent):
+    def send(operation):
+        def bulk(collection, records):
+            sent.append((operation, collection, records))
+            return BulkResult(chunks=[BulkChunkResult(records=records, data=records)])
+
+        return bulk
+
+    return {operation: send(operation) for operation in ("create", "update", "delete")}
+
+
+class TestBufferedWriter:
+    def test_merge_and_drop(self):
+        sent = []
+        writer = BufferedWriter(**recorder(sent), flush_interval=None)
+
+        writer.create("sports", {"id": 10, "name": "padel"})
+        writer.update("sports", 10, {"players": 4})
+        writer.update("sports", 1, {"name": "tennis"})
+        writer.update("sports", 1, {"players": 2})
+        writer.update("sports", 2, {"name": "golf"})
+        writer.delete("sports", 2)
+        writer.delete("sports", 2)
+        writer.update("teams", 1, {"name": "A"})
+        writer.flush()
+
+        assert sent == [
+            ("create", "sports", [{"id": 10, "name": "padel", "players": 4}]),
+            ("update", "sports", [{"id": 1, "name": "tennis", "players": 2}]),
+            ("delete", "sports", [2]),
+            ("update", "teams", [{"id": 1, "name": "A"}]),
+        ]
+        assert (writer.stats.writes, writer.stats.merged, writer.stats.dropped) == (
+            8,
+            2,
+            1,
+        )
+        assert (writer.stats.sent, writer.stats.requests) == (4, 4)
+
+    def test_writes_after_a_delete_keep_their_order(self):
+        sent = []
+        writer = BufferedWriter(**recorder(sent), flush_interval=None)
+
+        writer.create("sports", {"id": 3, "name": "golf"})
+        writer.delete("sports", 5)
+        writer.create("sports", {"id": 5, "name": "padel"})
+        writer.update("sports", 5, {"players": 4})
+        writer.delete("sports", 6)
+        writer.update("sports", 6, {"name": "squash"})
+        writer.flush()
+
+        assert sent == [
+            ("create", "sports", [{"id": 3, "name": "golf"}]),
+            ("delete", "sports", [5]),
+            ("create", "sports", [{"id": 5, "name": "padel", "players": 4}]),
+            ("delete", "sports", [6]),
+            ("update", "sports", [{"name": "squash", "id": 6}]),
+        ]
+
+    def test_flush_by_size_in_writing_thread(self):
+        sent = []
+        writer = BufferedWriter(**recorder(sent), flush_size=3, flush_interval=None)
+
+        for id in (1, 2):
+            writer.update("sports", id, {"score": id})
+            # Merged updates do not count towards the flush size
+            writer.update("sports", id, {"score": id * 10})
+        assert sent == []
+
+        writer.update("sports", 3, {"score": 3})
+        writer.update("sports", 4, {"score": 4})
+        assert [len(records) for _, _, records in sent] == [3]
+        writer.close()
+        assert sent[-1] == ("update", "sports", [{"score": 4, "id": 4}])
+        with raises(DirectusException):
+            writer.update("sports", 1, {"score": 0})
+
+    def test_flush_by_time_in_background(self):
+        sent = []
+        with BufferedWriter(**recorder(sent), flush_interval=0.05) as writer:
+            writer.update("sports", 1, {"score": 1})
+            started = monotonic()
+            while not sent and monotonic() - started < 2:
+                sleep(0.01)
+
+            assert sent == [("update", "sports", [{"score": 1, "id": 1}])]
+            assert monotonic() - started >= 0.04
+
+    def test_backpressure(self):
+        sent, release = [], Event()
+        senders = recorder(sent)
+
+        def slow_update(collection, records):
+            release.wait()
+            return senders["update"](collection, records)
+
+        writer = BufferedWriter(
+            create=senders["create"],
+            update=slow_update,
+            delete=senders["delete"],
+            flush_size=2,
+            max_buffered=2,
+            flush_interval=10,
+        )
+        # The first two are being sent, the next two fill the buffer
+        for id in range(1, 5):
+            writer.update("sports", id, {"score": id})
+        blocked = Thread(target=writer.update, args=("sports", 5, {"score": 5}))
+        blocked.start()
+        sleep(0.05)
+
+        assert blocked.is_alive()
+        release.set()
+        blocked.join(timeout=2)
+        writer.close()
+        assert not blocked.is_alive()
+        assert sorted(record["id"] for _, _, records in sent for record in records) == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+
+class TestClientWriter:
+    @activate_responses
+    def test_bulk_requests_and_errors(self):
+        add(POST, URL, json={"data": [{"id": 3, "name": "golf"}]})
+        add(
+            PATCH,
+            URL,
+            status=500,
+            json={"error": {"code": 1, "message": "Internal error"}},
+        )
+        add(DELETE, f"{URL}/1,2", status=204)
+        failures = []
+        client = DirectusClient(url="http://test.local", project="_")
+
+        with client.writer(flush_interval=None, on_error=failures.append) as writer:
+            writer.create("sports", {"name": "golf"})
+            for score in range(10):
+                writer.update("sports", 4, {"score": score})
+            writer.delete("sports", 1)
+            writer.delete("sports", 2)
+
+        assert [call.request.method for call in calls] == ["POST", "PATCH", "DELETE"]
+        assert loads(calls[1].request.body) == [{"score": 9, "id": 4}]
+        assert len(failures) == 1
+        assert (failures[0].operation, failures[0].records) == (
+            "update",
+            [{"score": 9, "id": 4}],
+        )
+        assert isinstance(failures[0].error, DirectusException)